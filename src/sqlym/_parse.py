@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from sqlym.parser.twoway import ParsedSQL, TwoWaySQLParser
@@ -10,6 +11,16 @@ if TYPE_CHECKING:
     from sqlym.dialect import Dialect
 
 
+@lru_cache(maxsize=256)
+def _get_parser(sql: str, placeholder: str, dialect: Dialect | None) -> TwoWaySQLParser:
+    """SQL テンプレートごとのパーサーを取得する（キャッシュ付き）.
+
+    パーサーはパラメータに依存しない解析結果（行分割・トークン・インライン条件）を
+    インスタンスに保持するため、同じテンプレートの2回目以降は parse() の評価のみになる。
+    """
+    return TwoWaySQLParser(sql, placeholder=placeholder, dialect=dialect)
+
+
 def parse_sql(
     sql: str,
     params: dict[str, Any],
@@ -32,5 +43,4 @@ def parse_sql(
         ValueError: dialect と placeholder (デフォルト以外) を同時に指定した場合
 
     """
-    parser = TwoWaySQLParser(sql, placeholder=placeholder, dialect=dialect)
-    return parser.parse(params)
+    return _get_parser(sql, placeholder, dialect).parse(params)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
 
 
@@ -17,6 +18,11 @@ class Dialect(Enum):
     MYSQL = ("mysql", "%s")
     ORACLE = ("oracle", ":name")
 
+    # メンバーはシングルトンで等価判定も同一性によるため、ハッシュも同一性で求める。
+    # Enum 既定の __hash__ は Python 実装で名前をハッシュするため、方言をキーとする
+    # 辞書や lru_cache の参照ごとに Python 関数呼び出しが発生する
+    __hash__ = object.__hash__
+
     def __init__(self, dialect_id: str, placeholder_fmt: str) -> None:
         self._dialect_id = dialect_id
         self._placeholder_fmt = placeholder_fmt
@@ -42,7 +48,7 @@ class Dialect(Enum):
         Returns:
             エスケープ対象文字の frozenset
         """
-        return frozenset({"#", "%", "_"})
+        return _LIKE_ESCAPE_CHARS[self]
 
     @property
     def in_clause_limit(self) -> int | None:
@@ -53,11 +59,19 @@ class Dialect(Enum):
         Returns:
             上限値。None は無制限を意味する。
         """
-        match self:
-            case Dialect.ORACLE:
-                return 1000
-            case _:
-                return None
+        return _IN_CLAUSE_LIMIT[self]
+
+    @property
+    def in_chunk_size(self) -> int:
+        """IN 句を分割する際の1チャンクあたりの要素数を返す.
+
+        in_clause_limit と異なり、上限なしの場合も ``sys.maxsize`` を返すため、
+        呼び出し側は None 判定なしに要素数と比較できる。
+
+        Returns:
+            1チャンクあたりの要素数
+        """
+        return _IN_CHUNK_SIZE[self]
 
     @property
     def backslash_is_escape(self) -> bool:
@@ -65,11 +79,7 @@ class Dialect(Enum):
 
         MySQL と PostgreSQL ではデフォルトで True。
         """
-        match self:
-            case Dialect.MYSQL | Dialect.POSTGRESQL:
-                return True
-            case _:
-                return False
+        return _BACKSLASH_IS_ESCAPE[self]
 
     @property
     def like_escape_char(self) -> str:
@@ -78,4 +88,55 @@ class Dialect(Enum):
         Returns:
             エスケープ文字（デフォルト: ``#``）
         """
-        return "#"
+        return _LIKE_ESCAPE_CHAR[self]
+
+    def escape_like(self, value: str, *, escape_char: str | None = None) -> str:
+        """この方言のルールで LIKE 句の値をエスケープする.
+
+        ``escape_like(value, dialect)`` と同じ結果を返す。
+
+        Args:
+            value: エスケープ対象の文字列
+            escape_char: エスケープ文字（省略時は like_escape_char を使用）
+
+        Returns:
+            エスケープ処理された文字列
+
+        Examples:
+            >>> Dialect.SQLITE.escape_like("10%off")
+            '10#%off'
+
+        """
+        return _escape_like(value, self, escape_char=escape_char)
+
+
+# 方言固有プロパティ（アクセスごとの生成を避けるためメンバーごとに事前計算）
+_DEFAULT_LIKE_ESCAPE_CHARS: frozenset[str] = frozenset({"#", "%", "_"})
+
+_LIKE_ESCAPE_CHARS: dict[Dialect, frozenset[str]] = dict.fromkeys(
+    Dialect, _DEFAULT_LIKE_ESCAPE_CHARS
+)
+
+_IN_CLAUSE_LIMIT: dict[Dialect, int | None] = {
+    Dialect.SQLITE: None,
+    Dialect.POSTGRESQL: None,
+    Dialect.MYSQL: None,
+    Dialect.ORACLE: 1000,
+}
+
+_IN_CHUNK_SIZE: dict[Dialect, int] = {
+    dialect: limit if limit is not None else sys.maxsize
+    for dialect, limit in _IN_CLAUSE_LIMIT.items()
+}
+
+_BACKSLASH_IS_ESCAPE: dict[Dialect, bool] = {
+    Dialect.SQLITE: False,
+    Dialect.POSTGRESQL: True,
+    Dialect.MYSQL: True,
+    Dialect.ORACLE: False,
+}
+
+_LIKE_ESCAPE_CHAR: dict[Dialect, str] = dict.fromkeys(Dialect, "#")
+
+# escape_utils は Dialect を型チェック時にのみ参照するため、ここで読み込んでも循環しない
+from sqlym.escape_utils import escape_like as _escape_like  # ruff: ignore[module-import-not-at-top-of-file]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -39,10 +40,14 @@ def escape_like(value: str, dialect: Dialect, *, escape_char: str | None = None)
 
     """
     esc = escape_char if escape_char is not None else dialect.like_escape_char
-    escape_chars = dialect.like_escape_chars
-    result: list[str] = []
-    for ch in value:
-        if ch in escape_chars:
-            result.append(esc)
-        result.append(ch)
-    return "".join(result)
+    return value.translate(_like_translation_table(dialect, esc))
+
+
+@lru_cache(maxsize=64)
+def _like_translation_table(dialect: Dialect, escape_char: str) -> dict[int, str]:
+    """LIKE エスケープ用の str.translate テーブルを生成する（キャッシュ付き）.
+
+    エスケープ文字自体もエスケープ対象に含める。
+    """
+    chars = dialect.like_escape_chars | {escape_char}
+    return str.maketrans({ch: escape_char + ch for ch in chars})
@@ -2,20 +2,136 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import os
+import stat
+import sys
+from pathlib import Path, PurePosixPath
 
+from sqlym.dialect import Dialect
 from sqlym.exceptions import SqlFileNotFoundError
 
-if TYPE_CHECKING:
-    from sqlym.dialect import Dialect
+# Dialect ごとのファイル名サフィックス（``find.sql`` → ``find.oracle.sql`` の ``.oracle``）
+_DIALECT_SUFFIXES: dict[Dialect, str] = {dialect: f".{dialect._dialect_id}" for dialect in Dialect}
+
+
+# 読み込み結果のキャッシュの上限（超えたらまとめて破棄する）
+_CACHE_MAXSIZE = 512
+
+# for_path() で共有するローダーの上限（超えたらまとめて破棄する）
+_SHARED_LOADERS_MAXSIZE = 32
+
+# Windows でも改行を変換せずにバイト列のまま読み込む
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _read_text(path: Path) -> tuple[str, int, int] | None:
+    """ファイルを UTF-8 で読み込む（通常ファイルとして開けない場合は None）.
+
+    Path.is_file() + Path.read_text() の代わりに os.open/os.read を直接使い、
+    存在確認の stat とテキストラッパーの生成を省く。改行コードは read_text と同様に
+    LF に統一する。
+
+    Returns:
+        (内容, 更新日時 (ns), サイズ)。更新日時とサイズはキャッシュの鮮度確認に使う
+
+    """
+    try:
+        fd = os.open(path, _OPEN_FLAGS)
+    except OSError:
+        return None
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        data = os.read(fd, st.st_size)
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # 内容が同じファイル（方言間で共通の SQL など）は同一の文字列オブジェクトを共有する
+    return sys.intern(text), st.st_mtime_ns, st.st_size
 
 
 class SqlLoader:
     """SQL ファイルの読み込み."""
 
-    def __init__(self, base_path: str | Path = "sql") -> None:
+    def __init__(
+        self, base_path: str | Path = "sql", *, cache: bool = True, index: bool = False
+    ) -> None:
+        """初期化.
+
+        Args:
+            base_path: SQL ファイルのベースディレクトリ
+            cache: True の場合、(path, dialect) ごとに読み込み結果をキャッシュする。
+                読み込んだファイルの更新日時・サイズが変わると読み込み直す。
+                見つからなかった結果はキャッシュしない。読み込み済みのパスより優先される
+                方言固有ファイルを後から追加した場合は refresh() を呼ぶまで反映されない
+            index: True の場合、初期化時に base_path 配下のファイル一覧を作成し、
+                一覧にないファイルはファイルシステムに問い合わせずに候補から外す。
+                後から追加したファイルは refresh() を呼ぶまで見つからない
+
+        """
         self.base_path = Path(base_path)
+        # 解決済みのベースパス（load ごとの realpath 呼び出しを省く）。
+        # まだ存在しない相対パスは作業ディレクトリに依存するため load ごとに解決する
+        self._resolved_base: Path | None = (
+            self.base_path.resolve()
+            if self.base_path.is_absolute() or self.base_path.exists()
+            else None
+        )
+        # (path, dialect) → (解決済みパス, 更新日時 (ns), サイズ, 内容)
+        self._cache: dict[tuple[str, Dialect | None], tuple[Path, int, int, str]] | None = (
+            {} if cache else None
+        )
+        self._index: frozenset[str] | None = self._build_index() if index else None
+
+    @classmethod
+    def for_path(cls, base_path: str | Path, *, cache: bool = True) -> SqlLoader:
+        """base_path ごとに共有される SqlLoader を取得する.
+
+        同じディレクトリ（解決済みパスで比較）を指す複数の Sqlym で読み込み結果の
+        キャッシュを共有する。共有されるのは読み込み済みの SQL 文字列のみで、
+        複数スレッドから使用できる。まだ存在しない相対パスは作業ディレクトリによって
+        指す先が変わるため共有せず、呼び出しごとに新しい SqlLoader を返す。
+
+        Args:
+            base_path: SQL ファイルのベースディレクトリ
+            cache: 読み込み結果をキャッシュするか（SqlLoader の cache 引数）
+
+        """
+        key = (str(Path(base_path).resolve()), cache)
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            loader = cls(base_path, cache=cache)
+            if loader._resolved_base is None:
+                return loader
+            if len(_shared_loaders) >= _SHARED_LOADERS_MAXSIZE:
+                _shared_loaders.clear()
+            loader = _shared_loaders.setdefault(key, loader)
+        return loader
+
+    def cache_clear(self) -> None:
+        """読み込み結果のキャッシュを破棄する."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def refresh(self) -> None:
+        """ファイル一覧（index=True の場合）と読み込み結果のキャッシュを作り直す."""
+        if self._index is not None:
+            self._index = self._build_index()
+        self.cache_clear()
+
+    def _build_index(self) -> frozenset[str]:
+        """base_path 配下のファイルの相対パス（``/`` 区切り）一覧を作成する."""
+        base_path = self.base_path
+        return frozenset(
+            PurePosixPath(Path(dirpath).relative_to(base_path), filename).as_posix()
+            for dirpath, _, filenames in os.walk(base_path)
+            for filename in filenames
+        )
 
     def load(self, path: str, *, dialect: Dialect | None = None) -> str:
         """SQL ファイルを読み込む.
@@ -39,34 +155,96 @@ class SqlLoader:
             >>> sql = loader.load("find.sql", dialect=Dialect.ORACLE)
 
         """
-        base_path = self.base_path.resolve()
-
-        if dialect is not None:
-            dialect_path = self._dialect_specific_path(path, dialect._dialect_id)
-            dialect_file_path = (base_path / dialect_path).resolve()
-            if self._is_valid_path(base_path, dialect_file_path):
-                return dialect_file_path.read_text(encoding="utf-8")
-
-        file_path = (base_path / path).resolve()
-        if not self._is_valid_path(base_path, file_path):
+        cache = self._cache
+        key = (path, dialect)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                file_path, mtime_ns, size, text = cached
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    pass
+                else:
+                    if st.st_mtime_ns == mtime_ns and st.st_size == size:
+                        return text
+        entry = self._resolve_and_read(path, dialect)
+        if entry is None:
+            if cache is not None:
+                cache.pop(key, None)
+            file_path = (self._get_resolved_base() / path).resolve()
             msg = f"SQL file not found: {file_path}"
             raise SqlFileNotFoundError(msg)
-        return file_path.read_text(encoding="utf-8")
+        if cache is not None:
+            if len(cache) >= _CACHE_MAXSIZE:
+                # 上限に達したらまとめて捨てる（複数スレッドから同時に呼ばれても安全な操作に限る）
+                cache.clear()
+            cache[key] = entry
+        return entry[3]
+
+    def _get_resolved_base(self) -> Path:
+        """解決済みのベースパスを返す."""
+        resolved = self._resolved_base
+        return resolved if resolved is not None else self.base_path.resolve()
+
+    def _resolve_and_read(
+        self, path: str, dialect: Dialect | None
+    ) -> tuple[Path, int, int, str] | None:
+        """パスを解決してファイルを読み込む.
+
+        base_path 配下のチェックもここで行い、不正なパスや存在しないファイルは None を返す。
+
+        Returns:
+            (解決済みパス, 更新日時 (ns), サイズ, 内容)。見つからない場合は None
+
+        """
+        base_path = self._get_resolved_base()
+        index = self._index
+        for candidate in self._candidate_paths(path, dialect):
+            if index is not None and not self._may_exist(index, candidate):
+                continue
+            file_path = (base_path / candidate).resolve()
+            if self._is_under(base_path, file_path):
+                read = _read_text(file_path)
+                if read is not None:
+                    text, mtime_ns, size = read
+                    return file_path, mtime_ns, size, text
+        return None
+
+    @classmethod
+    def _candidate_paths(cls, path: str, dialect: Dialect | None) -> tuple[str, ...]:
+        """探索するファイルパスを優先順に返す（方言固有ファイル → 汎用ファイル）."""
+        if dialect is None:
+            return (path,)
+        return (cls._dialect_specific_path(path, _DIALECT_SUFFIXES[dialect]), path)
+
+    @staticmethod
+    def _may_exist(index: frozenset[str], path: str) -> bool:
+        """ファイル一覧から、パスが存在する可能性があるかを判定する.
+
+        ``..`` を含むパスは一覧では判定できないため、ファイルシステムでの確認に任せる。
+        """
+        relative = PurePosixPath(path)
+        return ".." in relative.parts or relative.as_posix() in index
 
     @staticmethod
-    def _is_valid_path(base_path: Path, file_path: Path) -> bool:
-        """ファイルパスが有効か（base_path 配下に存在するか）を判定する."""
-        if file_path != base_path and base_path not in file_path.parents:
-            return False
-        return file_path.is_file()
+    def _is_under(base_path: Path, file_path: Path) -> bool:
+        """ファイルパスが base_path 配下かを判定する（解決済みパスの文字列比較）."""
+        base = str(base_path)
+        target = str(file_path)
+        return target == base or target.startswith(base if base.endswith(os.sep) else base + os.sep)
 
     @staticmethod
-    def _dialect_specific_path(path: str, dialect_id: str) -> str:
+    def _dialect_specific_path(path: str, suffix: str) -> str:
         """Dialect 固有のファイルパスを生成する.
 
         ``find.sql`` → ``find.oracle.sql`` のように変換する。
         """
         if "." in path:
             base, ext = path.rsplit(".", 1)
-            return f"{base}.{dialect_id}.{ext}"
-        return f"{path}.{dialect_id}"
+            return f"{base}{suffix}.{ext}"
+        return f"{path}{suffix}"
+
+
+# for_path() で共有するローダー: (解決済みのベースパス, cache) → SqlLoader
+_shared_loaders: dict[tuple[str, bool], SqlLoader] = {}
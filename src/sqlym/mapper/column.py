@@ -33,8 +33,11 @@ def entity(
         msg = f"Invalid naming: {naming!r}. Must be one of {sorted(_VALID_NAMING)}"
         raise ValueError(msg)
 
+    # デコレート時点のマッピングを確定させる（呼び出し側での後からの変更を反映しない）
+    frozen_column_map = dict(column_map) if column_map else {}
+
     def decorator(cls: type) -> type:
-        cls.__column_map__ = column_map or {}  # type: ignore[attr-defined]
+        cls.__column_map__ = frozen_column_map  # type: ignore[attr-defined]
         cls.__column_naming__ = naming  # type: ignore[attr-defined]
         return cls
 
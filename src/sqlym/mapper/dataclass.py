@@ -9,6 +9,12 @@ from typing import Annotated, Any, ClassVar, get_args, get_origin, get_type_hint
 
 from sqlym.mapper.column import Column
 
+# 行に該当キーが存在しないことを表す番兵
+_MISSING = object()
+
+# camelCase の単語境界（先頭以外の大文字の直前）
+_CAMEL_BOUNDARY_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 class DataclassMapper:
     """Dataclass 用の自動マッパー."""
@@ -26,10 +32,16 @@ class DataclassMapper:
 
     @classmethod
     def _get_mapping(cls, entity_cls: type) -> dict[str, str]:
-        """フィールド名→カラム名のマッピングを取得（キャッシュ付き）."""
-        if entity_cls not in cls._mapping_cache:
-            cls._mapping_cache[entity_cls] = cls._build_mapping(entity_cls)
-        return cls._mapping_cache[entity_cls]
+        """フィールド名→カラム名のマッピングを取得（キャッシュ付き）.
+
+        fields() と get_type_hints() による型情報の走査は _build_mapping で
+        クラスごとに1回だけ行われ、以降はキャッシュから返す。
+        """
+        mapping = cls._mapping_cache.get(entity_cls)
+        if mapping is None:
+            mapping = cls._build_mapping(entity_cls)
+            cls._mapping_cache[entity_cls] = mapping
+        return mapping
 
     @classmethod
     def _build_mapping(cls, entity_cls: type) -> dict[str, str]:
@@ -78,23 +90,60 @@ class DataclassMapper:
     @staticmethod
     def _to_snake(name: str) -> str:
         """CamelCase → snake_case."""
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+        return _CAMEL_BOUNDARY_PATTERN.sub("_", name).lower()
 
     def map_row(self, row: dict[str, Any]) -> Any:
         """1行をエンティティに変換."""
         row_lower = {k.lower(): v for k, v in row.items()}
         kwargs: dict[str, Any] = {}
         for field_name, col_name in self._mapping.items():
-            if col_name in row:
-                kwargs[field_name] = row[col_name]
-            elif col_name.lower() in row_lower:
-                kwargs[field_name] = row_lower[col_name.lower()]
-            elif field_name in row:
-                kwargs[field_name] = row[field_name]
-            elif field_name.lower() in row_lower:
-                kwargs[field_name] = row_lower[field_name.lower()]
+            value = row.get(col_name, _MISSING)
+            if value is _MISSING:
+                value = row_lower.get(col_name.lower(), _MISSING)
+            if value is _MISSING:
+                value = row.get(field_name, _MISSING)
+            if value is _MISSING:
+                value = row_lower.get(field_name.lower(), _MISSING)
+            if value is not _MISSING:
+                kwargs[field_name] = value
         return self.entity_cls(**kwargs)
 
     def map_rows(self, rows: list[dict[str, Any]]) -> list[Any]:
-        """複数行をエンティティのリストに変換."""
-        return [self.map_row(row) for row in rows]
+        """複数行をエンティティのリストに変換.
+
+        先頭行のキー構成からフィールド→キーの対応を一度だけ解決し、
+        同じキー構成の行にはその対応をそのまま適用する。
+        キー構成が異なる行は map_row で個別に変換する。
+        """
+        if not rows:
+            return []
+        keys = tuple(rows[0])
+        plan = self._resolve_keys(keys)
+        entity_cls = self.entity_cls
+        map_row = self.map_row
+        return [
+            entity_cls(**{field_name: row[key] for field_name, key in plan})
+            if tuple(row) == keys
+            else map_row(row)
+            for row in rows
+        ]
+
+    def _resolve_keys(self, keys: tuple[str, ...]) -> list[tuple[str, str]]:
+        """行のキー構成に対する (フィールド名, 行のキー) の対応を解決する.
+
+        map_row と同じ優先順位（カラム名 → カラム名の大文字小文字無視 →
+        フィールド名 → フィールド名の大文字小文字無視）で解決する。
+        """
+        key_set = set(keys)
+        lower_keys = {k.lower(): k for k in keys}
+        plan: list[tuple[str, str]] = []
+        for field_name, col_name in self._mapping.items():
+            if col_name in key_set:
+                plan.append((field_name, col_name))
+            elif col_name.lower() in lower_keys:
+                plan.append((field_name, lower_keys[col_name.lower()]))
+            elif field_name in key_set:
+                plan.append((field_name, field_name))
+            elif field_name.lower() in lower_keys:
+                plan.append((field_name, lower_keys[field_name.lower()]))
+        return plan
@@ -6,7 +6,7 @@ from dataclasses import is_dataclass
 from typing import Any
 
 from sqlym.mapper.manual import ManualMapper
-from sqlym.mapper.protocol import RowMapper
+from sqlym.mapper.protocol import is_row_mapper
 
 
 def create_mapper(
@@ -28,7 +28,7 @@ def create_mapper(
 
     """
     if mapper is not None:
-        if isinstance(mapper, RowMapper):
+        if is_row_mapper(mapper):
             return mapper
         if callable(mapper):
             return ManualMapper(mapper)
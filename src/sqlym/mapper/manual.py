@@ -18,4 +18,4 @@ class ManualMapper:
 
     def map_rows(self, rows: list[dict[str, Any]]) -> list[Any]:
         """複数行をエンティティのリストに変換."""
-        return [self._func(row) for row in rows]
+        return list(map(self._func, rows))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
@@ -18,3 +19,41 @@ class RowMapper(Protocol[T]):
     def map_rows(self, rows: list[dict[str, Any]]) -> list[T]:
         """複数行をエンティティのリストに変換."""
         ...
+
+
+@lru_cache(maxsize=256)
+def _has_row_mapper_methods(cls: type) -> bool:
+    """クラスが map_row / map_rows を持つか判定する（クラスごとにキャッシュ）."""
+    return callable(getattr(cls, "map_row", None)) and callable(getattr(cls, "map_rows", None))
+
+
+@lru_cache(maxsize=256)
+def _may_have_row_mapper_attrs(cls: type) -> bool:
+    """クラスが map_row / map_rows を持ち得るか（__getattr__ による動的属性を含む）."""
+    return any(hasattr(cls, name) for name in ("map_row", "map_rows", "__getattr__"))
+
+
+def is_row_mapper(obj: Any) -> bool:
+    """オブジェクトが RowMapper プロトコルを満たすか判定する.
+
+    ``isinstance(obj, RowMapper)`` は呼び出しごとに属性を走査するため、
+    クラスがメソッドを持つ場合はクラス単位のキャッシュで判定する。
+    インスタンス属性としてメソッドを持つ場合などは isinstance にフォールバックする。
+    関数など、クラスにもインスタンス辞書にも該当する属性がないオブジェクトは
+    isinstance を呼ばずに False を返す。
+
+    Args:
+        obj: 判定対象のオブジェクト
+
+    Returns:
+        RowMapper プロトコルを満たす場合 True
+
+    """
+    cls = type(obj)
+    if _has_row_mapper_methods(cls):
+        return True
+    if not _may_have_row_mapper_attrs(cls):
+        instance_dict = getattr(obj, "__dict__", None)
+        if not instance_dict or "map_row" not in instance_dict or "map_rows" not in instance_dict:
+            return False
+    return isinstance(obj, RowMapper)
@@ -2,22 +2,126 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+# 行リストの一括検証関数をモデルクラス自身に保持する属性名
+# （検証関数はモデルクラスを参照するため、外部の辞書に保持するとクラスが解放されない）
+_LIST_VALIDATE_ATTR = "__sqlym_list_validate__"
+
 
 class PydanticMapper:
     """Pydantic BaseModel 用のマッパー."""
 
-    def __init__(self, entity_cls: type) -> None:
+    def __init__(self, entity_cls: type, *, trust_input: bool = False) -> None:
+        """初期化.
+
+        Args:
+            entity_cls: Pydantic BaseModel のサブクラス
+            trust_input: True の場合、検証・型変換を行わずに model_construct で生成する。
+                DB ドライバが既に型を変換済みで、行の内容を信頼できる場合に使用する
+
+        Raises:
+            TypeError: entity_cls が Pydantic BaseModel でない場合
+
+        """
         if not hasattr(entity_cls, "model_validate"):
             msg = f"{entity_cls} is not a Pydantic BaseModel"
             raise TypeError(msg)
         self.entity_cls = entity_cls
+        self.trust_input = trust_input
+        self._validate = self._get_validate(entity_cls)
+
+    @staticmethod
+    def _is_complete(entity_cls: type) -> bool:
+        """モデルのスキーマ構築が完了しているか."""
+        return bool(getattr(entity_cls, "__pydantic_complete__", False))
+
+    @staticmethod
+    def _uses_default_model_validate(entity_cls: type) -> bool:
+        """model_validate を上書きしていないモデルか."""
+        from pydantic import BaseModel
+
+        model_validate = getattr(entity_cls.model_validate, "__func__", None)  # type: ignore[attr-defined]
+        return model_validate is BaseModel.model_validate.__func__  # type: ignore[attr-defined]
+
+    @classmethod
+    def _can_bypass_model_validate(cls, entity_cls: type) -> bool:
+        """model_validate を経由せずに SchemaValidator で検証できるか.
+
+        スキーマ構築が完了しており、model_validate を上書きしていないモデルに限る
+        （上書きした model_validate の前処理を飛ばさない）。
+        """
+        return (
+            cls._is_complete(entity_cls)
+            and getattr(entity_cls, "__pydantic_validator__", None) is not None
+            and cls._uses_default_model_validate(entity_cls)
+        )
+
+    @classmethod
+    def _get_validate(cls, entity_cls: type) -> Callable[[Any], Any]:
+        """行の検証に使う関数を取得する.
+
+        SchemaValidator で検証できるモデルは validate_python を直接保持し、
+        行ごとの model_validate 呼び出しを省く。前方参照が未解決などで構築が
+        完了していないモデルや、model_validate を上書きしたモデルは model_validate を使用する。
+        """
+        if cls._can_bypass_model_validate(entity_cls):
+            return entity_cls.__pydantic_validator__.validate_python  # type: ignore[attr-defined,no-any-return]
+        return entity_cls.model_validate  # type: ignore[attr-defined]
+
+    @classmethod
+    def _get_list_validate(
+        cls, entity_cls: type
+    ) -> Callable[[list[dict[str, Any]]], list[Any]] | None:
+        """行リストを一括で検証する関数を取得（キャッシュ付き）.
+
+        TypeAdapter(list[Model]) の構築はモデルクラスごとに1回だけ行い、結果はモデルクラスの
+        属性に保持する（モデルクラスと一緒に解放される）。サブクラスが親の検証関数を
+        継承しないよう、クラス自身の __dict__ だけを参照する。
+        行ごとに model_validate を呼ぶ必要があるモデル（_can_bypass_model_validate）は None を返す。
+        """
+        validate = vars(entity_cls).get(_LIST_VALIDATE_ATTR)
+        if validate is None:
+            if not cls._can_bypass_model_validate(entity_cls):
+                return None
+            from pydantic import TypeAdapter
+
+            validate = TypeAdapter(list[entity_cls]).validate_python  # type: ignore[valid-type]
+            setattr(entity_cls, _LIST_VALIDATE_ATTR, validate)
+        return validate  # type: ignore[no-any-return]
 
     def map_row(self, row: dict[str, Any]) -> Any:
-        """1行をエンティティに変換."""
-        return self.entity_cls.model_validate(row)
+        """1行をエンティティに変換.
+
+        行のキーは書き換えずに渡し、alias の解決は pydantic-core に任せる。
+        Python 側でキーを alias → フィールド名に置き換えると行ごとに辞書を作り直すうえ、
+        populate_by_name を指定していないモデルでは検証に失敗する。
+        """
+        if self.trust_input:
+            return self.entity_cls.model_construct(**row)  # type: ignore[attr-defined]
+        return self._validate(row)
 
     def map_rows(self, rows: list[dict[str, Any]]) -> list[Any]:
-        """複数行をエンティティのリストに変換."""
-        return [self.map_row(row) for row in rows]
+        """複数行をエンティティのリストに変換.
+
+        行リスト全体を pydantic-core で一括検証し、行ごとの呼び出しを省く。
+        一括検証に失敗した場合は行ごとに検証し直し、map_row と同じく最初の不正な行の
+        ValidationError（タイトルはモデル名、loc に行番号を含まない）を送出する。
+        trust_input が True の場合は検証せずに model_construct で生成する。
+        """
+        if not rows:
+            return []
+        if self.trust_input:
+            construct = self.entity_cls.model_construct  # type: ignore[attr-defined]
+            return [construct(**row) for row in rows]
+        list_validate = self._get_list_validate(self.entity_cls)
+        if list_validate is not None:
+            try:
+                return list_validate(rows)
+            except ValueError:
+                # pydantic.ValidationError は ValueError のサブクラス。
+                # 全行分のエラーをまとめた list[Model] のエラーではなく、行単位のエラーを送出する
+                pass
+        validate = self._validate
+        return [validate(row) for row in rows]
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class LineUnit:
     """1行を表すユニット（Clione-SQL Rule 1）."""
 
@@ -30,11 +30,16 @@ class LineUnit:
     removed: bool = False
     """削除フラグ."""
 
-    def __repr__(self) -> str:
-        """デバッグ用の文字列表現."""
-        return f"LineUnit(line={self.line_number}, indent={self.indent}, removed={self.removed})"
-
     @property
     def is_empty(self) -> bool:
         """空行かどうか."""
-        return self.indent < 0 or not self.content.strip()
+        # strip() による文字列生成を避けるため isspace() で判定する
+        return self.indent < 0 or not self.content or self.content.isspace()
+
+    def add_child(self, child: LineUnit) -> None:
+        """子LineUnitを追加する."""
+        self.children.append(child)
+
+    def __repr__(self) -> str:
+        """デバッグ用の文字列表現."""
+        return f"LineUnit(line={self.line_number}, indent={self.indent}, removed={self.removed})"
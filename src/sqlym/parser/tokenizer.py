@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 # 修飾記号:
 #   $ - removable (negative時に行削除)
@@ -107,6 +111,13 @@ END_DIRECTIVE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# 上記4パターンを1回のマッチで判定するための結合パターン
+# group(1): IF / ELSEIF, group(2): 条件式, group(3): ELSE / END
+BLOCK_DIRECTIVE_PATTERN = re.compile(
+    r"^[ \t]*--[ \t]*%(?:(IF|ELSEIF)\s+(.+?)|(ELSE|END))\s*$",
+    re.IGNORECASE,
+)
+
 
 class DirectiveType(Enum):
     """ブロックディレクティブの種類."""
@@ -117,7 +128,7 @@ class DirectiveType(Enum):
     END = "END"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Directive:
     """ブロックディレクティブ."""
 
@@ -138,27 +149,21 @@ def parse_directive(line: str) -> Directive | None:
         Directive オブジェクト、またはディレクティブでない場合は None
 
     """
-    # %IF condition
-    m = IF_DIRECTIVE_PATTERN.match(line)
-    if m:
-        return Directive(type=DirectiveType.IF, condition=m.group(1))
+    # ディレクティブは必ず "%" を含むため、含まない行は正規表現を使わずに除外
+    if "%" not in line:
+        return None
 
-    # %ELSEIF condition
-    m = ELSEIF_DIRECTIVE_PATTERN.match(line)
-    if m:
-        return Directive(type=DirectiveType.ELSEIF, condition=m.group(1))
+    m = BLOCK_DIRECTIVE_PATTERN.match(line)
+    if not m:
+        return None
 
-    # %ELSE
-    m = ELSE_DIRECTIVE_PATTERN.match(line)
-    if m:
-        return Directive(type=DirectiveType.ELSE, condition=None)
+    # %IF condition / %ELSEIF condition
+    keyword = m.group(1)
+    if keyword is not None:
+        return Directive(type=DirectiveType[keyword.upper()], condition=m.group(2))
 
-    # %END
-    m = END_DIRECTIVE_PATTERN.match(line)
-    if m:
-        return Directive(type=DirectiveType.END, condition=None)
-
-    return None
+    # %ELSE / %END
+    return Directive(type=DirectiveType[m.group(3).upper()], condition=None)
 
 
 # インライン条件分岐パターン
@@ -178,8 +183,15 @@ INLINE_IF_PATTERN = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+# parse_inline_conditions の走査用パターン（行を切り出さず位置指定で検索する）
+INLINE_IF_START_PATTERN = re.compile(r"/\*\s*%if\s+", re.IGNORECASE)
+INLINE_BRANCH_PATTERN = re.compile(r"/\*\s*%(elseif|else|end)\b", re.IGNORECASE)
+
+# intern 対象とする分岐値の最大長
+_INTERN_MAX_LENGTH = 16
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InlineCondition:
     """インライン条件分岐トークン."""
 
@@ -208,18 +220,23 @@ def parse_inline_conditions(line: str) -> list[InlineCondition]:
         InlineCondition のリスト
 
     """
+    # "/*%if" を含まない行は走査不要（大文字小文字を区別しないため "%" で判定）
+    if "%" not in line:
+        return []
+
     results: list[InlineCondition] = []
 
     # 複数の %if...%end を検出するため、手動でパース
+    # 各検索は直前の読み取り位置から再開するため、行全体は左から右へ1回だけ走査される
     i = 0
     while i < len(line):
         # /*%if を探す
-        if_match = re.search(r"/\*\s*%if\s+", line[i:], re.IGNORECASE)
+        if_match = INLINE_IF_START_PATTERN.search(line, i)
         if not if_match:
             break
 
-        start = i + if_match.start()
-        pos = i + if_match.end()
+        start = if_match.start()
+        pos = if_match.end()
 
         # 条件を抽出（*/ まで）
         cond_end = line.find("*/", pos)
@@ -233,21 +250,17 @@ def parse_inline_conditions(line: str) -> list[InlineCondition]:
         # ブランチを順にパース
         while pos < len(line):
             # 次のディレクティブを探す
-            next_directive = re.search(
-                r"/\*\s*%(elseif|else|end)\b",
-                line[pos:],
-                re.IGNORECASE,
-            )
+            next_directive = INLINE_BRANCH_PATTERN.search(line, pos)
             if not next_directive:
                 # %end が見つからない
                 break
 
             # 現在のブランチ値を抽出
-            branch_value = line[pos : pos + next_directive.start()].strip()
+            branch_value = line[pos : next_directive.start()].strip()
             values.append(branch_value)
 
             directive_type = next_directive.group(1).lower()
-            pos = pos + next_directive.end()
+            pos = next_directive.end()
 
             if directive_type == "elseif":
                 # 条件を抽出
@@ -268,10 +281,13 @@ def parse_inline_conditions(line: str) -> list[InlineCondition]:
                 if close == -1:
                     break
                 end = close + 2
+                # 条件式と短い分岐値は SQL 全体で繰り返し現れるため intern して共有する
                 results.append(
                     InlineCondition(
-                        conditions=tuple(conditions),
-                        values=tuple(values),
+                        conditions=tuple(sys.intern(c) for c in conditions),
+                        values=tuple(
+                            sys.intern(v) if len(v) <= _INTERN_MAX_LENGTH else v for v in values
+                        ),
                         start=start,
                         end=end,
                     )
@@ -299,7 +315,7 @@ INCLUDE_PATTERN = re.compile(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncludeDirective:
     """インクルードディレクティブ."""
 
@@ -323,6 +339,15 @@ def parse_includes(line: str) -> list[IncludeDirective]:
         IncludeDirective のリスト
 
     """
+    # "%include" を含まない行は走査不要（大文字小文字を区別しないため "%" で判定）
+    if "%" not in line:
+        return []
+
+    # "%" が1つだけで小文字の %include を含む一般的な行は正規表現を使わずに解析する
+    if line.count("%") == 1 and "%include" in line:
+        include = _parse_single_include(line)
+        return [include] if include is not None else []
+
     results: list[IncludeDirective] = []
     for m in INCLUDE_PATTERN.finditer(line):
         # group(1) は /* */ 形式、group(2) は -- 形式
@@ -337,6 +362,59 @@ def parse_includes(line: str) -> list[IncludeDirective]:
     return results
 
 
+def _parse_single_include(line: str) -> IncludeDirective | None:
+    """%include を1つだけ含む行を文字列操作で解析する.
+
+    INCLUDE_PATTERN と同じ規則（直前の ``/*`` または ``--``、
+    空白、引用符で囲まれたパス、``/*`` 形式では閉じの ``*/``）で判定する。
+
+    Args:
+        line: "%include" を1つだけ含む SQL 行文字列
+
+    Returns:
+        IncludeDirective。形式に合致しない場合は None
+
+    """
+    keyword_pos = line.index("%include")
+    prefix = line[:keyword_pos].rstrip()
+    if prefix.endswith("/*"):
+        start = len(prefix) - 2
+        is_block = True
+    elif prefix.endswith("--"):
+        start = len(prefix) - 2
+        is_block = False
+    else:
+        return None
+
+    # %include の後ろには1文字以上の空白が必要
+    pos = keyword_pos + len("%include")
+    rest = line[pos:]
+    stripped = rest.lstrip()
+    if len(stripped) == len(rest) or stripped[:1] not in ("'", '"'):
+        return None
+    pos += len(rest) - len(stripped) + 1
+
+    # パスは引用符を含まない1文字以上、閉じ引用符は ' と " のどちらでもよい
+    close = len(line)
+    for quote in ("'", '"'):
+        found = line.find(quote, pos)
+        if found != -1 and found < close:
+            close = found
+    if close == len(line) or close == pos:
+        return None
+    path = line[pos:close]
+    end = close + 1
+
+    if is_block:
+        tail = line[end:]
+        stripped = tail.lstrip()
+        if not stripped.startswith("*/"):
+            return None
+        end += len(tail) - len(stripped) + 2
+
+    return IncludeDirective(path=path, start=start, end=end)
+
+
 # 比較演算子パターン（/* param */= 形式）
 # col /* param */= 'default' : 値に応じて =, IS NULL, IN に自動変換
 # col /* param */<> 'default' : 値に応じて <>, IS NOT NULL, NOT IN に自動変換
@@ -367,8 +445,25 @@ LIKE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# フォールバックコメント内の ?name 抽出パターン
+FALLBACK_NAME_PATTERN = re.compile(r"\?(\w+)")
+
+# IN 句の開き括弧直前判定パターン（"... IN" で終わるか）
+IN_KEYWORD_SUFFIX_PATTERN = re.compile(r"\bIN\s*$", re.IGNORECASE)
+
+# 修飾記号なしのパラメータのフラグ
+_NO_MODIFIERS: Mapping[str, bool] = MappingProxyType(
+    {
+        "removable": False,
+        "bindless": False,
+        "negated": False,
+        "required": False,
+        "fallback": False,
+    }
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     """パラメータトークン."""
 
@@ -424,23 +519,24 @@ class Token:
     """補助関数の引数リスト."""
 
 
-def _parse_modifiers(modifiers: str | None) -> dict[str, bool]:
-    """修飾記号文字列をパースしてフラグ辞書を返す."""
+@lru_cache(maxsize=64)
+def _parse_modifiers(modifiers: str | None) -> Mapping[str, bool]:
+    """修飾記号文字列をパースしてフラグ辞書を返す.
+
+    修飾記号の組み合わせは少数に限られるため結果をキャッシュし、
+    トークンごとの辞書生成を省く（戻り値は読み取り専用）。
+    """
     if not modifiers:
-        return {
-            "removable": False,
-            "bindless": False,
-            "negated": False,
-            "required": False,
-            "fallback": False,
+        return _NO_MODIFIERS
+    return MappingProxyType(
+        {
+            "removable": "$" in modifiers,
+            "bindless": "&" in modifiers,
+            "negated": "!" in modifiers,
+            "required": "@" in modifiers,
+            "fallback": "?" in modifiers,
         }
-    return {
-        "removable": "$" in modifiers,
-        "bindless": "&" in modifiers,
-        "negated": "!" in modifiers,
-        "required": "@" in modifiers,
-        "fallback": "?" in modifiers,
-    }
+    )
 
 
 def tokenize(line: str) -> list[Token]:
@@ -452,6 +548,9 @@ def tokenize(line: str) -> list[Token]:
     3. フォールバックパターン
     4. 通常パラメータパターン
 
+    パラメータ名は intern し、パラメータ辞書のキー（コード中のリテラルは intern 済み）
+    との照合を同一性判定で済ませる。
+
     Args:
         line: SQL行文字列
 
@@ -459,13 +558,26 @@ def tokenize(line: str) -> list[Token]:
         Token のリスト（出現順）
 
     """
+    # パラメータは全て /* */ コメント内に書かれるため、コメントのない行は走査不要
+    if "/*" not in line:
+        return []
+
     tokens: list[Token] = []
     used_ranges: list[tuple[int, int]] = []
+    # 各パターンに必須の文字を含まない行は、そのパターンの走査を省く
+    has_operator = "=" in line or "<>" in line
+    has_helper = "%" in line
+    has_fallback = "?" in line
+    # IN / LIKE は大文字小文字を区別しないため、大文字化した行で1回だけ判定する。
+    # 非 ASCII 文字を含む行は大文字化で対応が崩れる場合があるため常に走査する
+    upper = line.upper() if line.isascii() else None
+    has_in = upper is None or _has_in_before_comment(upper)
+    has_like = upper is None or "LIKE" in upper
 
     # IN句パターンを先にマッチ
-    for m in IN_PATTERN.finditer(line):
+    for m in IN_PATTERN.finditer(line) if has_in else ():
         modifiers = m.group(1)
-        name = m.group(2)
+        name = sys.intern(m.group(2))
         flags = _parse_modifiers(modifiers)
         tokens.append(
             Token(
@@ -484,11 +596,11 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # 比較演算子パターン（/* param */= 形式）
-    for m in OPERATOR_PATTERN.finditer(line):
+    for m in OPERATOR_PATTERN.finditer(line) if has_operator else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         modifiers = m.group(1)
-        name = m.group(2)
+        name = sys.intern(m.group(2))
         operator = m.group(3)  # =, <>, !=
         default = m.group(4)
         flags = _parse_modifiers(modifiers)
@@ -510,11 +622,11 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # LIKE パターン（/* param */LIKE 形式）
-    for m in LIKE_PATTERN.finditer(line):
+    for m in LIKE_PATTERN.finditer(line) if has_like else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         modifiers = m.group(1)
-        name = m.group(2)
+        name = sys.intern(m.group(2))
         not_prefix = m.group(3)  # "NOT " or None
         default = m.group(4)
         flags = _parse_modifiers(modifiers)
@@ -538,12 +650,12 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # %concat / %C パターン
-    for m in CONCAT_PATTERN.finditer(line):
+    for m in CONCAT_PATTERN.finditer(line) if has_helper else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         args_str = m.group(1)
         default = m.group(2)
-        args = _parse_helper_args(args_str)
+        args = [sys.intern(a) for a in _parse_helper_args(args_str)]
         # 最初のパラメータ名を抽出（識別子のみ、文字列リテラル以外）
         param_names = [a for a in args if not a.startswith("'") and not a.startswith('"')]
         name = param_names[0] if param_names else "_concat"
@@ -562,12 +674,12 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # %L パターン（LIKE エスケープ）
-    for m in LIKE_ESCAPE_PATTERN.finditer(line):
+    for m in LIKE_ESCAPE_PATTERN.finditer(line) if has_helper else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         args_str = m.group(1)
         default = m.group(2)
-        args = _parse_helper_args(args_str)
+        args = [sys.intern(a) for a in _parse_helper_args(args_str)]
         param_names = [a for a in args if not a.startswith("'") and not a.startswith('"')]
         name = param_names[0] if param_names else "_like_escape"
         tokens.append(
@@ -585,11 +697,11 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # %STR / %SQL パターン（直接埋め込み）
-    for m in STR_EMBED_PATTERN.finditer(line):
+    for m in STR_EMBED_PATTERN.finditer(line) if has_helper else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
-        func_name = m.group(1)  # STR or SQL
-        name = m.group(2)
+        func_name = sys.intern(m.group(1))  # STR or SQL（定数との比較を同一性判定で済ませる）
+        name = sys.intern(m.group(2))
         default = m.group(3)
         tokens.append(
             Token(
@@ -606,13 +718,13 @@ def tokenize(line: str) -> list[Token]:
         used_ranges.append((m.start(), m.end()))
 
     # フォールバックパターン（/* ?a ?b ?c */'default' 形式）
-    for m in FALLBACK_PATTERN.finditer(line):
+    for m in FALLBACK_PATTERN.finditer(line) if has_fallback else ():
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         params_str = m.group(1)  # "?a ?b ?c " のような文字列
         default = m.group(2)
         # ?name 形式のパラメータ名を抽出
-        names = tuple(re.findall(r"\?(\w+)", params_str))
+        names = tuple(sys.intern(n) for n in FALLBACK_NAME_PATTERN.findall(params_str))
         if names:
             tokens.append(
                 Token(
@@ -636,7 +748,7 @@ def tokenize(line: str) -> list[Token]:
         if _overlaps(m.start(), m.end(), used_ranges):
             continue
         modifiers = m.group(1)
-        name = m.group(2)
+        name = sys.intern(m.group(2))
         default = m.group(3) or ""
         flags = _parse_modifiers(modifiers)
         # IN 句内の部分パラメータか判定
@@ -680,39 +792,37 @@ def _parse_helper_args(args_str: str) -> list[str]:
 
     """
     args: list[str] = []
-    current = ""
+    # 現在の引数は args_str[arg_start:i]（1文字ずつ連結せず、区切りで切り出す）
+    arg_start = 0
     in_single = False
     in_double = False
     i = 0
+    length = len(args_str)
 
-    while i < len(args_str):
+    while i < length:
         ch = args_str[i]
 
         if ch == "'" and not in_double:
-            if in_single and i + 1 < len(args_str) and args_str[i + 1] == "'":
+            if in_single and i + 1 < length and args_str[i + 1] == "'":
                 # エスケープされた引用符
-                current += "''"
                 i += 2
                 continue
             in_single = not in_single
-            current += ch
         elif ch == '"' and not in_single:
-            if in_double and i + 1 < len(args_str) and args_str[i + 1] == '"':
-                current += '""'
+            if in_double and i + 1 < length and args_str[i + 1] == '"':
                 i += 2
                 continue
             in_double = not in_double
-            current += ch
         elif (ch == "," or ch.isspace()) and not in_single and not in_double:
-            if current.strip():
-                args.append(current.strip())
-            current = ""
-        else:
-            current += ch
+            arg = args_str[arg_start:i].strip()
+            if arg:
+                args.append(arg)
+            arg_start = i + 1
         i += 1
 
-    if current.strip():
-        args.append(current.strip())
+    arg = args_str[arg_start:].strip()
+    if arg:
+        args.append(arg)
 
     return args
 
@@ -733,38 +843,64 @@ def _is_inside_in_clause(line: str, start: int, end: int) -> bool:
         IN 句内の部分パラメータなら True
 
     """
-    prefix = line[:start]
-
-    # prefix の末尾から開き括弧を探す（括弧のネストを考慮）
-    # IN ( の後にいるかどうかを判定
+    # start より前を末尾から見て、対応の取れていない開き括弧を探す（括弧のネストを考慮）。
+    # 1文字ずつ走査せず、str.rfind で次の括弧位置まで読み飛ばす
     paren_depth = 0
     in_found = False
-    i = len(prefix) - 1
+    i = start
 
-    while i >= 0:
-        ch = prefix[i]
-        if ch == ")":
+    while True:
+        open_pos = line.rfind("(", 0, i)
+        if open_pos < 0:
+            break
+        close_pos = line.rfind(")", open_pos + 1, i)
+        if close_pos >= 0:
             paren_depth += 1
-        elif ch == "(":
-            if paren_depth > 0:
-                paren_depth -= 1
-            else:
-                # 対応する開き括弧を見つけた
-                # この前に IN があるか確認
-                before_paren = prefix[:i].rstrip()
-                if re.search(r"\bIN\s*$", before_paren, re.IGNORECASE):
-                    in_found = True
-                break
-        i -= 1
+            i = close_pos
+        elif paren_depth > 0:
+            paren_depth -= 1
+            i = open_pos
+        else:
+            # 対応する開き括弧を見つけた
+            # この前に IN があるか確認
+            before_paren = line[:open_pos].rstrip()
+            if _ends_with_in_keyword(before_paren):
+                in_found = True
+            break
 
     if not in_found:
         return False
 
     # パラメータの後に ) があるか確認（カンマ区切りの値があっても可）
-    suffix = line[end:]
     # 閉じ括弧まで到達できるか
-    close_match = re.search(r"\)", suffix)
-    return close_match is not None
+    return line.find(")", end) != -1
+
+
+def _ends_with_in_keyword(text: str) -> bool:
+    """文字列が IN キーワードで終わるか判定する（IN_KEYWORD_SUFFIX_PATTERN と同じ判定）.
+
+    ASCII のみの文字列は正規表現を使わず末尾2文字の比較で判定する。
+    """
+    if not text.isascii():
+        return IN_KEYWORD_SUFFIX_PATTERN.search(text) is not None
+    stripped = text.rstrip()
+    if stripped[-2:].upper() != "IN":
+        return False
+    return len(stripped) == 2 or not (stripped[-3].isalnum() or stripped[-3] == "_")
+
+
+def _has_in_before_comment(upper: str) -> bool:
+    """IN の直後（空白のみ挟む）にコメントが始まる箇所があるか判定する.
+
+    IN_PATTERN の走査前の絞り込みに使う。INSERT や JOIN などの "IN" を含むだけの行では
+    正規表現を走査しない。upper は大文字化済みの ASCII 文字列。
+    """
+    pos = upper.find("/*")
+    while pos != -1:
+        if upper[:pos].rstrip().endswith("IN"):
+            return True
+        pos = upper.find("/*", pos + 2)
+    return False
 
 
 def _extract_in_default(matched: str) -> str:
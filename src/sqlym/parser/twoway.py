@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import re
+import stat
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from sqlym import config
+from sqlym.dialect import Dialect
+from sqlym.escape_utils import escape_like
 from sqlym.exceptions import SqlFileNotFoundError, SqlParseError
 from sqlym.parser.line_unit import LineUnit
 from sqlym.parser.tokenizer import (
@@ -19,7 +25,7 @@ from sqlym.parser.tokenizer import (
 )
 
 if TYPE_CHECKING:
-    from sqlym.dialect import Dialect
+    from sqlym.parser.tokenizer import InlineCondition, Token
 
 
 def is_negative(value: Any) -> bool:
@@ -50,9 +56,374 @@ def is_negative(value: Any) -> bool:
     return False
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _split_helper_args(args: tuple[str, ...]) -> tuple[tuple[str | None, str | None], ...]:
+    """補助関数の引数を (リテラル値, パラメータ名) の組に分類する（キャッシュ付き）.
+
+    文字列リテラルは引用符を外してエスケープを解除した値を、
+    それ以外はパラメータ名を設定する。いずれか一方のみが None 以外となる。
+
+    Args:
+        args: Token.helper_args
+
+    Returns:
+        (リテラル値, パラメータ名) のタプル
+
+    """
+    result: list[tuple[str | None, str | None]] = []
+    for arg in args:
+        if arg.startswith("'") and arg.endswith("'"):
+            result.append((arg[1:-1].replace("''", "'"), None))
+        elif arg.startswith('"') and arg.endswith('"'):
+            result.append((arg[1:-1].replace('""', '"'), None))
+        else:
+            result.append((None, arg))
+    return tuple(result)
+
+
+@lru_cache(maxsize=256)
+def _compile_lines(sql: str) -> tuple[LineUnit, ...]:
+    """SQL を行単位に分割したテンプレートを返す（SQL 文字列ごとにキャッシュ）.
+
+    返り値の LineUnit は全パーサーで共有されるため変更してはならない。
+    使用時は _clone_units で複製する。
+
+    Args:
+        sql: パース対象の SQL 文字列
+
+    Returns:
+        LineUnit テンプレートのタプル
+
+    """
+    return tuple(TwoWaySQLParser._split_lines(sql))
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_line(line: str) -> list[Token]:
+    """行をトークン化する（行文字列ごとにキャッシュし、全パーサーで共有）.
+
+    返り値のリストは共有されるため変更してはならない。
+
+    Args:
+        line: SQL行文字列
+
+    Returns:
+        Token のリスト（出現順）
+
+    """
+    return tokenize(line)
+
+
+@lru_cache(maxsize=4096)
+def _parse_line_inline_conditions(line: str) -> list[InlineCondition]:
+    """行のインライン条件分岐をパースする（行文字列ごとにキャッシュし、全パーサーで共有）.
+
+    返り値のリストは共有されるため変更してはならない。
+
+    Args:
+        line: SQL行文字列
+
+    Returns:
+        InlineCondition のリスト
+
+    """
+    return parse_inline_conditions(line)
+
+
+# 行単独で現れる集合演算子（空白は1つに正規化した大文字表記）
+_SET_OPERATORS = frozenset({"UNION", "UNION ALL", "EXCEPT", "INTERSECT"})
+
+# 条件を持つ句のキーワード（条件がすべて削除された場合は句ごと除去する）
+_CONDITION_CLAUSES = ("WHERE", "HAVING")
+
+# 値をバインドせず直接埋め込む補助関数
+_EMBED_HELPERS = frozenset({"STR", "SQL"})
+
+# 子がすべて削除されても残す行（CTE 内の SELECT 行を保護）
+_PROTECTED_LINE_PATTERN = re.compile(r"^(?:SELECT|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+# 行末の列名（LIKE 展開で列式を抽出できない場合のフォールバック）
+_TRAILING_COLUMN_PATTERN = re.compile(r"(\w+(?:\.\w+)?)\s*$")
+
+# SQL 末尾の条件のない孤立 WHERE/HAVING
+_TRAILING_EMPTY_CLAUSE_PATTERN = re.compile(
+    r"\n?[ \t]*\b(?:WHERE|HAVING)\b[ \t]*(?:\n[ \t]*)*$",
+    re.IGNORECASE,
+)
+
+# 直後に別の SQL 句が続く条件のない WHERE/HAVING
+_EMPTY_CLAUSE_BEFORE_NEXT_PATTERN = re.compile(
+    r"[ \t]*\b(?:WHERE|HAVING)\b[ \t]*\n"
+    r"(?=[ \t]*\b(?:ORDER|GROUP|LIMIT|UNION|EXCEPT|INTERSECT|FETCH|OFFSET|FOR)\b)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def _clean_sql_text(sql: str) -> str:
+    """再構築後の SQL から不要な句・区切りを除去する（SQL 文字列ごとにキャッシュ）.
+
+    再構築後の SQL はバインド値ではなくプレースホルダを含むため、同じテンプレートでは
+    削除される行の組み合わせごとに同じ文字列になり、キャッシュがよく当たる。
+
+    Args:
+        sql: 再構築後の SQL 文字列
+
+    Returns:
+        整形後の SQL 文字列
+
+    """
+    return TwoWaySQLParser._clean(sql)
+
+
+# 条件式を評価する述語: パラメータ辞書 → 真偽値
+_Predicate = Callable[[dict[str, Any]], bool]
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> _Predicate:
+    """条件式を述語に変換する（条件式文字列ごとにキャッシュ）.
+
+    式の構文解析は初回のみ行い、以降はパラメータの参照だけで評価する。
+
+    Args:
+        condition: 条件式文字列
+
+    Returns:
+        パラメータ辞書を受け取り条件の真偽を返す関数
+
+    """
+    return TwoWaySQLParser._compile_or_expr(condition.strip())
+
+
+# インクルードファイルの内容キャッシュ: 解決済みパス → (mtime_ns, size, 内容)
+_include_cache: dict[Path, tuple[int, int, str]] = {}
+
+# インクルードファイルキャッシュの上限（超えたらまとめて破棄する）
+_INCLUDE_CACHE_MAXSIZE = 512
+
+
+def _read_include_file(path: Path) -> str | None:
+    """インクルードファイルを読み込む（更新日時とサイズが同じ間はキャッシュを返す）.
+
+    Args:
+        path: 解決済みのファイルパス
+
+    Returns:
+        ファイル内容。通常ファイルとして存在しない場合は None
+
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    cached = _include_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    text = path.read_text(encoding="utf-8")
+    if len(_include_cache) >= _INCLUDE_CACHE_MAXSIZE:
+        _include_cache.clear()
+    _include_cache[path] = (st.st_mtime_ns, st.st_size, text)
+    return text
+
+
+@lru_cache(maxsize=256)
+def _join_placeholders(placeholder: str, count: int) -> str:
+    """プレースホルダを count 個カンマ区切りで連結する（count は1以上）.
+
+    リストを作らず文字列の繰り返しで組み立てる。IN 句の要素数は少数の値に
+    偏るため、(プレースホルダ, 個数) ごとに結果をキャッシュして parse() ごとの
+    文字列生成を省く。
+    """
+    return placeholder + (", " + placeholder) * (count - 1)
+
+
+def _join_named_placeholders(keys: Iterable[str]) -> str:
+    """パラメータ名を :name 形式でカンマ区切りに連結する（keys は1件以上）."""
+    return ":" + ", :".join(keys)
+
+
+@lru_cache(maxsize=256)
+def _indexed_names(name: str, count: int) -> tuple[str, ...]:
+    """リスト展開用のパラメータ名 name_0, name_1, ... を生成する.
+
+    (パラメータ名, 要素数) ごとにキャッシュし、parse() ごとの f-string 生成を省く。
+    """
+    return tuple([f"{name}_{i}" for i in range(count)])
+
+
+@lru_cache(maxsize=256)
+def _join_indexed_placeholders(name: str, count: int) -> str:
+    """name_0 から count 個の :name_i 形式のプレースホルダを連結する（count は1以上）."""
+    return _join_named_placeholders(_indexed_names(name, count))
+
+
+# parse() の結果をメモ化できるパラメータ値の型。
+# 等しい値なら SQL・バインド値とも区別できない型に限る（1 == True のため型もキーに含める）
+_MEMO_VALUE_TYPES = frozenset({str, int, bool, type(None)})
+_MEMO_KEY_TYPES = _MEMO_VALUE_TYPES | {list}
+
+# メモ化するリスト値の要素数上限（大きなリストはキーの作成・保持コストが見合わない）
+_MEMO_MAX_LIST_LENGTH = 64
+
+# メモ化する文字列値の長さ上限（長い文字列・%STR の値などをキャッシュに保持し続けない）
+_MEMO_MAX_STR_LENGTH = 256
+
+# パーサーごとに保持する parse() 結果の件数上限
+_MEMO_MAXSIZE = 256
+
+
+def _memo_key(params: dict[str, Any]) -> tuple[Any, ...] | None:
+    """parse() 結果のメモ化キーを作成する（メモ化できない値を含む場合は None）."""
+    types = tuple(map(type, params.values()))
+    if _MEMO_VALUE_TYPES.issuperset(types):
+        # リストを含まない場合はループせずに作成する
+        return (tuple(params.items()), types)
+    if not _MEMO_KEY_TYPES.issuperset(types):
+        return None
+    values: list[Any] = []
+    for value, value_type in zip(params.values(), types):
+        if value_type is list:
+            element_types = tuple(map(type, value))
+            if len(element_types) > _MEMO_MAX_LIST_LENGTH or not _MEMO_VALUE_TYPES.issuperset(
+                element_types
+            ):
+                return None
+            values.append((tuple(value), element_types))
+        else:
+            values.append(value)
+    return (tuple(params), types, tuple(values))
+
+
+def _has_long_str(params: dict[str, Any]) -> bool:
+    """メモ化の長さ上限を超える文字列（リストの要素を含む）を含むか.
+
+    長い文字列を含む結果は保存しないため、メモ化キーの作成時ではなく保存時にのみ判定する
+    （保存されないキーはメモにヒットしない）。
+    """
+    for value in params.values():
+        value_type = type(value)
+        if value_type is str:
+            if len(value) > _MEMO_MAX_STR_LENGTH:
+                return True
+        elif value_type is list:
+            for element in value:
+                if type(element) is str and len(element) > _MEMO_MAX_STR_LENGTH:
+                    return True
+    return False
+
+
+def _clone_units(templates: tuple[LineUnit, ...]) -> list[LineUnit]:
+    """テンプレートから親子関係・削除フラグを持たない LineUnit リストを作成する."""
+    # parse() ごとに全行分呼ばれるため、キーワード引数より高速な位置引数で生成する
+    # (line_number, original, indent, content の順)
+    return [LineUnit(u.line_number, u.original, u.indent, u.content) for u in templates]
+
+
+def _link_units(units: list[LineUnit], parent_indices: tuple[int, ...]) -> None:
+    """事前に求めた親の位置（親なしは -1）から _build_tree と同じ親子関係を設定する."""
+    for unit, parent_index in zip(units, parent_indices):
+        if parent_index >= 0:
+            parent = units[parent_index]
+            unit.parent = parent
+            parent.add_child(unit)
+
+
+def _select_removal_tokens(tokens: list[Token]) -> tuple[Token, ...]:
+    """行の削除・例外に関わる修飾子（$ & @ ?）を持つトークンのみを返す."""
+    return tuple(
+        token
+        for token in tokens
+        if token.removable or token.bindless or token.required or token.fallback
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTemplate:
+    """SQL テンプレートのパラメータに依存しない解析結果（全パーサーで共有）."""
+
+    units: tuple[LineUnit, ...]
+    """行分割の結果（変更不可。使用時は _clone_units で複製する）."""
+
+    has_comments: bool
+    """/* */ コメント（パラメータ・インライン条件分岐）を含むか."""
+
+    has_removal_tokens: bool
+    """行の削除・例外に関わる修飾子（$ & @ ?）付きのパラメータを含むか."""
+
+    has_block_directives: bool
+    """ブロックディレクティブを含むか."""
+
+    parent_indices: tuple[int, ...]
+    """ブロックディレクティブがない場合の各行の親の位置（親なしは -1）."""
+
+    static_sql: str | None
+    """パラメータ・条件分岐を含まない SQL の整形結果（含む場合は None）."""
+
+
+@lru_cache(maxsize=256)
+def _compile_template(sql: str) -> _CompiledTemplate:
+    """SQL テンプレートを解析する（%include 展開後の SQL 文字列ごとにキャッシュ）.
+
+    同じ SQL で生成した別のパーサーでも、行分割・修飾子の有無の判定・親子関係の構築を
+    繰り返さない。
+
+    Args:
+        sql: %include 展開後の SQL 文字列
+
+    Returns:
+        解析結果
+
+    """
+    units = _compile_lines(sql)
+    # パラメータとインライン条件分岐はすべて /* */ コメント内に書かれる
+    has_comments = "/*" in sql
+    has_removal_tokens = has_comments and any(
+        _select_removal_tokens(_tokenize_line(unit.content)) for unit in units if not unit.is_empty
+    )
+    has_block_directives = any(parse_directive(unit.content) is not None for unit in units)
+    parent_indices: tuple[int, ...] = ()
+    if not has_block_directives:
+        # ブロックディレクティブがなければ親子関係は行分割だけで決まる
+        tree_units = _clone_units(units)
+        TwoWaySQLParser._build_tree(tree_units)
+        positions = {id(unit): i for i, unit in enumerate(tree_units)}
+        parent_indices = tuple(
+            -1 if unit.parent is None else positions[id(unit.parent)] for unit in tree_units
+        )
+    static_sql: str | None = None
+    if not has_comments and not has_block_directives:
+        # 置換も行削除も起きないため、_rebuild_sql と同じく各行をインデント付きで連結して整形する
+        static_sql = _clean_sql_text(
+            "\n".join(
+                unit.original if unit.is_empty else " " * unit.indent + unit.content
+                for unit in units
+            )
+        )
+    return _CompiledTemplate(
+        units, has_comments, has_removal_tokens, has_block_directives, parent_indices, static_sql
+    )
+
+
+@dataclass(slots=True)
+class _IfFrame:
+    """ブロックディレクティブ処理中の開いている %IF ブロック."""
+
+    if_unit: LineUnit
+    """%IF ディレクティブの行."""
+
+    outer_emitting: bool
+    """外側のブロックで選択された分岐の中にあるか."""
+
+    taken: bool
+    """いずれかの分岐が選択済みか."""
+
+
+@dataclass(slots=True)
 class ParsedSQL:
-    """パース結果."""
+    """パース結果（parse() ごとに生成されるため __slots__ でインスタンス辞書を持たない）."""
 
     sql: str
     params: list[Any] = field(default_factory=list)
@@ -72,6 +443,7 @@ class TwoWaySQLParser:
         *,
         dialect: Dialect | None = None,
         base_path: str | Path | None = None,
+        include_loader: Callable[[Path], str | None] | None = None,
     ) -> None:
         """初期化.
 
@@ -80,6 +452,10 @@ class TwoWaySQLParser:
             placeholder: プレースホルダ形式 ("?", "%s", ":name")
             dialect: RDBMS 方言。指定時は dialect.placeholder を使用する。
             base_path: %include ディレクティブの基準パス。指定しない場合はインクルード無効。
+            include_loader: インクルードファイルの読み込み関数。解決済みのパスを受け取り、
+                内容を返す（存在しない場合は None）。省略時はファイルシステムから読み込む。
+                インクルードを含むテンプレートは parse() ごとに展開し直し、内容が変わって
+                いれば解析結果を作り直す。
 
         Raises:
             ValueError: dialect と placeholder (デフォルト以外) を同時に指定した場合
@@ -92,6 +468,45 @@ class TwoWaySQLParser:
         self.dialect = dialect
         self.placeholder = dialect.placeholder if dialect is not None else placeholder
         self.base_path = Path(base_path) if base_path is not None else None
+        self._include_loader = include_loader if include_loader is not None else _read_include_file
+        # パラメータに依存しない解析結果（parse() 間で共有）
+        self._compiled_units: tuple[LineUnit, ...] | None = None
+        # %include を展開した SQL（インクルードを含まない場合は None）
+        self._included_sql: str | None = None
+        self._has_block_directives = False
+        self._has_comments = True
+        # 行の削除・例外に関わる修飾子（$ & @ ?）付きのパラメータを含むか
+        self._has_removal_tokens = True
+        # ブロックディレクティブがない場合の各行の親の位置（親子関係は行分割だけで決まる）
+        self._parent_indices: tuple[int, ...] = ()
+        # パラメータ・条件分岐を含まない SQL の整形結果（パラメータによらず同じ）
+        self._static_sql: str | None = None
+        # 置換後の SQL が値によらず決まるテンプレートの (整形結果, バインドするパラメータ名)
+        self._fixed_plan: tuple[str, tuple[str, ...]] | None = None
+        self._tokens_cache: dict[str, list[Token]] = {}
+        self._inline_cache: dict[str, list[InlineCondition]] = {}
+        self._removal_tokens_cache: dict[str, tuple[Token, ...]] = {}
+        # 行ごとの置換結果（パラメータ値によらず決まる行のみ。それ以外は空タプル）
+        self._line_plans: dict[str, tuple[str, tuple[str, ...]] | tuple[()]] = {}
+
+    @property
+    def dialect(self) -> Dialect | None:
+        """RDBMS 方言."""
+        return self._dialect
+
+    @dialect.setter
+    def dialect(self, dialect: Dialect | None) -> None:
+        """方言を設定し、方言に依存する値を parse() の外で解決しておく.
+
+        placeholder は初期化時にのみ決定するため、ここでは変更しない。
+        """
+        self._dialect = dialect
+        # IN 句1つあたりの要素数上限（上限なしは sys.maxsize）
+        self._in_limit = dialect.in_chunk_size if dialect is not None else sys.maxsize
+        # %L の LIKE エスケープに使う方言（未指定時は SQLITE）
+        self._like_dialect = dialect if dialect is not None else Dialect.SQLITE
+        # parse() 結果のメモ（IN 句の分割結果が方言に依存するため、方言を変えたら作り直す）
+        self._parse_memo: dict[tuple[Any, ...], tuple[str, tuple[Any, ...], dict[str, Any]]] = {}
 
     def _expand_includes(
         self,
@@ -110,7 +525,7 @@ class TwoWaySQLParser:
         Args:
             sql: SQLテンプレート文字列
             current_base: 現在のベースパス（相対パス解決用）
-            included_files: 既にインクルード済みのファイルパスの集合（循環検出用）
+            included_files: 展開中のファイルパスの集合（循環検出用、呼び出し中に更新される）
 
         Returns:
             インクルード展開後の SQL 文字列
@@ -120,6 +535,10 @@ class TwoWaySQLParser:
             SqlFileNotFoundError: インクルードファイルが見つからない場合
 
         """
+        # インクルードを含まない SQL（末端のフラグメントなど）は行分割せずにそのまま返す
+        if "%" not in sql:
+            return sql
+
         result_lines: list[str] = []
 
         for line in sql.split("\n"):
@@ -139,20 +558,21 @@ class TwoWaySQLParser:
                     raise SqlParseError(msg)
 
                 # ファイルの読み込み
-                if not include_path.is_file():
+                included_sql = self._include_loader(include_path)
+                if included_sql is None:
                     msg = f"インクルードファイルが見つかりません: {include_path}"
                     raise SqlFileNotFoundError(msg)
 
-                included_sql = include_path.read_text(encoding="utf-8")
-
-                # 再帰的にインクルードを展開
-                new_included_files = included_files | {include_path}
-                new_base = include_path.parent
-                expanded_sql = self._expand_includes(
-                    included_sql,
-                    new_base,
-                    new_included_files,
-                )
+                # 再帰的にインクルードを展開（展開中のパスだけを集合に保持する）
+                included_files.add(include_path)
+                try:
+                    expanded_sql = self._expand_includes(
+                        included_sql,
+                        include_path.parent,
+                        included_files,
+                    )
+                finally:
+                    included_files.discard(include_path)
 
                 # ディレクティブを展開後の SQL で置換
                 processed_line = (
@@ -165,21 +585,68 @@ class TwoWaySQLParser:
 
     def parse(self, params: dict[str, Any]) -> ParsedSQL:
         """SQLをパースしてパラメータをバインド."""
-        # %include ディレクティブを展開
-        sql = self.original_sql
-        if self.base_path is not None:
-            sql = self._expand_includes(
-                sql,
-                self.base_path,
-                included_files=set(),
-            )
-        units = self._parse_lines(sql)
-        units = self._process_block_directives(units, params)
-        self._build_tree(units)
-        self._evaluate_params(units, params)
-        self._propagate_removal(units)
+        static_sql = self._static_sql
+        if static_sql is None and self._compiled_units is None:
+            # 初回のみテンプレートを解析する（パラメータを含まない SQL はここで整形結果が決まる）
+            self._load_template()
+            static_sql = self._static_sql
+        elif self._included_sql is not None:
+            # インクルードファイルの更新を反映する（読み込みは更新日時・サイズでキャッシュされる）
+            sql = self._expand_template()
+            if sql != self._included_sql:
+                self._load_template(sql)
+                static_sql = self._static_sql
+        if static_sql is not None:
+            # トークン化・行削除を行わずにテンプレートの整形結果を返す
+            return self._make_result(static_sql, [], {}, params)
+        fixed_plan = self._fixed_plan
+        if fixed_plan is not None:
+            # 行削除も値による置換の違いも起きない: パラメータ値を集めるだけで済む
+            sql, names = fixed_plan
+            if self.placeholder == ":name":
+                return self._make_result(
+                    sql, [], {name: params.get(name) for name in names}, params
+                )
+            return self._make_result(sql, [params.get(name) for name in names], {}, params)
+        key = _memo_key(params)
+        if key is not None:
+            cached = self._parse_memo.get(key)
+            if cached is not None:
+                # 同じパラメータでの再呼び出しは前回の結果を複製して返す
+                sql, bind_values, named_bind_values = cached
+                return self._make_result(sql, list(bind_values), dict(named_bind_values), params)
+        sql, bind_params, named_bind_params = self._parse_params(params)
+        if key is not None and not _has_long_str(params):
+            memo = self._parse_memo
+            if len(memo) >= _MEMO_MAXSIZE:
+                # 上限に達したらまとめて捨てる（複数スレッドから同時に呼ばれても安全な操作に限る）
+                memo.clear()
+            memo[key] = (sql, tuple(bind_params), dict(named_bind_params))
+        return self._make_result(sql, bind_params, named_bind_params, params)
+
+    def _parse_params(self, params: dict[str, Any]) -> tuple[str, list[Any], dict[str, Any]]:
+        """行削除・パラメータ置換・整形を行い、SQL とバインドパラメータを返す."""
+        units = self._compile()
+        if self._has_block_directives:
+            units = self._process_block_directives(units, params)
+            self._build_tree(units)
+        else:
+            _link_units(units, self._parent_indices)
+        if self._evaluate_params(units, params):
+            # 削除された行がなければ、子の削除が親へ伝播することもない
+            self._propagate_removal(units)
         sql, bind_params, named_bind_params = self._rebuild_sql(units, params)
         sql = self._clean_sql(sql)
+        return sql, bind_params, named_bind_params
+
+    def _make_result(
+        self,
+        sql: str,
+        bind_params: list[Any],
+        named_bind_params: dict[str, Any],
+        params: dict[str, Any],
+    ) -> ParsedSQL:
+        """プレースホルダ形式に応じて ParsedSQL を生成する."""
         if self.placeholder == ":name":
             return ParsedSQL(
                 sql=sql,
@@ -192,6 +659,125 @@ class TwoWaySQLParser:
             named_params=params,
         )
 
+    def _compile(self) -> list[LineUnit]:
+        """パラメータに依存しない前処理を行い、LineUnit リストを返す.
+
+        %include の展開は初回のみ実行してインスタンスにキャッシュする。
+        行分割・ブロックディレクティブの有無の判定・各行の親の位置は
+        同じ SQL 文字列を持つ全インスタンスで共有される（_compile_template）。
+        parse() ごとに状態（親子関係・削除フラグ）を持たない複製を返す。
+
+        Returns:
+            この parse() 呼び出し専用の LineUnit リスト
+
+        """
+        units = self._compiled_units
+        if units is None:
+            units = self._load_template()
+        return _clone_units(units)
+
+    def _expand_template(self) -> str:
+        """テンプレートの %include を展開する（base_path 未指定の場合はそのまま返す）."""
+        sql = self.original_sql
+        if self.base_path is not None:
+            sql = self._expand_includes(
+                sql,
+                self.base_path,
+                included_files=set(),
+            )
+        return sql
+
+    def _load_template(self, sql: str | None = None) -> tuple[LineUnit, ...]:
+        """%include を展開してテンプレートの解析結果をインスタンスに設定する.
+
+        初回の parse() と、インクルードファイルの内容が変わった場合に呼ぶ。
+
+        Args:
+            sql: 展開済みの SQL（省略時はここで展開する）
+
+        Returns:
+            行分割の結果（全インスタンスで共有されるため変更してはならない）
+
+        """
+        if sql is None:
+            sql = self._expand_template()
+        self._included_sql = sql if sql != self.original_sql else None
+        # 展開結果が変わった場合に備え、前回のテンプレートに基づく結果を破棄する
+        self._parse_memo.clear()
+        self._fixed_plan = None
+        template = _compile_template(sql)
+        self._has_comments = template.has_comments
+        self._has_removal_tokens = template.has_removal_tokens
+        self._has_block_directives = template.has_block_directives
+        self._parent_indices = template.parent_indices
+        self._static_sql = template.static_sql
+        self._compiled_units = template.units
+        if template.has_comments and not (
+            template.has_removal_tokens or template.has_block_directives
+        ):
+            self._fixed_plan = self._plan_template(template.units)
+        return template.units
+
+    def _plan_template(self, units: tuple[LineUnit, ...]) -> tuple[str, tuple[str, ...]] | None:
+        """全行の置換結果が値によらず決まる場合に、整形後の SQL とパラメータ名の並びを求める.
+
+        行削除・ブロックディレクティブがないテンプレートに対してのみ呼ぶ。
+        インライン条件分岐や値で置換結果が変わるトークンを含む場合は None を返す。
+        """
+        placeholder = self.placeholder
+        is_named = placeholder == ":name"
+        lines: list[str] = []
+        names: list[str] = []
+        for unit in units:
+            if unit.is_empty:
+                lines.append(unit.original)
+                continue
+            line = unit.content
+            if self._parse_inline_conditions(line):
+                return None
+            plan = self._line_plans.get(line)
+            if plan is None:
+                plan = self._plan_line(line, placeholder, is_named)
+                self._line_plans[line] = plan
+            if not plan:
+                return None
+            lines.append(" " * unit.indent + plan[0])
+            names.extend(plan[1])
+        return self._clean_sql("\n".join(lines)), tuple(names)
+
+    def _tokenize(self, line: str) -> list[Token]:
+        """行をトークン化する.
+
+        インスタンス内の辞書を先に引き、なければ全パーサー共有のキャッシュから取得する。
+        """
+        tokens = self._tokens_cache.get(line)
+        if tokens is None:
+            tokens = _tokenize_line(line)
+            self._tokens_cache[line] = tokens
+        return tokens
+
+    def _removal_tokens(self, line: str) -> tuple[Token, ...]:
+        """行の削除・例外に関わる修飾子（$ & @ ?）を持つトークンのみを返す（行ごとにキャッシュ）.
+
+        修飾子のないトークンは値によらず行を残すため、_evaluate_params で走査しない。
+        """
+        tokens = self._removal_tokens_cache.get(line)
+        if tokens is None:
+            tokens = _select_removal_tokens(self._tokenize(line))
+            self._removal_tokens_cache[line] = tokens
+        return tokens
+
+    def _parse_inline_conditions(self, line: str) -> list[InlineCondition]:
+        """行のインライン条件分岐をパースする.
+
+        インスタンス内の辞書を先に引き、なければ全パーサー共有のキャッシュから取得する。
+        """
+        conditions = self._inline_cache.get(line)
+        if conditions is None:
+            conditions = _parse_line_inline_conditions(line)
+            self._inline_cache[line] = conditions
+        return conditions
+
     def _parse_lines(self, sql: str) -> list[LineUnit]:
         """行をパースしてLineUnitリストを作成(Rule 1).
 
@@ -201,8 +787,27 @@ class TwoWaySQLParser:
             sql: パース対象の SQL 文字列
 
         """
-        units: list[LineUnit] = []
+        return _clone_units(_compile_lines(sql))
+
+    @staticmethod
+    def _split_lines(sql: str) -> list[LineUnit]:
+        """SQL を LineUnit に分割する（_parse_lines の実処理）.
+
+        Args:
+            sql: パース対象の SQL 文字列
+
+        """
         raw_lines = sql.splitlines()
+        if "'" not in sql and '"' not in sql:
+            # 文字列リテラルがなければ行の結合は起きないため、1行ずつ内包表記で生成する
+            # (LineUnit は line_number, original, indent, content の順の位置引数)
+            return [
+                LineUnit(line_number, line, len(line) - len(stripped) if stripped else -1, stripped)
+                for line_number, line in enumerate(raw_lines, 1)
+                for stripped in (line.lstrip(),)
+            ]
+
+        units: list[LineUnit] = []
         i = 0
 
         while i < len(raw_lines):
@@ -210,11 +815,15 @@ class TwoWaySQLParser:
             start_line_number = i + 1
             original_lines = [line]
 
-            # 文字列リテラルが閉じていない場合、次の行と結合
-            while not self._is_string_closed(line) and i + 1 < len(raw_lines):
+            # 文字列リテラルが閉じていない場合、次の行と結合。
+            # 結合済みの文字列を毎回作り直して先頭から走査せず、引用符の状態を引き継いで
+            # 追加した行だけを走査する
+            in_single, in_double = TwoWaySQLParser._scan_quotes(line, False, False)
+            while (in_single or in_double) and i + 1 < len(raw_lines):
                 i += 1
-                original_lines.append(raw_lines[i])
-                line = line + "\n" + raw_lines[i]
+                line = raw_lines[i]
+                original_lines.append(line)
+                in_single, in_double = TwoWaySQLParser._scan_quotes(line, in_single, in_double)
 
             stripped = original_lines[0].lstrip()
             indent = len(original_lines[0]) - len(stripped) if stripped else -1
@@ -240,8 +849,18 @@ class TwoWaySQLParser:
     @staticmethod
     def _is_string_closed(line: str) -> bool:
         """行内の文字列リテラルがすべて閉じているか判定する."""
-        in_single = False
-        in_double = False
+        in_single, in_double = TwoWaySQLParser._scan_quotes(line, False, False)
+        return not in_single and not in_double
+
+    @staticmethod
+    def _scan_quotes(line: str, in_single: bool, in_double: bool) -> tuple[bool, bool]:
+        """行を走査し、行末での文字列リテラルの状態 (in_single, in_double) を返す.
+
+        in_single, in_double には行頭での状態を指定する。
+        """
+        # 引用符を含まない行は1文字ずつ走査する必要がない
+        if "'" not in line and '"' not in line:
+            return in_single, in_double
         i = 0
         while i < len(line):
             ch = line[i]
@@ -258,7 +877,7 @@ class TwoWaySQLParser:
                     continue
                 in_double = not in_double
             i += 1
-        return not in_single and not in_double
+        return in_single, in_double
 
     def _process_block_directives(
         self, units: list[LineUnit], params: dict[str, Any]
@@ -292,28 +911,28 @@ class TwoWaySQLParser:
 
         """
         result: list[LineUnit] = []
-        i = 0
+        # 開いている %IF ブロックのスタック（ネストは再帰せずに1回の走査で処理する）
+        stack: list[_IfFrame] = []
+        # 現在の行を出力するか（外側を含むすべてのブロックで選択された分岐の中か）
+        emitting = True
 
-        while i < len(units):
-            unit = units[i]
+        for unit in units:
             directive = parse_directive(unit.content)
 
             if directive is None:
-                # 通常の行
-                result.append(unit)
-                i += 1
+                # 通常の行: 選択された分岐の中でのみ出力する
+                if emitting:
+                    result.append(unit)
                 continue
 
             if directive.type == DirectiveType.IF:
-                # %IF ブロックを処理
-                end_idx, selected_units = self._process_if_block(units, i, params)
-                result.extend(selected_units)
-                i = end_idx + 1
-            elif directive.type in (
-                DirectiveType.ELSEIF,
-                DirectiveType.ELSE,
-                DirectiveType.END,
-            ):
+                # 条件は外側のブロックが選択されている場合のみ評価する
+                taken = emitting and self._evaluate_condition(directive.condition or "", params)
+                stack.append(_IfFrame(unit, emitting, taken))
+                emitting = taken
+                continue
+
+            if not stack:
                 # 対応する %IF なしのディレクティブ
                 msg = self._format_error(
                     "directive_without_if",
@@ -321,107 +940,32 @@ class TwoWaySQLParser:
                     sql_line=unit.content,
                 )
                 raise SqlParseError(msg)
-            else:
-                result.append(unit)
-                i += 1
-
-        return result
-
-    def _process_if_block(
-        self, units: list[LineUnit], start_idx: int, params: dict[str, Any]
-    ) -> tuple[int, list[LineUnit]]:
-        """%IF ブロックを処理する.
-
-        Args:
-            units: 全行単位リスト
-            start_idx: %IF ディレクティブのインデックス
-            params: パラメータ辞書
-
-        Returns:
-            (END ディレクティブのインデックス, 選択されたブロックの行単位リスト) のタプル
-
-        Raises:
-            SqlParseError: 構文エラー
-
-        """
-        # ブロック情報を収集: [(condition, start_idx, end_idx), ...]
-        blocks: list[tuple[str | None, int, int]] = []
-        if_directive = parse_directive(units[start_idx].content)
-        if if_directive is None or if_directive.type != DirectiveType.IF:
-            msg = self._format_error(
-                "directive_without_if",
-                line_number=units[start_idx].line_number,
-                sql_line=units[start_idx].content,
-            )
-            raise SqlParseError(msg)
-
-        current_condition = if_directive.condition
-        current_start = start_idx + 1
-        i = start_idx + 1
-        depth = 0  # ネストされた %IF のカウント
-
-        while i < len(units):
-            directive = parse_directive(units[i].content)
 
-            if directive is None:
-                i += 1
-                continue
-
-            if directive.type == DirectiveType.IF:
-                # ネストされた %IF
-                depth += 1
-                i += 1
-                continue
-
-            if depth > 0:
-                # ネスト内のディレクティブは無視
-                if directive.type == DirectiveType.END:
-                    depth -= 1
-                i += 1
+            frame = stack[-1]
+            if directive.type == DirectiveType.END:
+                stack.pop()
+                emitting = frame.outer_emitting
                 continue
 
-            if directive.type == DirectiveType.ELSEIF:
-                # 現在のブロックを終了し、新しいブロックを開始
-                blocks.append((current_condition, current_start, i))
-                current_condition = directive.condition
-                current_start = i + 1
-                i += 1
+            # %ELSEIF / %ELSE: 先に選択された分岐がなければ、最初に true となる分岐を選択
+            if not frame.outer_emitting or frame.taken:
+                emitting = False
             elif directive.type == DirectiveType.ELSE:
-                # 現在のブロックを終了し、ELSE ブロックを開始
-                blocks.append((current_condition, current_start, i))
-                current_condition = None  # ELSE は条件なし（常に true）
-                current_start = i + 1
-                i += 1
-            elif directive.type == DirectiveType.END:
-                # 最後のブロックを終了
-                blocks.append((current_condition, current_start, i))
-                end_idx = i
-                break
-        else:
-            # %END が見つからない
+                emitting = frame.taken = True
+            else:
+                emitting = frame.taken = self._evaluate_condition(directive.condition or "", params)
+
+        if stack:
+            # %END が見つからない（最も外側の閉じられていない %IF を報告する）
+            if_unit = stack[0].if_unit
             msg = self._format_error(
                 "unclosed_if_block",
-                line_number=units[start_idx].line_number,
-                sql_line=units[start_idx].content,
+                line_number=if_unit.line_number,
+                sql_line=if_unit.content,
             )
             raise SqlParseError(msg)
 
-        # 条件を評価して、最初に true となるブロックを選択
-        selected_units: list[LineUnit] = []
-        for condition, block_start, block_end in blocks:
-            if condition is None:
-                # ELSE ブロック（条件なし）
-                is_true = True
-            else:
-                is_true = self._evaluate_condition(condition, params)
-
-            if is_true:
-                # このブロックを選択（ネストされたディレクティブも処理）
-                block_units = units[block_start:block_end]
-                selected_units = self._process_block_directives(block_units, params)
-                break
-
-        return end_idx, selected_units
+        return result
 
     def _evaluate_condition(self, condition: str, params: dict[str, Any]) -> bool:
         """条件式を評価する.
@@ -443,93 +987,100 @@ class TwoWaySQLParser:
             条件が true なら True
 
         """
-        return self._parse_or_expr(condition.strip(), params)
-
-    def _parse_or_expr(self, expr: str, params: dict[str, Any]) -> bool:
-        """OR 式をパースする."""
-        parts = self._split_by_operator(expr, "OR")
-        return any(self._parse_and_expr(part.strip(), params) for part in parts)
-
-    def _parse_and_expr(self, expr: str, params: dict[str, Any]) -> bool:
-        """AND 式をパースする."""
-        parts = self._split_by_operator(expr, "AND")
-        return all(self._parse_not_expr(part.strip(), params) for part in parts)
-
-    def _parse_not_expr(self, expr: str, params: dict[str, Any]) -> bool:
-        """NOT 式をパースする."""
+        return _compile_condition(condition)(params)
+
+    @classmethod
+    def _compile_or_expr(cls, expr: str) -> _Predicate:
+        """OR 式を述語に変換する."""
+        preds = [cls._compile_and_expr(part.strip()) for part in cls._split_by_operator(expr, "OR")]
+        if len(preds) == 1:
+            return preds[0]
+        return lambda params: any(pred(params) for pred in preds)
+
+    @classmethod
+    def _compile_and_expr(cls, expr: str) -> _Predicate:
+        """AND 式を述語に変換する."""
+        preds = [
+            cls._compile_not_expr(part.strip()) for part in cls._split_by_operator(expr, "AND")
+        ]
+        if len(preds) == 1:
+            return preds[0]
+        return lambda params: all(pred(params) for pred in preds)
+
+    @classmethod
+    def _compile_not_expr(cls, expr: str) -> _Predicate:
+        """NOT 式を述語に変換する."""
         expr = expr.strip()
         if expr.upper().startswith("NOT "):
-            inner = expr[4:].strip()
-            return not self._parse_primary_expr(inner, params)
-        return self._parse_primary_expr(expr, params)
+            pred = cls._compile_primary_expr(expr[4:].strip())
+            return lambda params: not pred(params)
+        return cls._compile_primary_expr(expr)
 
-    def _parse_primary_expr(self, expr: str, params: dict[str, Any]) -> bool:
-        """基本式（識別子または括弧式）をパースする."""
+    @classmethod
+    def _compile_primary_expr(cls, expr: str) -> _Predicate:
+        """基本式（識別子または括弧式）を述語に変換する."""
         expr = expr.strip()
         if expr.startswith("(") and expr.endswith(")"):
-            # 括弧式を再帰的に評価
-            inner = expr[1:-1].strip()
-            return self._parse_or_expr(inner, params)
+            # 括弧式を再帰的に変換
+            return cls._compile_or_expr(expr[1:-1].strip())
         # 識別子（パラメータ名）
-        value = params.get(expr)
-        return not is_negative(value)
+        name = expr
+        return lambda params: not is_negative(params.get(name))
 
     @staticmethod
     def _split_by_operator(expr: str, operator: str) -> list[str]:
         """論理演算子で式を分割する（括弧内は無視）."""
         parts: list[str] = []
-        current = ""
+        # 現在の部分式は expr[part_start:i]（1文字ずつ連結せず、演算子の位置で切り出す）
+        part_start = 0
         depth = 0
         i = 0
         op_upper = operator.upper()
         op_len = len(operator)
+        length = len(expr)
 
-        while i < len(expr):
+        while i < length:
             ch = expr[i]
             if ch == "(":
                 depth += 1
-                current += ch
-                i += 1
             elif ch == ")":
                 depth -= 1
-                current += ch
-                i += 1
             elif depth == 0 and expr[i : i + op_len].upper() == op_upper:
                 # 演算子の前後がスペースまたは文字列の端であることを確認
                 before_ok = i == 0 or expr[i - 1].isspace()
-                after_ok = i + op_len >= len(expr) or expr[i + op_len].isspace()
+                after_ok = i + op_len >= length or expr[i + op_len].isspace()
                 if before_ok and after_ok:
-                    parts.append(current)
-                    current = ""
+                    parts.append(expr[part_start:i])
                     i += op_len
-                else:
-                    current += ch
-                    i += 1
-            else:
-                current += ch
-                i += 1
+                    part_start = i
+                    continue
+            i += 1
 
-        if current:
-            parts.append(current)
+        if part_start < length:
+            parts.append(expr[part_start:])
 
         return parts if parts else [expr]
 
-    def _build_tree(self, units: list[LineUnit]) -> None:
+    @staticmethod
+    def _build_tree(units: list[LineUnit]) -> None:
         """インデントに基づいて親子関係を構築(Rule 2)."""
+        # 祖先の行を並べたスタック（各行は高々1回ずつ積んで降ろすため O(N)）
         stack: list[LineUnit] = []
         for unit in units:
             if unit.is_empty:
                 continue
+            indent = unit.indent
             # スタックから現在行と同じかより深いインデントを持つものを除去
-            while stack and stack[-1].indent >= unit.indent:
+            while stack and stack[-1].indent >= indent:
                 stack.pop()
             # スタックが残っていれば、その先頭が親
             if stack:
-                unit.parent = stack[-1]
-                stack[-1].children.append(unit)
+                parent = stack[-1]
+                unit.parent = parent
+                parent.add_child(unit)
             stack.append(unit)
 
-    def _evaluate_params(self, units: list[LineUnit], params: dict[str, Any]) -> None:
+    def _evaluate_params(self, units: list[LineUnit], params: dict[str, Any]) -> bool:
         """パラメータを評価して行の削除を決定(Rule 4).
 
         $付き(removable) または &付き(bindless) パラメータの値が negative の場合、
@@ -543,12 +1094,20 @@ class TwoWaySQLParser:
         - @ : required（negative時に例外をスロー）
 
         negative とは: None, False, 空リスト, 全要素が negative のリスト
+
+        Returns:
+            いずれかの行を削除対象にした場合 True
+
         """
+        if not self._has_removal_tokens:
+            # 修飾子付きのパラメータがなければ、値によらずどの行も削除されない
+            return False
+        removed_any = False
         for unit in units:
             if unit.is_empty or unit.removed:
                 continue
-            tokens = tokenize(unit.content)
-            for token in tokens:
+            for token in self._removal_tokens(unit.content):
+                removes_line = token.removable or token.bindless
                 value = params.get(token.name)
                 value_is_negative = is_negative(value)
 
@@ -574,58 +1133,84 @@ class TwoWaySQLParser:
                     )
                     if all_negative:
                         unit.removed = True
+                        removed_any = True
                         break
                     continue
 
                 # $ または & 修飾子: negative 時に行削除
                 # ただし IN 句の場合、空リストは IN (NULL) に変換されるため行削除しない
-                if (token.removable or token.bindless) and value_is_negative:
+                if removes_line and value_is_negative:
                     # IN 句で空リストの場合は行削除しない（IN (NULL) に変換）
                     if token.is_in_clause and isinstance(value, list) and len(value) == 0:
                         continue
                     unit.removed = True
+                    removed_any = True
                     break
+        return removed_any
 
     def _propagate_removal(self, units: list[LineUnit]) -> None:
         """子が全削除なら親も削除(ボトムアップ処理, Rule 3).
 
         逆順に走査することで、孫→子→親の順で伝播を実現する。
         子を持つ行が削除された場合、その兄弟でパラメータも子も持たない行
-        （閉じ括弧など）も削除対象とする。収束するまで繰り返す。
+        （閉じ括弧など）も削除対象とする。
+
+        親を訪れた時点で子孫はすべて走査済みのため、兄弟の判定は親ごとに1回行えばよく、
+        全体を収束するまで繰り返す必要はない。
 
         例外: SELECT/INSERT/UPDATE/DELETE で始まる行はパラメータを含まない場合でも
         削除対象外とする（CTE 内の SELECT 行を保護）。
         """
-        # SELECT/INSERT/UPDATE/DELETE で始まる行は保護対象
-        protected_keywords = re.compile(
-            r"^(?:SELECT|INSERT|UPDATE|DELETE)\b",
-            re.IGNORECASE,
-        )
-
-        changed = True
-        while changed:
-            changed = False
-            for unit in reversed(units):
-                if unit.is_empty or unit.removed:
-                    continue
-                if not unit.children:
-                    # 子を持たない行: 親があり、兄弟が全て removed なら自身も削除
-                    if unit.parent and not tokenize(unit.content):
-                        # SELECT 等で始まる行は保護（CTE 内の SELECT を残す）
-                        if protected_keywords.match(unit.content):
-                            continue
-                        siblings = unit.parent.children
-                        others = [s for s in siblings if s is not unit]
-                        if others and all(s.removed for s in others):
-                            unit.removed = True
-                            changed = True
-                    continue
-                if all(child.removed for child in unit.children):
+        for unit in reversed(units):
+            children = unit.children
+            if not children:
+                continue
+            remaining = [child for child in children if not child.removed]
+            if len(remaining) == 1 and len(children) > 1:
+                # 子を持たない行: 兄弟が全て removed で、パラメータを含まなければ自身も削除
+                last = remaining[0]
+                if (
+                    not last.children
+                    and not self._tokenize(last.content)
                     # SELECT 等で始まる行は保護（CTE 内の SELECT を残す）
-                    if protected_keywords.match(unit.content):
-                        continue
-                    unit.removed = True
-                    changed = True
+                    and not _PROTECTED_LINE_PATTERN.match(last.content)
+                ):
+                    last.removed = True
+                    remaining = []
+            if remaining or unit.removed:
+                continue
+            # SELECT 等で始まる行は保護（CTE 内の SELECT を残す）
+            if not _PROTECTED_LINE_PATTERN.match(unit.content):
+                unit.removed = True
+
+    def _plan_line(
+        self, line: str, placeholder: str, is_named: bool
+    ) -> tuple[str, tuple[str, ...]] | tuple[()]:
+        """置換後の行とバインドするパラメータ名を、値によらず決まる場合に求める.
+
+        IN 句展開・演算子・LIKE・ヘルパー関数・フォールバックなど、値によって
+        置換結果が変わるトークンを含む行は空タプルを返す（都度トークンを処理する）。
+        """
+        tokens = self._tokenize(line)
+        parts: list[str] = []
+        pos = 0
+        for token in tokens:
+            if (
+                token.bindless
+                or token.is_in_clause
+                or token.operator
+                or token.is_like
+                or token.is_not_like
+                or token.is_partial_in
+                or token.helper_func
+                or token.fallback
+            ):
+                return ()
+            parts.append(line[pos : token.start])
+            parts.append(f":{token.name}" if is_named else placeholder)
+            pos = token.end
+        parts.append(line[pos:])
+        return "".join(parts), tuple(token.name for token in tokens)
 
     def _rebuild_sql(
         self, units: list[LineUnit], params: dict[str, Any]
@@ -634,7 +1219,11 @@ class TwoWaySQLParser:
         result_lines: list[str] = []
         bind_params: list[Any] = []
         named_bind_params: dict[str, Any] = {}
-        is_named = self.placeholder == ":name"
+        # プレースホルダ形式は初期化時に決まるため、行・トークンごとに属性を引かない
+        placeholder = self.placeholder
+        is_named = placeholder == ":name"
+        in_limit = self._in_limit
+        line_plans = self._line_plans
 
         for unit in units:
             if unit.removed:
@@ -646,27 +1235,41 @@ class TwoWaySQLParser:
             line = unit.content
             # インライン条件分岐を処理
             line = self._process_inline_conditions(line, params)
-            tokens = tokenize(line)
-            if not tokens:
-                # パラメータなし: インデント付きで出力
-                indent_str = " " * unit.indent
-                result_lines.append(indent_str + line)
+            plan = line_plans.get(line)
+            if plan is None:
+                plan = self._plan_line(line, placeholder, is_named)
+                line_plans[line] = plan
+            if plan:
+                # 置換後の行が値によらず決まる: 行はそのまま出力し、値だけを積む
+                text, names = plan
+                result_lines.append(" " * unit.indent + text)
+                if is_named:
+                    for name in names:
+                        named_bind_params[name] = params.get(name)
+                else:
+                    bind_params.extend([params.get(name) for name in names])
                 continue
 
-            # トークンを後ろから置換(位置ずれ防止)
-            line_params: list[Any] = []
-            in_limit = self.dialect.in_clause_limit if self.dialect else None
-            for token in reversed(tokens):
-                value = self._resolve_value(token, params)
+            tokens = self._tokenize(line)
+
+            # 行を先頭から1回だけ走査し、トークン間の原文と置換文字列を parts に積んで
+            # 最後に連結する（トークンごとに行全体を作り直さない）。
+            # 置換位置の判定は常に元の行に対して行う
+            parts: list[str] = [" " * unit.indent]
+            pos = 0
+            for token in tokens:
+                # フォールバックチェーンを持たない通常のトークンはメソッド呼び出しを省く
+                value = (
+                    self._resolve_value(token, params) if token.fallback else params.get(token.name)
+                )
+                start = token.start
 
                 # & 修飾子（bindless）: プレースホルダを追加せずコメントを除去
                 if token.bindless:
-                    line = line[: token.start] + line[token.end :]
-                    continue
-
-                if token.is_in_clause:
+                    replacement = ""
+                elif token.is_in_clause:
                     if isinstance(value, list):
-                        if in_limit and len(value) > in_limit:
+                        if len(value) > in_limit:
                             # IN 句上限超過: (col IN (...) OR col IN (...)) に分割
                             extracted = self._extract_in_clause_column(line, token.start)
                             if extracted is None:
@@ -676,111 +1279,93 @@ class TwoWaySQLParser:
                                     sql_line=line,
                                 )
                                 raise SqlParseError(msg)
-                            col_expr, col_start = extracted
+                            col_expr, start = extracted
                             if is_named:
-                                replacement, expanded = self._expand_in_clause_split_named(
+                                replacement, named_expanded = self._expand_in_clause_split_named(
                                     token.name,
                                     value,
                                     in_limit,
                                     col_expr,
                                 )
-                                line = line[:col_start] + replacement + line[token.end :]
-                                named_bind_params.update(expanded)
+                                named_bind_params.update(named_expanded)
                             else:
                                 replacement, expanded = self._expand_in_clause_split(
                                     value,
                                     in_limit,
                                     col_expr,
                                 )
-                                line = line[:col_start] + replacement + line[token.end :]
-                                for v in reversed(expanded):
-                                    line_params.insert(0, v)
+                                bind_params.extend(expanded)
                         elif is_named:
-                            replacement, expanded = self._expand_in_clause_named(token.name, value)
-                            line = line[: token.start] + replacement + line[token.end :]
-                            named_bind_params.update(expanded)
+                            replacement, named_expanded = self._expand_in_clause_named(
+                                token.name, value
+                            )
+                            named_bind_params.update(named_expanded)
                         else:
                             replacement, expanded = self._expand_in_clause(value)
-                            line = line[: token.start] + replacement + line[token.end :]
-                            for v in reversed(expanded):
-                                line_params.insert(0, v)
+                            bind_params.extend(expanded)
                     else:
                         # リストでない値（None等）は単一要素として IN (:name) に展開
-                        placeholder = f":{token.name}" if is_named else self.placeholder
-                        line = line[: token.start] + f"IN ({placeholder})" + line[token.end :]
                         if is_named:
+                            replacement = f"IN (:{token.name})"
                             named_bind_params[token.name] = value
                         else:
-                            line_params.insert(0, value)
+                            replacement = f"IN ({placeholder})"
+                            bind_params.append(value)
                 elif token.operator:
                     # 比較演算子の自動変換
                     replacement, expanded, named_expanded = self._convert_operator(
                         token, value, is_named
                     )
-                    line = line[: token.start] + replacement + line[token.end :]
                     if is_named:
                         named_bind_params.update(named_expanded)
                     else:
-                        for v in reversed(expanded):
-                            line_params.insert(0, v)
+                        bind_params.extend(expanded)
                 elif token.is_like or token.is_not_like:
-                    # LIKE 句のリスト展開
+                    # LIKE 句のリスト展開（列式を含めて置換）
                     col_expr = self._extract_column_before_token(line, token.start)
                     replacement, expanded, named_expanded = self._expand_like(
                         token, value, col_expr, is_named
                     )
-                    # 列式を含めて置換
-                    col_start = token.start - len(col_expr) - 1  # スペース分
-                    # 列式の開始位置を正確に計算
-                    prefix = line[: token.start].rstrip()
-                    col_start = len(prefix) - len(col_expr)
-                    line = line[:col_start] + replacement + line[token.end :]
+                    start = len(line[: token.start].rstrip()) - len(col_expr)
                     if is_named:
                         named_bind_params.update(named_expanded)
                     else:
-                        for v in reversed(expanded):
-                            line_params.insert(0, v)
+                        bind_params.extend(expanded)
                 elif token.is_partial_in and isinstance(value, list):
                     # IN 句の部分展開（固定値 + パラメータ混在）
                     if not value:
                         # 空リスト → NULL
-                        line = line[: token.start] + "NULL" + line[token.end :]
+                        replacement = "NULL"
                     elif is_named:
-                        named = {f"{token.name}_{i}": v for i, v in enumerate(value)}
-                        placeholders = ", ".join(f":{k}" for k in named)
-                        line = line[: token.start] + placeholders + line[token.end :]
-                        named_bind_params.update(named)
+                        count = len(value)
+                        named_bind_params.update(zip(_indexed_names(token.name, count), value))
+                        replacement = _join_indexed_placeholders(token.name, count)
                     else:
-                        placeholders = ", ".join([self.placeholder] * len(value))
-                        line = line[: token.start] + placeholders + line[token.end :]
-                        for v in reversed(value):
-                            line_params.insert(0, v)
+                        replacement = _join_placeholders(placeholder, len(value))
+                        bind_params.extend(value)
                 elif token.helper_func:
                     # 補助関数の処理
                     replacement, expanded_value = self._process_helper_func(token, params, is_named)
-                    if token.helper_func in ("STR", "SQL"):
-                        # 直接埋め込み（プレースホルダなし）
-                        line = line[: token.start] + replacement + line[token.end :]
-                    else:
-                        # %concat, %L は値をバインド
-                        placeholder = f":{token.name}" if is_named else self.placeholder
-                        line = line[: token.start] + replacement + line[token.end :]
+                    # %STR, %SQL は直接埋め込み（プレースホルダなし）、%concat, %L は値をバインド
+                    if token.helper_func not in _EMBED_HELPERS:
                         if is_named:
                             named_bind_params[token.name] = expanded_value
                         else:
-                            line_params.insert(0, expanded_value)
+                            bind_params.append(expanded_value)
+                elif is_named:
+                    replacement = f":{token.name}"
+                    named_bind_params[token.name] = value
                 else:
-                    placeholder = f":{token.name}" if is_named else self.placeholder
-                    line = line[: token.start] + placeholder + line[token.end :]
-                    if is_named:
-                        named_bind_params[token.name] = value
-                    else:
-                        line_params.insert(0, value)
-            bind_params.extend(line_params)
+                    replacement = placeholder
+                    bind_params.append(value)
+
+                parts.append(line[pos:start])
+                parts.append(replacement)
+                pos = token.end
+            parts.append(line[pos:])
 
             # 元のインデントを復元
-            indent_str = " " * unit.indent
-            result_lines.append(indent_str + line)
+            result_lines.append("".join(parts))
 
         return "\n".join(result_lines), bind_params, named_bind_params
 
@@ -855,11 +1440,12 @@ class TwoWaySQLParser:
             # 2要素以上 → IN / NOT IN
             not_prefix = "NOT " if is_negation else ""
             if is_named:
-                named = {f"{token.name}_{i}": v for i, v in enumerate(value)}
-                placeholders = ", ".join(f":{k}" for k in named)
+                count = len(value)
+                named = dict(zip(_indexed_names(token.name, count), value))
+                placeholders = _join_indexed_placeholders(token.name, count)
                 return f"{not_prefix}IN ({placeholders})", [], named
-            placeholders = ", ".join([self.placeholder] * len(value))
-            return f"{not_prefix}IN ({placeholders})", list(value), {}
+            placeholders = _join_placeholders(self.placeholder, len(value))
+            return f"{not_prefix}IN ({placeholders})", value, {}
 
         # スカラー値 → = ? / <> ?
         op = "<>" if is_negation else "="
@@ -884,7 +1470,7 @@ class TwoWaySQLParser:
         if extracted:
             return extracted[0]
         # フォールバック: 最後の単語を取得
-        match = re.search(r"(\w+(?:\.\w+)?)\s*$", prefix)
+        match = _TRAILING_COLUMN_PATTERN.search(prefix)
         if match:
             return match.group(1)
         return ""
@@ -932,20 +1518,22 @@ class TwoWaySQLParser:
         if is_named:
             named: dict[str, Any] = {}
             parts: list[str] = []
-            for i, v in enumerate(value):
-                key = f"{token.name}_{i}"
+            for key, v in zip(_indexed_names(token.name, len(value)), value):
                 named[key] = v
                 parts.append(f"{col_expr} {like_kw} :{key}")
             return f"({joiner.join(parts)})", [], named
 
         parts = [f"{col_expr} {like_kw} {self.placeholder}" for _ in value]
-        return f"({joiner.join(parts)})", list(value), {}
+        return f"({joiner.join(parts)})", value, {}
 
     def _process_inline_conditions(self, line: str, params: dict[str, Any]) -> str:
         """インライン条件分岐を処理する.
 
         構文: /*%if cond1 */ val1 /*%elseif cond2 */ val2 /*%else */ val3 /*%end*/
 
+        条件を先に評価し、選択された分岐の値だけを行に埋め込む。
+        トークン化は解決後の行に対して行うため、選択されなかった分岐はトークン化しない。
+
         Args:
             line: SQL行文字列
             params: パラメータ辞書
@@ -954,7 +1542,7 @@ class TwoWaySQLParser:
             条件分岐を解決後の行文字列
 
         """
-        conditions = parse_inline_conditions(line)
+        conditions = self._parse_inline_conditions(line)
         if not conditions:
             return line
 
@@ -999,49 +1587,35 @@ class TwoWaySQLParser:
         args = token.helper_args
 
         if func == "concat":
-            # %concat / %C: 引数を連結
-            result_parts: list[str] = []
-            for arg in args:
-                if arg.startswith("'") and arg.endswith("'"):
-                    # 文字列リテラル
-                    result_parts.append(arg[1:-1].replace("''", "'"))
-                elif arg.startswith('"') and arg.endswith('"'):
-                    result_parts.append(arg[1:-1].replace('""', '"'))
-                else:
-                    # パラメータ名
-                    val = params.get(arg)
-                    if val is not None:
-                        result_parts.append(str(val))
-            concatenated = "".join(result_parts)
+            # %concat / %C: 引数を連結（None のパラメータは無視）
+            values = [
+                literal if name is None else params.get(name)
+                for literal, name in _split_helper_args(args)
+            ]
+            concatenated = "".join([str(v) for v in values if v is not None])
             placeholder = f":{token.name}" if is_named else self.placeholder
             return placeholder, concatenated
 
         if func == "L":
             # %L: LIKE エスケープ + escape 句付与
-            from sqlym.dialect import Dialect
-            from sqlym.escape_utils import escape_like
-
-            # dialect が設定されていない場合は SQLITE をデフォルト
-            dialect = self.dialect if self.dialect else Dialect.SQLITE
-
-            result_parts = []
-            for arg in args:
-                if arg.startswith("'") and arg.endswith("'"):
-                    result_parts.append(arg[1:-1].replace("''", "'"))
-                elif arg.startswith('"') and arg.endswith('"'):
-                    result_parts.append(arg[1:-1].replace('""', '"'))
-                else:
-                    val = params.get(arg)
-                    if val is not None:
-                        # パラメータ値を LIKE エスケープ
-                        escaped = escape_like(str(val), dialect, escape_char="#")
-                        result_parts.append(escaped)
+            dialect = self._like_dialect
+
+            result_parts: list[str] = []
+            for literal, name in _split_helper_args(args):
+                if name is None:
+                    # 文字列リテラルはエスケープせずにそのまま連結する
+                    result_parts.append(literal or "")
+                    continue
+                val = params.get(name)
+                if val is not None:
+                    # パラメータ値を LIKE エスケープ
+                    result_parts.append(escape_like(str(val), dialect, escape_char="#"))
             concatenated = "".join(result_parts)
             placeholder = f":{token.name}" if is_named else self.placeholder
             # escape 句を付与
             return f"{placeholder} escape '#'", concatenated
 
-        if func in ("STR", "SQL"):
+        if func in _EMBED_HELPERS:
             # %STR / %SQL: 直接埋め込み（SQLインジェクション注意）
             val = params.get(token.name, token.default)
             if val is None:
@@ -1063,8 +1637,9 @@ class TwoWaySQLParser:
         """
         if not values:
             return "IN (NULL)", []
-        placeholders = ", ".join([self.placeholder] * len(values))
-        return f"IN ({placeholders})", list(values)
+        # 呼び出し側が extend で一括コピーするため、ここでは複製しない
+        placeholders = _join_placeholders(self.placeholder, len(values))
+        return f"IN ({placeholders})", values
 
     def _expand_in_clause_named(self, name: str, values: list[Any]) -> tuple[str, dict[str, Any]]:
         """IN句のリストを名前付きプレースホルダに展開する.
@@ -1079,9 +1654,9 @@ class TwoWaySQLParser:
         """
         if not values:
             return "IN (NULL)", {}
-        named = {f"{name}_{i}": v for i, v in enumerate(values)}
-        placeholders = ", ".join(f":{k}" for k in named)
-        return f"IN ({placeholders})", named
+        count = len(values)
+        named = dict(zip(_indexed_names(name, count), values))
+        return f"IN ({_join_indexed_placeholders(name, count)})", named
 
     def _expand_in_clause_split(
         self,
@@ -1100,12 +1675,13 @@ class TwoWaySQLParser:
             (置換文字列, バインドパラメータリスト) のタプル
 
         """
-        chunks = [values[i : i + limit] for i in range(0, len(values), limit)]
-        parts: list[str] = []
-        for chunk in chunks:
-            phs = ", ".join([self.placeholder] * len(chunk))
-            parts.append(f"{col_expr} IN ({phs})")
-        return "(" + " OR ".join(parts) + ")", list(values)
+        # 全チャンクのプレースホルダ列は上限サイズのものと端数のものの2種類だけ
+        n = len(values)
+        full_count, remainder = divmod(n, limit)
+        parts = [f"{col_expr} IN ({_join_placeholders(self.placeholder, limit)})"] * full_count
+        if remainder:
+            parts.append(f"{col_expr} IN ({_join_placeholders(self.placeholder, remainder)})")
+        return "(" + " OR ".join(parts) + ")", values
 
     def _expand_in_clause_split_named(
         self,
@@ -1126,90 +1702,125 @@ class TwoWaySQLParser:
             (置換文字列, 名前付きバインドパラメータ辞書) のタプル
 
         """
-        chunks = [values[i : i + limit] for i in range(0, len(values), limit)]
-        parts: list[str] = []
-        named: dict[str, Any] = {}
-        idx = 0
-        for chunk in chunks:
-            chunk_keys: list[str] = []
-            for v in chunk:
-                key = f"{name}_{idx}"
-                named[key] = v
-                chunk_keys.append(f":{key}")
-                idx += 1
-            parts.append(f"{col_expr} IN ({', '.join(chunk_keys)})")
+        keys = _indexed_names(name, len(values))
+        named = dict(zip(keys, values))
+        parts = [
+            f"{col_expr} IN ({_join_named_placeholders(keys[i : i + limit])})"
+            for i in range(0, len(keys), limit)
+        ]
         return "(" + " OR ".join(parts) + ")", named
 
     def _clean_sql(self, sql: str) -> str:
         """不要なWHERE/AND/OR/空括弧/行末区切り/孤立UNION行を除去."""
+        return _clean_sql_text(sql)
+
+    @classmethod
+    def _clean(cls, sql: str) -> str:
+        """不要な句・区切りを除去する（_clean_sql の実処理）."""
+        upper = sql.upper()
+        has_paren = ")" in sql
+        has_clause = "WHERE" in upper or "HAVING" in upper
         lines = sql.split("\n")
 
         # 0. 孤立した区切り行（UNION/UNION ALL/EXCEPT/INTERSECT）を除去
         # これらの行は前後に有効な SELECT が必要
-        lines = self._remove_orphan_set_operators(lines)
+        if "UNION" in upper or "EXCEPT" in upper or "INTERSECT" in upper:
+            lines = cls._remove_orphan_set_operators(lines)
 
         # 1. 対応する開き括弧がない ')' だけの行を除去
-        paren_stack: list[int] = []
-        remove_indices: set[int] = set()
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped == ")":
-                if paren_stack:
-                    paren_stack.pop()
-                else:
-                    remove_indices.add(i)
-            elif stripped.endswith("("):
-                opens = stripped.count("(")
-                closes = stripped.count(")")
-                if opens > closes:
-                    paren_stack.append(i)
-        lines = [line for i, line in enumerate(lines) if i not in remove_indices]
-        sql = "\n".join(lines)
+        # （閉じ括弧と対応させるのは開き括弧で終わる行の数だけなので、位置は保持しない）
+        if has_paren:
+            open_count = 0
+            remove_indices: list[int] = []
+            for i, line in enumerate(lines):
+                stripped = line.strip()
+                if stripped == ")":
+                    if open_count:
+                        open_count -= 1
+                    else:
+                        remove_indices.append(i)
+                elif stripped.endswith("(") and stripped.count("(") > stripped.count(")"):
+                    open_count += 1
+            if remove_indices:
+                for i in reversed(remove_indices):
+                    del lines[i]
 
         # 2. 行末の AND/OR を除去（次の行が削除された場合に残る）
-        sql = re.sub(
-            r"[ \t]+(?:AND|OR)[ \t]*$",
-            "",
-            sql,
-            flags=re.IGNORECASE | re.MULTILINE,
-        )
+        lines = [cls._strip_trailing_and_or(line) for line in lines]
 
         # 3. 行末のカンマを除去（次の行が削除された場合に残る）
         # ただし、括弧内の最後の要素のカンマのみ（SELECT句等は除外）
-        sql = self._remove_trailing_commas(sql)
+        if has_paren:
+            cls._remove_trailing_commas(lines)
+
+        # WHERE/HAVING がなければ以降の処理は不要
+        if not has_clause:
+            return "\n".join(lines)
 
         # 4. WHERE/HAVING 直後の先頭 AND/OR を除去
-        sql = re.sub(
-            r"(\b(?:WHERE|HAVING)\b[ \t]*\n(?:[ \t]*\n)*)([ \t]+)(?:AND|OR)\b[ \t]+",
-            r"\1\2",
-            sql,
-            flags=re.IGNORECASE,
-        )
+        cls._strip_leading_and_or(lines)
+
+        # 行単位の処理はここまで。以降の複数行にまたがる置換のために1回だけ結合する
+        sql = "\n".join(lines)
 
         # 5. 条件のない孤立 WHERE/HAVING を除去（SQL末尾）
-        sql = re.sub(
-            r"\n?[ \t]*\b(?:WHERE|HAVING)\b[ \t]*(?:\n[ \t]*)*$",
-            "",
-            sql,
-            flags=re.IGNORECASE,
-        )
+        sql = _TRAILING_EMPTY_CLAUSE_PATTERN.sub("", sql)
 
         # 6. 条件のない WHERE/HAVING を除去（後続に別のSQL句がある場合）
-        next_clause = r"ORDER|GROUP|LIMIT|UNION|EXCEPT|INTERSECT|FETCH|OFFSET|FOR"
-        sql = re.sub(
-            rf"[ \t]*\b(?:WHERE|HAVING)\b[ \t]*\n(?=[ \t]*\b(?:{next_clause})\b)",
-            "",
-            sql,
-            flags=re.IGNORECASE,
-        )
+        sql = _EMPTY_CLAUSE_BEFORE_NEXT_PATTERN.sub("", sql)
 
         return sql
 
-    def _remove_trailing_commas(self, sql: str) -> str:
-        """閉じ括弧の直前にある行末カンマを除去する."""
-        lines = sql.split("\n")
-        result: list[str] = []
+    @classmethod
+    def _strip_leading_and_or(cls, lines: list[str]) -> None:
+        """WHERE/HAVING で終わる行の次の行（空行は読み飛ばす）の先頭 AND/OR を除去する.
 
+        インデントは残し、AND/OR と直後の空白を取り除く（lines を直接書き換える）。
+        """
+        after_clause = False
+        for i, line in enumerate(lines):
+            if after_clause:
+                stripped = line.lstrip(" \t")
+                if not stripped:
+                    continue
+                if len(stripped) < len(line):
+                    head = stripped[:4].upper()
+                    if head.startswith(("AND ", "AND\t")):
+                        line = line[: len(line) - len(stripped)] + stripped[3:].lstrip(" \t")
+                        lines[i] = line
+                    elif head.startswith(("OR ", "OR\t")):
+                        line = line[: len(line) - len(stripped)] + stripped[2:].lstrip(" \t")
+                        lines[i] = line
+            after_clause = cls._ends_with_where_or_having(line)
+
+    @staticmethod
+    def _ends_with_where_or_having(line: str) -> bool:
+        """行が WHERE/HAVING キーワード（末尾の空白は無視）で終わるか."""
+        stripped = line.rstrip(" \t")
+        for keyword in _CONDITION_CLAUSES:
+            size = len(keyword)
+            if stripped[-size:].upper() == keyword:
+                # 直前が単語構成文字（\w 相当）なら別の識別子の一部
+                if len(stripped) == size:
+                    return True
+                prev = stripped[-size - 1]
+                return not (prev.isalnum() or prev == "_")
+        return False
+
+    @staticmethod
+    def _strip_trailing_and_or(line: str) -> str:
+        """行末の AND/OR（直前に空白があるもの）を前の空白ごと除去する."""
+        stripped = line.rstrip(" \t")
+        tail = stripped[-4:].upper()
+        if tail.endswith((" AND", "\tAND")):
+            return stripped[:-3].rstrip(" \t")
+        if tail.endswith((" OR", "\tOR")):
+            return stripped[:-2].rstrip(" \t")
+        return line
+
+    @staticmethod
+    def _remove_trailing_commas(lines: list[str]) -> None:
+        """閉じ括弧の直前にある行末カンマを除去する（lines を直接書き換える）."""
         for i, line in enumerate(lines):
             stripped = line.rstrip()
             # 行末がカンマで終わっていて、後続の非空行が ) で始まる場合
@@ -1220,13 +1831,11 @@ class TwoWaySQLParser:
                     if next_stripped:
                         if next_stripped.startswith(")"):
                             # カンマを除去
-                            line = stripped[:-1] + line[len(stripped) :]
+                            lines[i] = stripped[:-1] + line[len(stripped) :]
                         break
-            result.append(line)
-
-        return "\n".join(result)
 
-    def _remove_orphan_set_operators(self, lines: list[str]) -> list[str]:
+    @staticmethod
+    def _remove_orphan_set_operators(lines: list[str]) -> list[str]:
         """孤立した集合演算子行（UNION/EXCEPT/INTERSECT）を除去する.
 
         集合演算子は前後に有効なクエリ（SELECT等）が必要。
@@ -1234,13 +1843,10 @@ class TwoWaySQLParser:
         1. 前後に有効なクエリがない集合演算子を除去（繰り返し）
         2. 連続する集合演算子は最初の1つだけ残す
         """
-        set_op_pattern = re.compile(
-            r"^\s*(?:UNION\s+ALL|UNION|EXCEPT|INTERSECT)\s*$",
-            re.IGNORECASE,
-        )
 
         def is_set_operator(line: str) -> bool:
-            return set_op_pattern.match(line) is not None
+            # 空白を1つに正規化して大文字化し、集合演算子の集合と照合する
+            return " ".join(line.split()).upper() in _SET_OPERATORS
 
         def find_valid_query_before(idx: int, lines_: list[str]) -> bool:
             """インデックス前に有効なクエリ行があるか確認."""
@@ -1415,6 +2021,18 @@ class TwoWaySQLParser:
     @staticmethod
     def _find_matching_open_paren(s: str, close_idx: int) -> int | None:
         """close_idx に対応する '(' の位置を返す（簡易バランス）."""
+        # 直前の '(' までに括弧・引用符がなければ、それが対応する開き括弧
+        open_idx = s.rfind("(", 0, close_idx)
+        if (
+            open_idx >= 0
+            and s[close_idx] == ")"
+            and s.find(")", open_idx + 1, close_idx) == -1
+            and s.find("'", open_idx + 1, close_idx) == -1
+            and s.find('"', open_idx + 1, close_idx) == -1
+        ):
+            return open_idx
+
+        # 入れ子や引用符を含む場合は1文字ずつ走査する
         depth = 0
         in_single = False
         in_double = False
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from functools import cached_property
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from sqlym._parse import parse_sql
+from sqlym._parse import _get_parser
+from sqlym.dialect import Dialect
+from sqlym.exceptions import SqlParseError
 from sqlym.loader import SqlLoader
 from sqlym.mapper.factory import create_mapper
 
 if TYPE_CHECKING:
-    from sqlym.dialect import Dialect
     from sqlym.mapper.protocol import RowMapper
+    from sqlym.parser.twoway import ParsedSQL, TwoWaySQLParser
 
 T = TypeVar("T")
 
+# DB ドライバのトップレベルパッケージ名 → Dialect
+_DIALECT_BY_PACKAGE: dict[str, Dialect] = {
+    "sqlite3": Dialect.SQLITE,
+    "psycopg": Dialect.POSTGRESQL,
+    "psycopg2": Dialect.POSTGRESQL,
+    "pymysql": Dialect.MYSQL,
+    "MySQLdb": Dialect.MYSQL,
+    "oracledb": Dialect.ORACLE,
+    "cx_Oracle": Dialect.ORACLE,
+}
+
 
 class Sqlym:
     """sqlym の高レベル API.
@@ -51,6 +65,8 @@ class Sqlym:
         sql_dir: str | Path = "sql",
         dialect: Dialect | None = None,
         auto_commit: bool = False,
+        reuse_cursor: bool = False,
+        sql_cache: bool = True,
     ) -> None:
         """初期化.
 
@@ -59,12 +75,25 @@ class Sqlym:
             sql_dir: SQL ファイルのベースディレクトリ
             dialect: RDBMS 方言（None の場合は自動検出を試みる）
             auto_commit: True の場合、execute() 後に自動で commit する
+            reuse_cursor: True の場合、SQL の実行ごとにカーソルを生成せず1つのカーソルを
+                再利用する。カーソルは close_cursor() または with ブロックの終了時に閉じる。
+                iter_query() は常に専用のカーソルを使用する
+            sql_cache: True の場合、SQL ファイルの読み込み結果をキャッシュする（更新日時・
+                サイズが変わったファイルは読み込み直す）。False の場合は実行ごとに読み込む
 
         """
         self._connection = connection
-        self._loader = SqlLoader(sql_dir)
+        self._sql_dir = sql_dir
+        self._sql_cache = sql_cache
         self._dialect = dialect if dialect is not None else self._detect_dialect()
         self._auto_commit = auto_commit
+        self._reuse_cursor = reuse_cursor
+        self._shared_cursor: Any = None
+
+    @cached_property
+    def _loader(self) -> SqlLoader:
+        """SQL ファイルローダー（同じ sql_dir を指すインスタンス間で共有する）."""
+        return SqlLoader.for_path(self._sql_dir, cache=self._sql_cache)
 
     def __enter__(self) -> Sqlym:
         """コンテキストマネージャ: connection に委譲."""
@@ -77,8 +106,37 @@ class Sqlym:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> bool | None:
-        """コンテキストマネージャ: connection に委譲."""
-        return self._connection.__exit__(exc_type, exc_val, exc_tb)
+        """コンテキストマネージャ: connection に委譲.
+
+        共有カーソルを閉じる際に例外が発生しても、connection の __exit__
+        （commit / rollback）は必ず呼び出す。
+        """
+        try:
+            self.close_cursor()
+        finally:
+            return_value = self._connection.__exit__(exc_type, exc_val, exc_tb)
+        return return_value
+
+    def close_cursor(self) -> None:
+        """再利用しているカーソルを閉じる（connection は閉じない）."""
+        cursor = self._shared_cursor
+        if cursor is not None:
+            self._shared_cursor = None
+            cursor.close()
+
+    def _cursor(self) -> Any:
+        """SQL 実行用のカーソルを取得する（reuse_cursor=True の場合は共有カーソル）."""
+        if not self._reuse_cursor:
+            return self._connection.cursor()
+        cursor = self._shared_cursor
+        if cursor is None:
+            cursor = self._shared_cursor = self._connection.cursor()
+        return cursor
+
+    def _release_cursor(self, cursor: Any) -> None:
+        """使用後のカーソルを閉じる（共有カーソルは閉じずに残す）."""
+        if cursor is not self._shared_cursor:
+            cursor.close()
 
     def commit(self) -> None:
         """トランザクションをコミットする（connection.commit() のラッパー）."""
@@ -132,12 +190,53 @@ class Sqlym:
             エンティティ、または結果がない場合は None
 
         """
-        rows = self._execute_query(sql_path, params)
+        rows = self._execute_query(sql_path, params, first_only=True)
         if not rows:
             return None
         row_mapper = create_mapper(entity, mapper=mapper)
         return row_mapper.map_row(rows[0])
 
+    def iter_query(
+        self,
+        entity: type[T],
+        sql_path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        mapper: RowMapper[T] | Callable[..., T] | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[T]:
+        """SELECT を実行し、結果をエンティティとして順に返す.
+
+        cursor.fetchmany() で chunk_size 行ずつ取得してマッピングするため、
+        結果全体をメモリに保持しない。SQL はイテレーション開始時に実行される。
+
+        Args:
+            entity: エンティティクラス
+            sql_path: SQL ファイルパス（sql_dir からの相対パス）
+            params: パラメータ辞書
+            mapper: カスタムマッパー（省略時は自動生成）
+            chunk_size: 1回の fetchmany() で取得する行数
+
+        Yields:
+            エンティティ
+
+        """
+        row_mapper = create_mapper(entity, mapper=mapper)
+        result = self._parse(sql_path, params)
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(result.sql, result.params)
+            if cursor.description is None:
+                return
+            columns = [desc[0] for desc in cursor.description]
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                yield from row_mapper.map_rows([dict(zip(columns, row)) for row in chunk])
+        finally:
+            cursor.close()
+
     def execute(
         self,
         sql_path: str,
@@ -157,7 +256,51 @@ class Sqlym:
         try:
             return cursor.rowcount
         finally:
-            cursor.close()
+            self._release_cursor(cursor)
+
+    def execute_many(
+        self,
+        sql_path: str,
+        params_seq: Iterable[dict[str, Any]],
+    ) -> int:
+        """同じ SQL を複数のパラメータで実行し（cursor.executemany）、影響行数を返す.
+
+        テンプレートのパースは SQL ファイルごとに1回だけ行い、ドライバの呼び出しも
+        1回にまとめる。
+
+        Args:
+            sql_path: SQL ファイルパス（sql_dir からの相対パス）
+            params_seq: パラメータ辞書のイテラブル
+
+        Returns:
+            影響を受けた行数
+
+        Raises:
+            SqlParseError: 行削除などによりパラメータごとに SQL が異なる場合
+
+        """
+        parser = self._get_statement(sql_path)
+        named = parser.placeholder == ":name"
+        sql: str | None = None
+        binds: list[Any] = []
+        for params in params_seq:
+            result = parser.parse(params)
+            if sql is None:
+                sql = result.sql
+            elif result.sql != sql:
+                msg = f"execute_many requires the same SQL for every params: {sql_path}"
+                raise SqlParseError(msg)
+            binds.append(result.named_params if named else result.params)
+        if sql is None:
+            return 0
+        cursor = self._cursor()
+        try:
+            cursor.executemany(sql, binds)
+            if self._auto_commit:
+                self._connection.commit()
+            return cursor.rowcount
+        finally:
+            self._release_cursor(cursor)
 
     def insert(
         self,
@@ -178,7 +321,20 @@ class Sqlym:
         try:
             return cursor.lastrowid
         finally:
-            cursor.close()
+            self._release_cursor(cursor)
+
+    def _get_statement(self, sql_path: str) -> TwoWaySQLParser:
+        """SQL ファイルのパーサーを取得する.
+
+        パーサーは SQL テンプレート文字列ごとに共有される（_get_parser）。ファイルの
+        読み込み結果は SqlLoader がキャッシュし、更新されたファイルは読み込み直す。
+        """
+        sql_template = self._loader.load(sql_path, dialect=self._dialect)
+        return _get_parser(sql_template, "?", self._dialect)
+
+    def _parse(self, sql_path: str, params: dict[str, Any] | None) -> ParsedSQL:
+        """SQL ファイルを読み込み、パラメータを適用してパースする."""
+        return self._get_statement(sql_path).parse(params or {})
 
     def _execute_write(
         self,
@@ -195,19 +351,14 @@ class Sqlym:
             実行済みカーソル
 
         """
-        sql_template = self._loader.load(sql_path, dialect=self._dialect)
-        result = parse_sql(
-            sql_template,
-            params or {},
-            dialect=self._dialect,
-        )
-        cursor = self._connection.cursor()
+        result = self._parse(sql_path, params)
+        cursor = self._cursor()
         try:
             cursor.execute(result.sql, result.params)
             if self._auto_commit:
                 self._connection.commit()
         except Exception:
-            cursor.close()
+            self._release_cursor(cursor)
             raise
         return cursor
 
@@ -215,35 +366,38 @@ class Sqlym:
         self,
         sql_path: str,
         params: dict[str, Any] | None,
+        *,
+        first_only: bool = False,
     ) -> list[dict[str, Any]]:
-        """SELECT を実行し、結果を辞書のリストで返す."""
-        sql_template = self._loader.load(sql_path, dialect=self._dialect)
-        result = parse_sql(
-            sql_template,
-            params or {},
-            dialect=self._dialect,
-        )
-        cursor = self._connection.cursor()
+        """SELECT を実行し、結果を辞書のリストで返す.
+
+        first_only が True の場合は先頭1行だけを取得し、残りの行の辞書化を省く。
+        """
+        result = self._parse(sql_path, params)
+        cursor = self._cursor()
         try:
             cursor.execute(result.sql, result.params)
             if cursor.description is None:
                 return []
             columns = [desc[0] for desc in cursor.description]
+            if first_only:
+                row = cursor.fetchone()
+                return [] if row is None else [dict(zip(columns, row))]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
         finally:
-            cursor.close()
+            self._release_cursor(cursor)
 
     def _detect_dialect(self) -> Dialect | None:
-        """Connection オブジェクトから Dialect を自動検出する."""
-        from sqlym.dialect import Dialect
+        """Connection オブジェクトから Dialect を自動検出する.
 
+        接続クラスのトップレベルパッケージ名で判定し、該当しない場合
+        （ドライバをラップしたモジュールなど）はモジュール名の部分一致で判定する。
+        """
         module = type(self._connection).__module__
-        if "sqlite3" in module:
-            return Dialect.SQLITE
-        if "psycopg" in module:
-            return Dialect.POSTGRESQL
-        if "pymysql" in module:
-            return Dialect.MYSQL
-        if "oracledb" in module:
-            return Dialect.ORACLE
+        dialect = _DIALECT_BY_PACKAGE.get(module.partition(".")[0])
+        if dialect is not None:
+            return dialect
+        for package, dialect in _DIALECT_BY_PACKAGE.items():
+            if package in module:
+                return dialect
         return None
@@ -276,6 +276,33 @@ FROM default_table
         assert "FROM default_table" in result.sql
         assert "FROM outer_table" not in result.sql
 
+    def test_nested_elseif_in_selected_branch(self) -> None:
+        """選択された %ELSE 内のネストでも最初に true となる分岐を選択."""
+        sql = """\
+SELECT *
+-- %IF outer
+FROM outer_table
+-- %ELSE
+-- %IF first
+FROM first_table
+-- %ELSEIF second
+FROM second_table
+-- %ELSE
+FROM default_table
+-- %END
+-- %END"""
+        parser = TwoWaySQLParser(sql)
+        result = parser.parse({"outer": False, "first": False, "second": True})
+        assert result.sql == "SELECT *\nFROM second_table"
+
+    def test_deeply_nested_if(self) -> None:
+        """再帰の上限を超える深さのネストも処理できる."""
+        depth = 1500
+        sql = "\n".join(["SELECT *", *["-- %IF cond"] * depth, "FROM t", *["-- %END"] * depth])
+        parser = TwoWaySQLParser(sql)
+        assert parser.parse({"cond": True}).sql == "SELECT *\nFROM t"
+        assert parser.parse({"cond": False}).sql == "SELECT *"
+
 
 class TestErrorCases:
     """エラーケースのテスト."""
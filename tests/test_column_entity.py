@@ -73,6 +73,18 @@ class TestEntityDecorator:
         assert Employee.__column_map__ == {"id": "EMP_ID"}
         assert Employee.__column_naming__ == "camel_to_snake"
 
+    def test_entity_column_map_is_copied(self) -> None:
+        """デコレート後に元の辞書を変更してもマッピングは変わらない."""
+        column_map = {"id": "EMP_ID"}
+
+        @entity(column_map=column_map)
+        @dataclass
+        class Employee:
+            id: int
+
+        column_map["id"] = "OTHER"
+        assert Employee.__column_map__ == {"id": "EMP_ID"}
+
     def test_entity_preserves_class(self) -> None:
         """デコレータ適用後もクラスが正常に動作する."""
 
@@ -40,6 +40,23 @@ class TestDataclassMapperBasic:
         )
         assert users == [User(id=1, name="Alice"), User(id=2, name="Bob")]
 
+    def test_map_rows_case_insensitive_keys(self) -> None:
+        """大文字のカラム名でも map_row と同じ結果になる."""
+        mapper = DataclassMapper(User)
+        rows = [{"ID": 1, "NAME": "Alice"}, {"ID": 2, "NAME": "Bob"}]
+        assert mapper.map_rows(rows) == [mapper.map_row(row) for row in rows]
+
+    def test_map_rows_mixed_key_sets(self) -> None:
+        """キー構成が異なる行が混在しても各行を正しく変換する."""
+        mapper = DataclassMapper(User)
+        users = mapper.map_rows(
+            [
+                {"id": 1, "name": "Alice"},
+                {"NAME": "Bob", "ID": 2},
+            ]
+        )
+        assert users == [User(id=1, name="Alice"), User(id=2, name="Bob")]
+
     def test_map_rows_empty(self) -> None:
         """空リストを渡すと空リストを返す."""
         mapper = DataclassMapper(User)
@@ -264,6 +281,26 @@ class TestMappingCache:
         # 同じマッピング辞書オブジェクトを共有する
         assert mapper1._mapping is mapper2._mapping
 
+    def test_reflection_runs_once_per_class(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """型情報の走査はクラスごとに1回だけ行われる."""
+        DataclassMapper._mapping_cache.clear()
+
+        @dataclass
+        class CachedUser3:
+            id: int
+
+        calls: list[type] = []
+        original = DataclassMapper._build_mapping.__func__  # type: ignore[attr-defined]
+
+        def counting(cls: type[DataclassMapper], entity_cls: type) -> dict[str, str]:
+            calls.append(entity_cls)
+            return original(cls, entity_cls)
+
+        monkeypatch.setattr(DataclassMapper, "_build_mapping", classmethod(counting))
+        DataclassMapper(CachedUser3)
+        DataclassMapper(CachedUser3)
+        assert calls == [CachedUser3]
+
 
 class TestOptionalFields:
     """オプショナルフィールド（デフォルト値あり）の扱い."""
@@ -293,3 +330,15 @@ class TestOptionalFields:
         mapper = DataclassMapper(Employee)
         emp = mapper.map_row({"id": 1, "name": "Alice"})
         assert emp == Employee(id=1, name="Alice", dept_id=None)
+
+    def test_none_value_is_mapped(self) -> None:
+        """行の値が None の場合もキーが存在すれば None をマッピングする."""
+
+        @dataclass
+        class Employee:
+            id: int
+            dept_id: int | None = 99
+
+        mapper = DataclassMapper(Employee)
+        emp = mapper.map_row({"id": 1, "dept_id": None})
+        assert emp == Employee(id=1, dept_id=None)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from sqlym import Dialect, escape_like
 
 
@@ -40,6 +42,16 @@ class TestDialect:
         members = {d.name for d in Dialect}
         assert members == {"SQLITE", "POSTGRESQL", "MYSQL", "ORACLE"}
 
+    def test_usable_as_dict_key(self) -> None:
+        """同一性によるハッシュで、メンバーごとに別のキーとして扱われる."""
+        import pickle
+
+        table = {d: d.name for d in Dialect}
+        assert len(table) == len(Dialect)
+        restored = pickle.loads(pickle.dumps(Dialect.ORACLE))
+        assert restored is Dialect.ORACLE
+        assert table[restored] == "ORACLE"
+
 
 class TestLikeEscapeChars:
     """like_escape_chars プロパティのテスト."""
@@ -67,6 +79,11 @@ class TestLikeEscapeChars:
         for dialect in Dialect:
             assert isinstance(dialect.like_escape_chars, frozenset)
 
+    def test_returns_same_instance(self) -> None:
+        """アクセスごとに新しい frozenset を生成しない."""
+        for dialect in Dialect:
+            assert dialect.like_escape_chars is dialect.like_escape_chars
+
 
 class TestInClauseLimit:
     """in_clause_limit プロパティのテスト."""
@@ -81,6 +98,11 @@ class TestInClauseLimit:
         assert Dialect.POSTGRESQL.in_clause_limit is None
         assert Dialect.MYSQL.in_clause_limit is None
 
+    def test_in_chunk_size(self) -> None:
+        """in_chunk_size は上限なしの場合も int を返す."""
+        assert Dialect.ORACLE.in_chunk_size == 1000
+        assert Dialect.SQLITE.in_chunk_size == sys.maxsize
+
 
 class TestBackslashIsEscape:
     """backslash_is_escape プロパティのテスト."""
@@ -158,6 +180,8 @@ class TestEscapeLike:
         """カスタムエスケープ文字自体もエスケープ対象."""
         # # はデフォルトでエスケープ対象、\ でエスケープ
         assert escape_like("C#", Dialect.SQLITE, escape_char="\\") == "C\\#"
+        # 指定したエスケープ文字自体もエスケープする
+        assert escape_like("a\\b%", Dialect.SQLITE, escape_char="\\") == "a\\\\b\\%"
 
     def test_all_dialects_basic(self) -> None:
         """全 Dialect で基本動作を確認."""
@@ -165,3 +189,17 @@ class TestEscapeLike:
             result = escape_like("test%value_name", dialect)
             assert "#%" in result
             assert "#_" in result
+
+
+class TestDialectEscapeLike:
+    """Dialect.escape_like メソッドのテスト."""
+
+    def test_same_as_function(self) -> None:
+        """escape_like 関数と同じ結果を返す."""
+        for dialect in Dialect:
+            value = "10%_#off"
+            assert dialect.escape_like(value) == escape_like(value, dialect)
+
+    def test_custom_escape_char(self) -> None:
+        """カスタムエスケープ文字を指定できる."""
+        assert Dialect.SQLITE.escape_like("10%off", escape_char="\\") == "10\\%off"
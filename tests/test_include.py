@@ -6,7 +6,8 @@ from pathlib import Path
 import pytest
 
 from sqlym.exceptions import SqlFileNotFoundError, SqlParseError
-from sqlym.parser.tokenizer import parse_includes
+from sqlym.parser import twoway
+from sqlym.parser.tokenizer import INCLUDE_PATTERN, parse_includes
 from sqlym.parser.twoway import TwoWaySQLParser
 
 
@@ -42,6 +43,24 @@ class TestParseIncludes:
         assert includes[0].path == "a.sql"
         assert includes[1].path == "b.sql"
 
+    def test_single_include_matches_pattern(self) -> None:
+        """1つだけのインクルードは INCLUDE_PATTERN と同じ位置・パスを返す."""
+        lines = [
+            'WHERE /* %include "a.sql" */ AND x = 1',
+            "  --  %include 'b.sql'",
+            '/*%include "c.sql"*/',
+            '/* %include "d.sql" ',  # 閉じコメントなし
+            '%include "e.sql"',  # コメント外
+            '/* %include"f.sql" */',  # 空白なし
+        ]
+        for line in lines:
+            expected = [
+                (m.group(1) or m.group(2), m.start(), m.end())
+                for m in INCLUDE_PATTERN.finditer(line)
+            ]
+            actual = [(i.path, i.start, i.end) for i in parse_includes(line)]
+            assert actual == expected, line
+
     def test_no_includes(self) -> None:
         """インクルードなし."""
         line = "SELECT * FROM users"
@@ -96,6 +115,56 @@ class TestIncludeExpansion:
 
             assert "active = 1" in result.sql
 
+    def test_include_reflects_file_update(self) -> None:
+        """インクルードファイルが更新された場合、新しいパーサーは更新後の内容を使う."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            fragment = base_path / "fragment.sql"
+            fragment.write_text("active = 1")
+
+            sql = 'SELECT * FROM users WHERE /* %include "fragment.sql" */'
+            first = TwoWaySQLParser(sql, base_path=base_path).parse({})
+            fragment.write_text("deleted_at IS NULL")
+            second = TwoWaySQLParser(sql, base_path=base_path).parse({})
+
+            assert "active = 1" in first.sql
+            assert "deleted_at IS NULL" in second.sql
+
+    def test_same_parser_reflects_file_update(self) -> None:
+        """同じパーサーでもインクルードファイルの更新を次の parse() から反映する."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            fragment = base_path / "fragment.sql"
+            fragment.write_text("active = 1")
+
+            sql = 'SELECT * FROM users WHERE /* %include "fragment.sql" */'
+            parser = TwoWaySQLParser(sql, base_path=base_path)
+            assert parser.parse({}).sql == "SELECT * FROM users WHERE active = 1"
+            fragment.write_text("id = /* id */0")
+            assert parser.parse({"id": 5}).params == [5]
+            fragment.write_text("id = /* id */0 AND deleted_at IS NULL")
+            result = parser.parse({"id": 5})
+
+            assert result.sql == "SELECT * FROM users WHERE id = ? AND deleted_at IS NULL"
+            assert result.params == [5]
+
+    def test_include_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """インクルードファイルのキャッシュは上限に達するとまとめて破棄される."""
+        monkeypatch.setattr(twoway, "_include_cache", {})
+        monkeypatch.setattr(twoway, "_INCLUDE_CACHE_MAXSIZE", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            for i in range(3):
+                (base_path / f"fragment{i}.sql").write_text(f"id = {i}")
+
+            for i in range(3):
+                sql = f'SELECT * FROM users WHERE /* %include "fragment{i}.sql" */'
+                result = TwoWaySQLParser(sql, base_path=base_path).parse({})
+                assert result.sql == f"SELECT * FROM users WHERE id = {i}"
+                assert len(twoway._include_cache) <= 2
+
+            assert list(twoway._include_cache) == [(base_path / "fragment2.sql").resolve()]
+
     def test_include_without_base_path(self) -> None:
         """base_path なしではインクルードが無効."""
         sql = 'SELECT * FROM users WHERE /* %include "fragment.sql" */'
@@ -185,3 +254,34 @@ WHERE /* %include "condition.sql" */
 
             result2 = parser.parse({"include_condition": False, "status": "pending"})
             assert "WHERE" not in result2.sql
+
+
+class TestIncludeLoader:
+    """include_loader によるインクルードファイル読み込みの差し替えテスト."""
+
+    def test_in_memory_loader(self) -> None:
+        """ファイルシステムを使わずにインクルードを展開できる."""
+        base_path = Path("/virtual/sql").resolve()
+        files = {
+            base_path / "outer.sql": 'id = /* id */1 AND /* %include "inner.sql" */',
+            base_path / "inner.sql": "name = /* name */'default'",
+        }
+        sql = 'SELECT * FROM users WHERE /* %include "outer.sql" */'
+        parser = TwoWaySQLParser(sql, base_path=base_path, include_loader=files.get)
+        result = parser.parse({"id": 10, "name": "John"})
+
+        assert result.sql == "SELECT * FROM users WHERE id = ? AND name = ?"
+        assert result.params == [10, "John"]
+
+    def test_loader_returns_none_raises(self) -> None:
+        """読み込み関数が None を返した場合は SqlFileNotFoundError."""
+        sql = 'SELECT * FROM users WHERE /* %include "missing.sql" */'
+        parser = TwoWaySQLParser(sql, base_path="/virtual", include_loader=lambda path: None)
+        with pytest.raises(SqlFileNotFoundError):
+            parser.parse({})
+
+    def test_fragment_without_directive_is_not_split(self) -> None:
+        """インクルードを含まないフラグメントはそのまま返される."""
+        fragment = "id = /* id */1\n    AND name = /* name */'default'"
+        parser = TwoWaySQLParser("SELECT 1", base_path="/virtual")
+        assert parser._expand_includes(fragment, Path("/virtual"), set()) is fragment
@@ -1,7 +1,7 @@
 """インライン条件分岐（%if/%elseif/%else/%end）のテスト."""
 
 from sqlym.parser.tokenizer import parse_inline_conditions
-from sqlym.parser.twoway import TwoWaySQLParser
+from sqlym.parser.twoway import TwoWaySQLParser, _compile_condition
 
 
 class TestParseInlineConditions:
@@ -40,6 +40,13 @@ class TestParseInlineConditions:
         conditions = parse_inline_conditions(line)
         assert len(conditions) == 2
 
+    def test_short_strings_are_interned(self) -> None:
+        """条件式と短い分岐値は行をまたいで同一オブジェクトを共有する."""
+        first = parse_inline_conditions("SELECT /*%if active */ 'yes' /*%else */ 'no' /*%end*/")
+        second = parse_inline_conditions("WHERE /*%if active */ 'yes' /*%else */ 'no' /*%end*/")
+        assert first[0].conditions[0] is second[0].conditions[0]
+        assert first[0].values[0] is second[0].values[0]
+
     def test_no_inline_conditions(self) -> None:
         """インライン条件分岐なし."""
         line = "SELECT * FROM users"
@@ -124,6 +131,15 @@ class TestInlineConditionWithParams:
         result = parser.parse({"a": True, "val1": "V1", "val2": "V2"})
         assert result.params == ["V1"]
 
+    def test_inline_branch_switch_on_reuse(self) -> None:
+        """同じパーサーで選択ブランチが変わってもパラメータは正しくバインドされる."""
+        sql = "SELECT /*%if a */ /* val1 */'x' /*%else */ /* val2 */'y' /*%end*/ as v"
+        parser = TwoWaySQLParser(sql)
+        first = parser.parse({"a": True, "val1": "V1", "val2": "V2"})
+        second = parser.parse({"a": False, "val1": "V1", "val2": "V2"})
+        assert first.params == ["V1"]
+        assert second.params == ["V2"]
+
     def test_complex_condition_in_inline(self) -> None:
         """複合条件式."""
         sql = "SELECT /*%if a AND b */ 'both' /*%else */ 'not both' /*%end*/ as status"
@@ -134,6 +150,13 @@ class TestInlineConditionWithParams:
         result2 = parser.parse({"a": True, "b": False})
         assert "'not both'" in result2.sql
 
+    def test_condition_compiled_once(self) -> None:
+        """同じ条件式は一度だけ述語に変換され、再利用される."""
+        predicate = _compile_condition("a AND (b OR NOT c)")
+        assert _compile_condition("a AND (b OR NOT c)") is predicate
+        assert predicate({"a": 1, "b": None, "c": None}) is True
+        assert predicate({"a": 1, "b": None, "c": 1}) is False
+
 
 class TestMultipleInlineConditions:
     """複数のインライン条件分岐のテスト."""
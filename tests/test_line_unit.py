@@ -1,5 +1,7 @@
 """LineUnitクラスのテスト."""
 
+import dataclasses
+
 from sqlym.parser.line_unit import LineUnit
 
 
@@ -29,6 +31,11 @@ class TestLineUnitCreation:
         assert unit.indent == 4
         assert unit.content == "AND name = 'test'"
 
+    def test_no_instance_dict(self) -> None:
+        """__slots__ によりインスタンス辞書を持たない."""
+        unit = LineUnit(line_number=1, original="SELECT *", indent=0, content="SELECT *")
+        assert not hasattr(unit, "__dict__")
+
 
 class TestLineUnitIsEmpty:
     """is_emptyプロパティを検証する."""
@@ -53,6 +60,16 @@ class TestLineUnitIsEmpty:
         unit = LineUnit(line_number=1, original="WHERE 1=1", indent=0, content="WHERE 1=1")
         assert unit.is_empty is False
 
+    def test_reflects_mutated_content_and_indent(self) -> None:
+        """生成後に content / indent を変更しても判定が追従する."""
+        unit = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
+        unit.content = "   "
+        assert unit.is_empty is True
+        unit.content = "WHERE"
+        assert unit.is_empty is False
+        unit.indent = -1
+        assert unit.is_empty is True
+
 
 class TestLineUnitParentChild:
     """親子関係の設定を検証する."""
@@ -73,6 +90,52 @@ class TestLineUnitParentChild:
         assert parent.children[0] is child1
         assert parent.children[1] is child2
 
+    def test_add_child_does_not_share_list(self) -> None:
+        """最初の子の追加で行ごとに別のリストが作られる."""
+        first = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
+        second = LineUnit(line_number=2, original="HAVING", indent=0, content="HAVING")
+        child = LineUnit(line_number=3, original="  AND a = 1", indent=2, content="AND a = 1")
+        first.add_child(child)
+        assert first.children == [child]
+        assert second.children == []
+
+    def test_children_passed_to_constructor(self) -> None:
+        """生成時に渡した子のリストをそのまま保持する."""
+        child = LineUnit(line_number=2, original="  AND a = 1", indent=2, content="AND a = 1")
+        children = [child]
+        parent = LineUnit(
+            line_number=1, original="WHERE", indent=0, content="WHERE", children=children
+        )
+        assert parent.children is children
+        parent.add_child(child)
+        assert len(children) == 2
+
+    def test_dataclass_replace_and_fields(self) -> None:
+        """dataclasses.replace / fields がデータクラスとして機能する."""
+        child = LineUnit(line_number=2, original="  AND a = 1", indent=2, content="AND a = 1")
+        unit = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
+        unit.add_child(child)
+        replaced = dataclasses.replace(unit, removed=True)
+        assert replaced.removed is True
+        assert replaced.children == [child]
+        assert [f.name for f in dataclasses.fields(LineUnit)][:7] == [
+            "line_number",
+            "original",
+            "indent",
+            "content",
+            "children",
+            "parent",
+            "removed",
+        ]
+
+    def test_eq_compares_children(self) -> None:
+        """子の差異が等価比較に反映される."""
+        a = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
+        b = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
+        assert a == b
+        a.add_child(LineUnit(line_number=2, original="  x", indent=2, content="x"))
+        assert a != b
+
     def test_parent_child_bidirectional(self) -> None:
         parent = LineUnit(line_number=1, original="WHERE", indent=0, content="WHERE")
         child = LineUnit(line_number=2, original="  AND a = 1", indent=2, content="AND a = 1")
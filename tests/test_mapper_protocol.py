@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from sqlym.mapper.protocol import RowMapper
+from sqlym.mapper.protocol import RowMapper, is_row_mapper
 
 
 @dataclass
@@ -49,6 +49,46 @@ class TestRowMapperProtocol:
 
         assert not isinstance(NotMapper(), RowMapper)
 
+    def test_is_row_mapper_matches_isinstance(self) -> None:
+        """is_row_mapper は isinstance(obj, RowMapper) と同じ判定をする."""
+
+        class MyMapper:
+            def map_row(self, row: dict[str, Any]) -> User:
+                return User(id=row["id"], name=row["name"])
+
+            def map_rows(self, rows: list[dict[str, Any]]) -> list[User]:
+                return [self.map_row(r) for r in rows]
+
+        class NotMapper:
+            def map_rows(self, rows: list[dict[str, Any]]) -> list[User]:
+                return []
+
+        assert is_row_mapper(MyMapper())
+        assert not is_row_mapper(NotMapper())
+        assert not is_row_mapper(lambda row: row)
+
+    def test_is_row_mapper_instance_attributes(self) -> None:
+        """インスタンス属性としてメソッドを持つ場合も RowMapper とみなす."""
+
+        class Holder:
+            pass
+
+        holder = Holder()
+        holder.map_row = lambda row: row  # type: ignore[attr-defined]
+        holder.map_rows = lambda rows: rows  # type: ignore[attr-defined]
+        assert is_row_mapper(holder)
+
+    def test_is_row_mapper_function_with_attributes(self) -> None:
+        """関数でも属性として map_row / map_rows を持てば RowMapper とみなす."""
+
+        def mapper(row: dict[str, Any]) -> dict[str, Any]:
+            return row
+
+        assert not is_row_mapper(mapper)
+        mapper.map_row = mapper  # type: ignore[attr-defined]
+        mapper.map_rows = lambda rows: rows  # type: ignore[attr-defined]
+        assert is_row_mapper(mapper)
+
     def test_custom_mapper_map_row(self) -> None:
         """カスタムマッパーの map_row が正しく動作する."""
 
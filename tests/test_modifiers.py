@@ -9,62 +9,63 @@ from sqlym.parser.tokenizer import tokenize
 from sqlym.parser.twoway import TwoWaySQLParser
 
 
-class TestTokenizerModifiers:
-    """Tokenizer の修飾記号パースのテスト."""
-
-    def test_dollar_modifier(self) -> None:
-        """$ 修飾子が認識される."""
-        tokens = tokenize("/* $name */'default'")
-        assert len(tokens) == 1
-        assert tokens[0].removable is True
-        assert tokens[0].bindless is False
-
-    def test_ampersand_modifier(self) -> None:
-        """& 修飾子が認識される."""
-        tokens = tokenize("/* &flag */'value'")
-        assert len(tokens) == 1
-        assert tokens[0].bindless is True
-        assert tokens[0].removable is False
+@pytest.fixture
+def required_parser() -> TwoWaySQLParser:
+    """@ 必須パラメータを含むパーサー（テストごとに生成する）."""
+    return TwoWaySQLParser("SELECT * FROM users WHERE id = /* @id */1")
 
-    def test_at_modifier(self) -> None:
-        """@ 修飾子が認識される."""
-        tokens = tokenize("/* @id */'1'")
-        assert len(tokens) == 1
-        assert tokens[0].required is True
 
-    def test_question_modifier(self) -> None:
-        """? 修飾子が認識される."""
-        tokens = tokenize("/* ?fallback */'default'")
-        assert len(tokens) == 1
-        assert tokens[0].fallback is True
+@pytest.fixture
+def fallback_parser() -> TwoWaySQLParser:
+    """?a ?b フォールバックを含むパーサー（テストごとに生成する）."""
+    return TwoWaySQLParser("SELECT * FROM users WHERE name = /* ?a ?b */'default'")
 
-    def test_exclamation_modifier(self) -> None:
-        """! 修飾子が認識される."""
-        tokens = tokenize("/* $!name */'default'")
-        assert len(tokens) == 1
-        assert tokens[0].negated is True
-        assert tokens[0].removable is True
 
-    def test_combined_modifiers(self) -> None:
-        """複数の修飾子を組み合わせられる."""
-        tokens = tokenize("/* $!name */'default'")
-        assert tokens[0].removable is True
-        assert tokens[0].negated is True
+class TestTokenizerModifiers:
+    """Tokenizer の修飾記号パースのテスト."""
 
-    def test_no_modifier(self) -> None:
-        """修飾子なしのパラメータ."""
-        tokens = tokenize("/* name */'default'")
+    pytestmark = pytest.mark.tokenizer
+
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param(
+                "/* $name */'default'", {"removable": True, "bindless": False}, id="dollar"
+            ),
+            pytest.param(
+                "/* &flag */'value'", {"bindless": True, "removable": False}, id="ampersand"
+            ),
+            pytest.param("/* @id */'1'", {"required": True}, id="at"),
+            pytest.param("/* ?fallback */'default'", {"fallback": True}, id="question"),
+            pytest.param(
+                "/* $!name */'default'", {"negated": True, "removable": True}, id="combined"
+            ),
+            pytest.param(
+                "/* name */'default'",
+                {
+                    "removable": False,
+                    "bindless": False,
+                    "negated": False,
+                    "required": False,
+                    "fallback": False,
+                },
+                id="none",
+            ),
+        ],
+    )
+    def test_modifier(self, source: str, expected: dict[str, bool]) -> None:
+        """修飾子が対応するトークン属性として認識される."""
+        tokens = tokenize(source)
         assert len(tokens) == 1
-        assert tokens[0].removable is False
-        assert tokens[0].bindless is False
-        assert tokens[0].negated is False
-        assert tokens[0].required is False
-        assert tokens[0].fallback is False
+        for attr, value in expected.items():
+            assert getattr(tokens[0], attr) is value, attr
 
 
 class TestBindlessModifier:
     """& 修飾記号（バインドなし行削除）のテスト."""
 
+    pytestmark = pytest.mark.modifier
+
     def test_bindless_negative_removes_line(self) -> None:
         """& パラメータが negative なら行削除."""
         sql = """\
@@ -101,6 +102,8 @@ WHERE
 class TestNegationModifier:
     """! 否定修飾子のテスト."""
 
+    pytestmark = pytest.mark.modifier
+
     def test_negated_positive_removes_line(self) -> None:
         """$! パラメータが positive なら行削除（反転）."""
         sql = """\
@@ -135,53 +138,45 @@ WHERE
         parser = TwoWaySQLParser(sql)
 
         # is_member=True → WHERE の is_guest 行が削除
-        result = parser.parse({"name": "Alice", "is_member": True})
-        assert "is_guest" not in result.sql
-        assert "name = ?" in result.sql
+        rendered = parser.parse({"name": "Alice", "is_member": True}).sql
+        assert "is_guest" not in rendered
+        assert "name = ?" in rendered
 
         # is_member=None → 行を残す
-        result = parser.parse({"name": "Alice", "is_member": None})
-        assert "is_guest" in result.sql
+        rendered = parser.parse({"name": "Alice", "is_member": None}).sql
+        assert "is_guest" in rendered
 
 
 class TestRequiredModifier:
     """@ 必須パラメータ修飾記号のテスト."""
 
-    def test_required_with_value(self) -> None:
+    pytestmark = pytest.mark.modifier
+
+    def test_required_with_value(self, required_parser: TwoWaySQLParser) -> None:
         """@ パラメータに値があれば正常に処理."""
-        sql = "SELECT * FROM users WHERE id = /* @id */1"
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"id": 100})
+        result = required_parser.parse({"id": 100})
         assert "id = ?" in result.sql
         assert result.params == [100]
 
-    def test_required_none_raises(self) -> None:
+    def test_required_none_raises(self, required_parser: TwoWaySQLParser) -> None:
         """@ パラメータが None なら例外."""
-        sql = "SELECT * FROM users WHERE id = /* @id */1"
-        parser = TwoWaySQLParser(sql)
         with pytest.raises(SqlParseError, match="param='id'"):
-            parser.parse({"id": None})
+            required_parser.parse({"id": None})
 
-    def test_required_false_raises(self) -> None:
+    def test_required_false_raises(self, required_parser: TwoWaySQLParser) -> None:
         """@ パラメータが False なら例外（negative 拡張）."""
-        sql = "SELECT * FROM users WHERE id = /* @id */1"
-        parser = TwoWaySQLParser(sql)
         with pytest.raises(SqlParseError, match="param='id'"):
-            parser.parse({"id": False})
+            required_parser.parse({"id": False})
 
-    def test_required_empty_list_raises(self) -> None:
+    def test_required_empty_list_raises(self, required_parser: TwoWaySQLParser) -> None:
         """@ パラメータが空リストなら例外（negative 拡張）."""
-        sql = "SELECT * FROM users WHERE id = /* @id */1"
-        parser = TwoWaySQLParser(sql)
         with pytest.raises(SqlParseError, match="param='id'"):
-            parser.parse({"id": []})
+            required_parser.parse({"id": []})
 
-    def test_required_missing_raises(self) -> None:
+    def test_required_missing_raises(self, required_parser: TwoWaySQLParser) -> None:
         """@ パラメータが未指定なら例外."""
-        sql = "SELECT * FROM users WHERE id = /* @id */1"
-        parser = TwoWaySQLParser(sql)
         with pytest.raises(SqlParseError, match="param='id'"):
-            parser.parse({})
+            required_parser.parse({})
 
 
 class TestTrailingDelimiterRemoval:
@@ -197,7 +192,7 @@ WHERE
         parser = TwoWaySQLParser(sql)
         result = parser.parse({"age_from": 20, "age_to": None})
         assert "age >= ?" in result.sql
-        assert "AND" not in result.sql.split("\n")[-1]  # 最終行に AND がない
+        assert "AND" not in result.sql.rsplit("\n", 1)[-1]  # 最終行に AND がない
         assert result.params == [20]
 
     def test_trailing_or_removed(self) -> None:
@@ -210,7 +205,7 @@ WHERE
         parser = TwoWaySQLParser(sql)
         result = parser.parse({"status1": "active", "status2": None})
         assert "status = ?" in result.sql
-        assert "OR" not in result.sql.split("\n")[-1]
+        assert "OR" not in result.sql.rsplit("\n", 1)[-1]
 
     def test_trailing_comma_before_paren_removed(self) -> None:
         """閉じ括弧前の行末カンマが除去される."""
@@ -237,31 +232,28 @@ WHERE
     b = /* $b */2 AND
     c = /* $c */3"""
         parser = TwoWaySQLParser(sql)
-        result = parser.parse({"a": 1, "b": None, "c": None})
-        assert "a = ?" in result.sql
-        assert "b" not in result.sql
-        assert "c" not in result.sql
+        rendered = parser.parse({"a": 1, "b": None, "c": None}).sql
+        assert "a = ?" in rendered
+        assert "b" not in rendered
+        assert "c" not in rendered
         # 最終的な SQL に余計な AND がないことを確認
-        clean_sql = " ".join(result.sql.split())
-        assert not clean_sql.rstrip().endswith("AND")
+        assert not rendered.rstrip().endswith("AND")
 
 
 class TestFallbackModifier:
     """? フォールバック修飾記号のテスト."""
 
-    def test_fallback_first_positive(self) -> None:
+    pytestmark = pytest.mark.fallback
+
+    def test_fallback_first_positive(self, fallback_parser: TwoWaySQLParser) -> None:
         """フォールバックチェーンで最初の positive な値を使用."""
-        sql = "SELECT * FROM users WHERE name = /* ?a ?b */'default'"
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"a": "Alice", "b": "Bob"})
+        result = fallback_parser.parse({"a": "Alice", "b": "Bob"})
         assert "name = ?" in result.sql
         assert result.params == ["Alice"]
 
-    def test_fallback_second_positive(self) -> None:
+    def test_fallback_second_positive(self, fallback_parser: TwoWaySQLParser) -> None:
         """最初が negative なら2番目の値を使用."""
-        sql = "SELECT * FROM users WHERE name = /* ?a ?b */'default'"
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"a": None, "b": "Bob"})
+        result = fallback_parser.parse({"a": None, "b": "Bob"})
         assert "name = ?" in result.sql
         assert result.params == ["Bob"]
 
@@ -293,11 +285,9 @@ WHERE
         assert "flag = ?" in result.sql
         assert result.params == [True]
 
-    def test_fallback_empty_list_is_negative(self) -> None:
+    def test_fallback_empty_list_is_negative(self, fallback_parser: TwoWaySQLParser) -> None:
         """空リストは negative として扱われる."""
-        sql = "SELECT * FROM users WHERE name = /* ?a ?b */'default'"
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"a": [], "b": "Bob"})
+        result = fallback_parser.parse({"a": [], "b": "Bob"})
         assert "name = ?" in result.sql
         assert result.params == ["Bob"]
 
@@ -1,7 +1,12 @@
 """複数行文字列リテラルの解析テスト."""
 
+import pytest
+
 from sqlym.parser.twoway import TwoWaySQLParser
 
+# 呼び出しごとのクラス属性参照を避けるため一度だけ束縛する
+is_string_closed = TwoWaySQLParser._is_string_closed
+
 
 class TestMultilineStringLiteral:
     """複数行文字列リテラルの解析."""
@@ -65,15 +70,21 @@ Line 2'"""
         assert "message = ?" in result.sql
         assert result.params == ["Warning:\nFirst\nSecond"]
 
-    def test_string_closed_detection(self) -> None:
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ("SELECT * FROM t", True),
+            ("'hello'", True),
+            ("'hello", False),
+            ("'hello''world'", True),
+            ("'hello''", False),
+            ('"hello"', True),
+            ('"hello', False),
+        ],
+    )
+    def test_string_closed_detection(self, line: str, expected: bool) -> None:
         """文字列クローズ判定."""
-        assert TwoWaySQLParser._is_string_closed("SELECT * FROM t") is True
-        assert TwoWaySQLParser._is_string_closed("'hello'") is True
-        assert TwoWaySQLParser._is_string_closed("'hello") is False
-        assert TwoWaySQLParser._is_string_closed("'hello''world'") is True
-        assert TwoWaySQLParser._is_string_closed("'hello''") is False
-        assert TwoWaySQLParser._is_string_closed('"hello"') is True
-        assert TwoWaySQLParser._is_string_closed('"hello') is False
+        assert is_string_closed(line) is expected
 
     def test_multiline_with_escaped_quotes(self) -> None:
         """エスケープされた引用符を含む複数行文字列."""
@@ -85,3 +96,11 @@ string')"""
         parser = TwoWaySQLParser(sql)
         result = parser.parse({"msg": "Hello\nWorld"})
         assert result.params == ["Hello\nWorld"]
+
+    def test_quote_state_carried_across_lines(self) -> None:
+        """行ごとの走査で引用符の状態を次の行に引き継ぐ."""
+        sql = "SELECT '\nit''s\n\"quoted\"\nend' AS a,\n    b\nFROM t"
+        units = TwoWaySQLParser._split_lines(sql)
+        assert [unit.line_number for unit in units] == [1, 5, 6]
+        assert units[0].original == "SELECT '\nit''s\n\"quoted\"\nend' AS a,"
+        assert units[1].indent == 4
@@ -2,70 +2,56 @@
 
 from __future__ import annotations
 
-from sqlym.parser.twoway import TwoWaySQLParser, is_negative
-
-
-class TestIsNegative:
-    """is_negative 関数のテスト."""
-
-    def test_none_is_negative(self) -> None:
-        """None は negative."""
-        assert is_negative(None) is True
-
-    def test_false_is_negative(self) -> None:
-        """False は negative."""
-        assert is_negative(False) is True
+from typing import Any
 
-    def test_true_is_positive(self) -> None:
-        """True は positive."""
-        assert is_negative(True) is False
+import pytest
 
-    def test_empty_list_is_negative(self) -> None:
-        """空リスト [] は negative."""
-        assert is_negative([]) is True
-
-    def test_list_with_values_is_positive(self) -> None:
-        """値を持つリストは positive."""
-        assert is_negative([1, 2, 3]) is False
-        assert is_negative(["a", "b"]) is False
-
-    def test_list_with_all_none_is_negative(self) -> None:
-        """全要素が None のリストは negative."""
-        assert is_negative([None, None, None]) is True
-
-    def test_list_with_all_false_is_negative(self) -> None:
-        """全要素が False のリストは negative."""
-        assert is_negative([False, False]) is True
-
-    def test_list_with_mixed_negative_is_negative(self) -> None:
-        """全要素が negative（None/False 混在）のリストは negative."""
-        assert is_negative([None, False, None]) is True
-
-    def test_list_with_some_positive_is_positive(self) -> None:
-        """一部でも positive な要素があるリストは positive."""
-        assert is_negative([None, 1, None]) is False
-        assert is_negative([False, "value", False]) is False
+from sqlym.parser.twoway import TwoWaySQLParser, is_negative
 
-    def test_nested_list_all_negative_is_negative(self) -> None:
-        """ネストしたリストで全要素が negative なら negative."""
-        assert is_negative([[], [], []]) is True
-        assert is_negative([[None], [None, None]]) is True
 
-    def test_nested_list_with_positive_is_positive(self) -> None:
-        """ネストしたリストで一部 positive なら positive."""
-        assert is_negative([[1], []]) is False
+@pytest.fixture
+def value_parser() -> TwoWaySQLParser:
+    """$value を1つ含むパーサー（テストごとに生成する）."""
+    return TwoWaySQLParser("SELECT * FROM users\nWHERE value = /* $value */1")
 
-    def test_zero_is_positive(self) -> None:
-        """0 は positive（None/False のみ negative）."""
-        assert is_negative(0) is False
 
-    def test_empty_string_is_positive(self) -> None:
-        """空文字列は positive."""
-        assert is_negative("") is False
+class TestIsNegative:
+    """is_negative 関数のテスト."""
 
-    def test_empty_dict_is_positive(self) -> None:
-        """空辞書は positive（リストのみ特別扱い）."""
-        assert is_negative({}) is False
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(None, id="none"),
+            pytest.param(False, id="false"),
+            pytest.param([], id="empty_list"),
+            pytest.param([None, None, None], id="list_all_none"),
+            pytest.param([False, False], id="list_all_false"),
+            pytest.param([None, False, None], id="list_mixed_negative"),
+            pytest.param([[], [], []], id="nested_all_empty"),
+            pytest.param([[None], [None, None]], id="nested_all_none"),
+        ],
+    )
+    def test_negative(self, value: Any) -> None:
+        """None, False, 空リスト, 全要素が negative のリストは negative."""
+        assert is_negative(value) is True
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(True, id="true"),
+            pytest.param([1, 2, 3], id="list_with_values"),
+            pytest.param(["a", "b"], id="list_with_strings"),
+            pytest.param([None, 1, None], id="list_some_positive"),
+            pytest.param([False, "value", False], id="list_some_positive_str"),
+            pytest.param([[1], []], id="nested_with_positive"),
+            pytest.param(0, id="zero"),
+            pytest.param("", id="empty_string"),
+            pytest.param({}, id="empty_dict"),
+        ],
+    )
+    def test_positive(self, value: Any) -> None:
+        """None/False 以外の値と positive な要素を含むリストは positive."""
+        assert is_negative(value) is False
 
 
 class TestParserWithNegativeExtension:
@@ -138,35 +124,19 @@ WHERE dept_id IN /* $dept_ids */(1, 2, 3)"""
         assert "IN (NULL)" in result.sql
         assert result.params == []
 
-    def test_true_keeps_line(self) -> None:
-        """True は行が残る."""
-        sql = """\
-SELECT * FROM users
-WHERE enabled = /* $enabled */true"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"enabled": True})
-        assert "enabled = ?" in result.sql
-        assert result.params == [True]
-
-    def test_zero_keeps_line(self) -> None:
-        """0 は行が残る（positive）."""
-        sql = """\
-SELECT * FROM users
-WHERE count = /* $count */1"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"count": 0})
-        assert "count = ?" in result.sql
-        assert result.params == [0]
-
-    def test_empty_string_keeps_line(self) -> None:
-        """空文字列は行が残る（positive）."""
-        sql = """\
-SELECT * FROM users
-WHERE name = /* $name */'default'"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"name": ""})
-        assert "name = ?" in result.sql
-        assert result.params == [""]
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(True, id="true"),
+            pytest.param(0, id="zero"),
+            pytest.param("", id="empty_string"),
+        ],
+    )
+    def test_positive_keeps_line(self, value_parser: TwoWaySQLParser, value: Any) -> None:
+        """True, 0, 空文字列は positive なので行が残る."""
+        result = value_parser.parse({"value": value})
+        assert "value = ?" in result.sql
+        assert result.params == [value]
 
 
 class TestParserNegativeWithParentRemoval:
@@ -2,68 +2,48 @@
 
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass
 from typing import Annotated
 
-from sqlym.mapper.column import Column  # get_type_hints がアノテーション文字列を解決するために必要
-
-
-class TestPublicImports:
-    """sqly パッケージからの公開インポート."""
-
-    def test_import_parse_sql(self) -> None:
-        """parse_sql をインポートできる."""
-        from sqlym import parse_sql
-
-        assert callable(parse_sql)
-
-    def test_import_twoway_sql_parser(self) -> None:
-        """TwoWaySQLParser をインポートできる."""
-        from sqlym import TwoWaySQLParser
-
-        assert TwoWaySQLParser is not None
-
-    def test_import_parsed_sql(self) -> None:
-        """ParsedSQL をインポートできる."""
-        from sqlym import ParsedSQL
+import pytest
 
-        assert ParsedSQL is not None
-
-    def test_import_create_mapper(self) -> None:
-        """create_mapper をインポートできる."""
-        from sqlym import create_mapper
-
-        assert callable(create_mapper)
-
-    def test_import_row_mapper(self) -> None:
-        """RowMapper をインポートできる."""
-        from sqlym import RowMapper
-
-        assert RowMapper is not None
-
-    def test_import_manual_mapper(self) -> None:
-        """ManualMapper をインポートできる."""
-        from sqlym import ManualMapper
+from sqlym import ParsedSQL, create_mapper, parse_sql
+from sqlym.mapper.column import Column  # get_type_hints がアノテーション文字列を解決するために必要
 
-        assert ManualMapper is not None
 
-    def test_import_column(self) -> None:
-        """Column をインポートできる."""
-        from sqlym import Column
+@dataclass
+class Employee:
+    """エンドツーエンドテスト用エンティティ.
 
-        assert Column is not None
+    モジュールレベルで定義し、DataclassMapper の型情報走査をクラスごとに1回に抑える。
+    """
 
-    def test_import_entity(self) -> None:
-        """Entity をインポートできる."""
-        from sqlym import entity
+    id: int
+    name: Annotated[str, Column("EMP_NAME")]
 
-        assert callable(entity)
 
-    def test_import_sql_loader(self) -> None:
-        """SqlLoader をインポートできる."""
-        from sqlym import SqlLoader
+class TestPublicImports:
+    """sqly パッケージからの公開インポート."""
 
-        assert SqlLoader is not None
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "parse_sql",
+            "TwoWaySQLParser",
+            "ParsedSQL",
+            "create_mapper",
+            "RowMapper",
+            "ManualMapper",
+            "Column",
+            "entity",
+            "SqlLoader",
+        ],
+    )
+    def test_import(self, name: str) -> None:
+        """公開名を sqlym パッケージから取得できる."""
+        module = importlib.import_module("sqlym")
+        assert callable(getattr(module, name))
 
     def test_import_exceptions(self) -> None:
         """例外クラスをインポートできる."""
@@ -100,31 +80,31 @@ class TestParseSqlFunction:
 
     def test_basic_parse(self) -> None:
         """基本のパース."""
-        from sqlym import parse_sql
-
         result = parse_sql(
             "SELECT * FROM users WHERE name = /* $name */'default'",
             {"name": "Alice"},
         )
-        assert result.sql == "SELECT * FROM users WHERE name = ?"
-        assert result.params == ["Alice"]
+        assert result == ParsedSQL(
+            sql="SELECT * FROM users WHERE name = ?",
+            params=["Alice"],
+            named_params={"name": "Alice"},
+        )
 
     def test_placeholder_percent_s(self) -> None:
         """Placeholder に %s を指定."""
-        from sqlym import parse_sql
-
         result = parse_sql(
             "SELECT * FROM users WHERE name = /* $name */'default'",
             {"name": "Alice"},
             placeholder="%s",
         )
-        assert result.sql == "SELECT * FROM users WHERE name = %s"
-        assert result.params == ["Alice"]
+        assert result == ParsedSQL(
+            sql="SELECT * FROM users WHERE name = %s",
+            params=["Alice"],
+            named_params={"name": "Alice"},
+        )
 
     def test_placeholder_named(self) -> None:
         """Placeholder に :name を指定."""
-        from sqlym import parse_sql
-
         result = parse_sql(
             "SELECT * FROM users WHERE name = /* $name */'default'",
             {"name": "Alice"},
@@ -136,19 +116,23 @@ class TestParseSqlFunction:
 
     def test_returns_parsed_sql(self) -> None:
         """戻り値が ParsedSQL インスタンス."""
-        from sqlym import ParsedSQL, parse_sql
-
         result = parse_sql("SELECT 1", {})
         assert isinstance(result, ParsedSQL)
 
+    def test_parser_reused_for_same_template(self) -> None:
+        """同じテンプレートはパーサーを再利用し、パラメータごとに評価し直す."""
+        from sqlym._parse import _get_parser
+
+        sql = "SELECT * FROM users\nWHERE\n    name = /* $name */'default'"
+        assert _get_parser(sql, "?", None) is _get_parser(sql, "?", None)
+        assert parse_sql(sql, {"name": "Alice"}).params == ["Alice"]
+        assert parse_sql(sql, {"name": None}).sql == "SELECT * FROM users"
+
     def test_line_removal(self) -> None:
         """行削除が動作する."""
-        from sqlym import parse_sql
-
         sql = "SELECT * FROM users\nWHERE\n    name = /* $name */'default'"
         result = parse_sql(sql, {"name": None})
-        assert result.sql == "SELECT * FROM users"
-        assert result.params == []
+        assert result == ParsedSQL(sql="SELECT * FROM users", named_params={"name": None})
 
 
 class TestEndToEndImport:
@@ -156,13 +140,6 @@ class TestEndToEndImport:
 
     def test_full_workflow_imports(self) -> None:
         """設計ドキュメントのインポートパターンが動作する."""
-        from sqlym import create_mapper, parse_sql
-
-        @dataclass
-        class Employee:
-            id: int
-            name: Annotated[str, Column("EMP_NAME")]
-
         result = parse_sql(
             "SELECT * FROM employees WHERE id = /* $id */1",
             {"id": 100},
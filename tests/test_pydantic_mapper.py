@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
+from typing import Any
+
 import pytest
 
 from sqlym.mapper.protocol import RowMapper
@@ -114,6 +118,18 @@ class TestPydanticMapperAliasFields:
         assert emp.id == 1
         assert emp.name == "Alice"
 
+    def test_alias_without_populate_by_name(self) -> None:
+        """populate_by_name なしの alias モデルも行のキーのまま変換できる."""
+        from pydantic import Field
+
+        class Employee(BaseModel):
+            id: int = Field(alias="EMP_ID")
+            name: str = Field(alias="EMP_NAME")
+
+        mapper = PydanticMapper(Employee)
+        rows = [{"EMP_ID": 1, "EMP_NAME": "Alice"}, {"EMP_ID": 2, "EMP_NAME": "Bob"}]
+        assert [(e.id, e.name) for e in mapper.map_rows(rows)] == [(1, "Alice"), (2, "Bob")]
+
 
 class TestPydanticMapperNonBaseModel:
     """BaseModel でないクラスを渡した場合."""
@@ -126,3 +142,110 @@ class TestPydanticMapperNonBaseModel:
 
         with pytest.raises(TypeError):
             PydanticMapper(NotPydantic)
+
+
+class TestPydanticMapperIncompleteModel:
+    """スキーマ構築が完了していないモデルの扱い."""
+
+    def test_model_rebuilt_after_mapper_creation(self) -> None:
+        """マッパー作成後に model_rebuild したモデルも変換できる."""
+
+        class Employee(BaseModel):
+            id: int
+            dept: Dept | None = None
+
+        mapper = PydanticMapper(Employee)
+
+        class Dept(BaseModel):
+            name: str
+
+        Employee.model_rebuild(_types_namespace={"Dept": Dept})
+        emp = mapper.map_row({"id": 1, "dept": {"name": "Sales"}})
+        assert emp.dept == Dept(name="Sales")
+
+
+class TestPydanticMapperBatch:
+    """map_rows の一括検証."""
+
+    def test_list_validator_cached_per_model(self) -> None:
+        """一括検証用の TypeAdapter はモデルごとに1回だけ構築される."""
+        PydanticMapper(User).map_rows([{"id": 1, "name": "Alice"}])
+        validate = PydanticMapper._get_list_validate(User)
+        PydanticMapper(User).map_rows([{"id": 2, "name": "Bob"}])
+        assert PydanticMapper._get_list_validate(User) is validate
+
+    def test_list_validator_not_inherited(self) -> None:
+        """サブクラスは親モデルの一括検証関数を使わない."""
+        PydanticMapper(User).map_rows([{"id": 1, "name": "Alice"}])
+
+        class Admin(User):
+            level: int
+
+        rows = PydanticMapper(Admin).map_rows([{"id": 1, "name": "Alice", "level": 3}])
+        assert rows == [Admin(id=1, name="Alice", level=3)]
+
+    def test_temporary_model_is_collected(self) -> None:
+        """一括検証関数のキャッシュが動的に生成したモデルを解放不能にしない."""
+        model = pydantic.create_model("Temporary", id=(int, ...))
+        assert PydanticMapper(model).map_rows([{"id": 1}])[0].id == 1
+        ref = weakref.ref(model)
+        del model
+        gc.collect()
+        assert ref() is None
+
+    def test_map_rows_validation_error(self) -> None:
+        """一括検証でも不正な行で ValidationError が発生する."""
+        mapper = PydanticMapper(User)
+        with pytest.raises(pydantic.ValidationError):
+            mapper.map_rows([{"id": 1, "name": "Alice"}, {"id": "x", "name": "Bob"}])
+
+    def test_map_rows_error_reports_first_invalid_row(self) -> None:
+        """一括検証の失敗時も map_row と同じ行単位の ValidationError を送出する."""
+        rows = [{"id": 1, "name": "Alice"}, {"id": "x", "name": "Bob"}, {"id": "y"}]
+        with pytest.raises(pydantic.ValidationError) as exc_info:
+            PydanticMapper(User).map_rows(rows)
+        assert exc_info.value.title == "User"
+        assert [error["loc"] for error in exc_info.value.errors()] == [("id",)]
+
+
+class TestPydanticMapperCustomModelValidate:
+    """model_validate を上書きしたモデル."""
+
+    class LowerKeyUser(BaseModel):
+        """キーを小文字に変換してから検証するモデル."""
+
+        id: int
+        name: str
+
+        @classmethod
+        def model_validate(cls, obj: Any, **kwargs: Any) -> Any:
+            """キーを小文字に変換して検証する."""
+            return super().model_validate({k.lower(): v for k, v in obj.items()}, **kwargs)
+
+    def test_map_row_uses_model_validate(self) -> None:
+        """map_row は上書きした model_validate を経由する."""
+        user = PydanticMapper(self.LowerKeyUser).map_row({"ID": 1, "NAME": "a"})
+        assert user == self.LowerKeyUser(id=1, name="a")
+
+    def test_map_rows_uses_model_validate(self) -> None:
+        """map_rows も一括検証せずに上書きした model_validate を経由する."""
+        users = PydanticMapper(self.LowerKeyUser).map_rows([{"ID": 1, "NAME": "a"}])
+        assert users == [self.LowerKeyUser(id=1, name="a")]
+
+
+class TestPydanticMapperTrustInput:
+    """trust_input=True による検証の省略."""
+
+    def test_map_row_skips_validation(self) -> None:
+        """検証・型変換を行わずに値をそのまま設定する."""
+        mapper = PydanticMapper(User, trust_input=True)
+        user = mapper.map_row({"id": "42", "name": "Alice"})
+        assert user.id == "42"
+        assert user.name == "Alice"
+
+    def test_map_rows_skips_validation(self) -> None:
+        """複数行でも不正な値で ValidationError にならない."""
+        mapper = PydanticMapper(User, trust_input=True)
+        users = mapper.map_rows([{"id": 1, "name": "Alice"}, {"id": "x", "name": "Bob"}])
+        assert [u.id for u in users] == [1, "x"]
+        assert all(isinstance(u, User) for u in users)
@@ -73,6 +73,16 @@ class TestSqlLoaderBasePath:
         loader = SqlLoader()
         assert loader.base_path == Path("sql")
 
+    def test_missing_relative_base_path_resolved_on_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """初期化時に存在しない相対パスは load 時の作業ディレクトリで解決する."""
+        monkeypatch.chdir(tmp_path)
+        loader = SqlLoader("sql")
+        (tmp_path / "sql").mkdir()
+        (tmp_path / "sql" / "find.sql").write_text("SELECT 1", encoding="utf-8")
+        assert loader.load("find.sql") == "SELECT 1"
+
 
 class TestSqlLoaderFileNotFound:
     """ファイルが見つからない場合."""
@@ -104,6 +114,17 @@ class TestSqlLoaderFileNotFound:
         with pytest.raises(SqlFileNotFoundError):
             loader.load("../outside.sql")
 
+    def test_sibling_directory_with_same_prefix_rejected(self, tmp_path: Path) -> None:
+        """base_path と同じ接頭辞を持つ隣のディレクトリは拒否する."""
+        base_dir = tmp_path / "base"
+        base_dir.mkdir()
+        sibling = tmp_path / "base2"
+        sibling.mkdir()
+        (sibling / "outside.sql").write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(base_dir)
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("../base2/outside.sql")
+
 
 class TestSqlLoaderEncoding:
     """ファイルエンコーディング."""
@@ -119,6 +140,123 @@ class TestSqlLoaderEncoding:
         sql = loader.load("test.sql")
         assert "'太郎'" in sql
 
+    def test_identical_content_shared(self, tmp_path: Path) -> None:
+        """内容が同じファイルは同一の文字列オブジェクトとして読み込まれる."""
+        (tmp_path / "a.sql").write_text("SELECT * FROM users", encoding="utf-8")
+        (tmp_path / "b.sql").write_text("SELECT * FROM users", encoding="utf-8")
+        loader = SqlLoader(tmp_path)
+        assert loader.load("a.sql") is loader.load("b.sql")
+
+    def test_crlf_normalized(self, tmp_path: Path) -> None:
+        """CRLF の改行は LF に統一される（Path.read_text と同じ）."""
+        (tmp_path / "test.sql").write_bytes(b"SELECT *\r\nFROM users\r\n")
+        loader = SqlLoader(tmp_path)
+        assert loader.load("test.sql") == "SELECT *\nFROM users\n"
+
+    def test_directory_is_not_loaded(self, tmp_path: Path) -> None:
+        """ディレクトリはファイルとして読み込まない."""
+        (tmp_path / "dir.sql").mkdir()
+        loader = SqlLoader(tmp_path)
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("dir.sql")
+
+
+class TestSqlLoaderCache:
+    """読み込み結果のキャッシュ."""
+
+    def test_cached_while_file_unchanged(self, tmp_path: Path) -> None:
+        """ファイルが更新されていない間は同じ内容を返す."""
+        (tmp_path / "test.sql").write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(tmp_path)
+        first = loader.load("test.sql")
+        assert loader.load("test.sql") is first
+        loader.cache_clear()
+        assert loader.load("test.sql") == "SELECT 1"
+
+    def test_reflects_file_update(self, tmp_path: Path) -> None:
+        """更新されたファイルは cache_clear() なしで読み込み直す."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(tmp_path)
+        assert loader.load("test.sql") == "SELECT 1"
+        sql_file.write_text("SELECT 10", encoding="utf-8")
+        assert loader.load("test.sql") == "SELECT 10"
+
+    def test_file_created_after_miss(self, tmp_path: Path) -> None:
+        """見つからなかった結果はキャッシュせず、後から作成したファイルを読み込める."""
+        loader = SqlLoader(tmp_path)
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("new.sql")
+        (tmp_path / "new.sql").write_text("SELECT 1", encoding="utf-8")
+        assert loader.load("new.sql") == "SELECT 1"
+
+    def test_deleted_file_raises(self, tmp_path: Path) -> None:
+        """読み込み済みのファイルが削除されたら SqlFileNotFoundError."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(tmp_path)
+        assert loader.load("test.sql") == "SELECT 1"
+        sql_file.unlink()
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("test.sql")
+
+    def test_cache_disabled(self, tmp_path: Path) -> None:
+        """cache=False の場合は毎回ファイルを読み込む."""
+        sql_file = tmp_path / "test.sql"
+        sql_file.write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(tmp_path, cache=False)
+        assert loader.load("test.sql") == "SELECT 1"
+        sql_file.write_text("SELECT 2", encoding="utf-8")
+        assert loader.load("test.sql") == "SELECT 2"
+        loader.cache_clear()
+
+    def test_cache_keyed_by_dialect(self, dialect_sql_dir: Path) -> None:
+        """同じパスでも dialect ごとに別々にキャッシュされる."""
+        loader = SqlLoader(dialect_sql_dir)
+        assert "ROWNUM" in loader.load("find.sql", dialect=Dialect.ORACLE)
+        assert loader.load("find.sql") == "SELECT * FROM t"
+
+    def test_rejected_path_still_raises(self, tmp_path: Path) -> None:
+        """拒否されたパスは2回目以降も SqlFileNotFoundError."""
+        loader = SqlLoader(tmp_path)
+        for _ in range(2):
+            with pytest.raises(SqlFileNotFoundError):
+                loader.load("../outside.sql")
+
+
+class TestSqlLoaderIndex:
+    """ファイル一覧による存在確認."""
+
+    def test_load_with_index(self, sql_dir: Path) -> None:
+        """一覧に含まれるファイルを読み込める（./ 付きのパスも正規化される）."""
+        loader = SqlLoader(sql_dir, index=True)
+        assert loader.load("employee/find_all.sql") == "SELECT * FROM employees"
+        assert loader.load("./department/find_all.sql") == "SELECT * FROM departments"
+
+    def test_dialect_fallback_with_index(self, dialect_sql_dir: Path) -> None:
+        """一覧にない方言固有ファイルは汎用ファイルにフォールバックする."""
+        loader = SqlLoader(dialect_sql_dir, index=True)
+        assert "ROWNUM" in loader.load("find.sql", dialect=Dialect.ORACLE)
+        assert loader.load("find.sql", dialect=Dialect.SQLITE) == "SELECT * FROM t"
+
+    def test_new_file_found_after_refresh(self, tmp_path: Path) -> None:
+        """初期化後に追加したファイルは refresh() 後に見つかる."""
+        loader = SqlLoader(tmp_path, index=True)
+        (tmp_path / "new.sql").write_text("SELECT 1", encoding="utf-8")
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("new.sql")
+        loader.refresh()
+        assert loader.load("new.sql") == "SELECT 1"
+
+    def test_path_traversal_rejected_with_index(self, tmp_path: Path) -> None:
+        """一覧があっても base_path 外のファイルは拒否される."""
+        base_dir = tmp_path / "base"
+        base_dir.mkdir()
+        (tmp_path / "outside.sql").write_text("SELECT 1", encoding="utf-8")
+        loader = SqlLoader(base_dir, index=True)
+        with pytest.raises(SqlFileNotFoundError):
+            loader.load("../outside.sql")
+
 
 @pytest.fixture
 def dialect_sql_dir(tmp_path: Path) -> Path:
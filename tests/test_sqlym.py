@@ -10,10 +10,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from sqlym import Dialect, Sqlym
+from sqlym import Dialect, SqlParseError, Sqlym
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """テスト用ユーザーエンティティ."""
 
@@ -38,6 +38,42 @@ class TestSqlymInit:
         db = Sqlym(conn, sql_dir="custom/sql")
         assert db._loader.base_path == Path("custom/sql")
 
+    def test_loader_created_lazily(self) -> None:
+        """SqlLoader は初回アクセス時に1回だけ生成される."""
+        db = Sqlym(MagicMock(), sql_dir="custom/sql")
+        assert "_loader" not in vars(db)
+        assert db._loader is db._loader
+
+    def test_loader_shared_by_sql_dir(self, tmp_path: Path) -> None:
+        """同じ sql_dir を指す Sqlym は SqlLoader を共有する."""
+        first = Sqlym(MagicMock(), sql_dir=tmp_path)
+        second = Sqlym(MagicMock(), sql_dir=str(tmp_path / "."))
+        other = Sqlym(MagicMock(), sql_dir=tmp_path / "other")
+        assert first._loader is second._loader
+        assert first._loader is not other._loader
+
+    def test_loader_not_shared_for_missing_relative_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """まだ存在しない相対パスの sql_dir は作業ディレクトリに依存するため共有しない."""
+        monkeypatch.chdir(tmp_path)
+        first = Sqlym(MagicMock(), sql_dir="missing_sql")
+        second = Sqlym(MagicMock(), sql_dir="missing_sql")
+        assert first._loader is not second._loader
+
+        (tmp_path / "missing_sql").mkdir()
+        third = Sqlym(MagicMock(), sql_dir="missing_sql")
+        fourth = Sqlym(MagicMock(), sql_dir="missing_sql")
+        assert third._loader is fourth._loader
+
+    def test_sql_cache_disabled(self, tmp_path: Path) -> None:
+        """sql_cache=False の場合はキャッシュしないローダーを使う."""
+        cached = Sqlym(MagicMock(), sql_dir=tmp_path)
+        uncached = Sqlym(MagicMock(), sql_dir=tmp_path, sql_cache=False)
+        assert uncached._loader is not cached._loader
+        assert uncached._loader._cache is None
+        assert Sqlym(MagicMock(), sql_dir=tmp_path, sql_cache=False)._loader is uncached._loader
+
     def test_init_with_dialect(self) -> None:
         """Dialect を指定できる."""
         conn = MagicMock()
@@ -81,6 +117,21 @@ class TestSqlymDialectDetection:
         db = Sqlym(conn)
         assert db._dialect == Dialect.ORACLE
 
+    @pytest.mark.parametrize(
+        ("module", "expected"),
+        [
+            ("psycopg2.extensions", Dialect.POSTGRESQL),
+            ("MySQLdb.connections", Dialect.MYSQL),
+            ("cx_Oracle", Dialect.ORACLE),
+            ("myapp.db.sqlite3_wrapper", Dialect.SQLITE),
+        ],
+    )
+    def test_detect_other_drivers(self, module: str, expected: Dialect) -> None:
+        """他のドライバやドライバをラップしたモジュールからも検出できる."""
+        conn = MagicMock()
+        conn.__class__.__module__ = module
+        assert Sqlym(conn)._dialect == expected
+
     def test_detect_unknown(self) -> None:
         """不明な connection の場合は None."""
         conn = MagicMock()
@@ -242,6 +293,37 @@ WHERE id = /* id */0
         user = db.query_one(User, "users/find_by_id.sql", {"id": 999})
         assert user is None
 
+    def test_query_one_fetches_first_row_only(self, db: Sqlym) -> None:
+        """query_one() は複数行ヒットしても先頭行だけを返す."""
+        user = db.query_one(User, "users/find.sql", {"status": "active"})
+        assert user == User(id=1, name="Alice", status="active")
+
+    def test_same_sql_file_evaluated_per_params(self, db: Sqlym) -> None:
+        """同じ SQL ファイルでもパラメータごとに評価し直す."""
+        active = db.query(User, "users/find.sql", {"status": "active"})
+        inactive = db.query(User, "users/find.sql", {"status": "inactive"})
+        assert [u.name for u in active] == ["Alice", "Charlie"]
+        assert [u.name for u in inactive] == ["Bob"]
+
+    def test_sql_file_update_reflected(self, db: Sqlym, sql_dir: Path) -> None:
+        """実行済みの SQL ファイルを更新すると次の実行から反映される."""
+        assert db.query_one(User, "users/find_by_id.sql", {"id": 1}) is not None
+        (sql_dir / "users" / "find_by_id.sql").write_text(
+            "SELECT id, name, status\nFROM users\nWHERE id = /* id */0 AND status = 'none'\n"
+        )
+        assert db.query_one(User, "users/find_by_id.sql", {"id": 1}) is None
+
+    def test_iter_query(self, db: Sqlym) -> None:
+        """iter_query() は chunk_size 行ずつ取得しても query() と同じ結果を返す."""
+        params = {"status": None}
+        users = list(db.iter_query(User, "users/find.sql", params, chunk_size=2))
+        assert users == db.query(User, "users/find.sql", params)
+        assert [u.name for u in users] == ["Alice", "Bob", "Charlie"]
+
+    def test_iter_query_no_results(self, db: Sqlym) -> None:
+        """iter_query() で結果がない場合は何も返さない."""
+        assert list(db.iter_query(User, "users/find.sql", {"status": "unknown"})) == []
+
     def test_execute_insert(self, db: Sqlym) -> None:
         """execute() で INSERT できる."""
         affected = db.execute(
@@ -254,6 +336,28 @@ WHERE id = /* id */0
         assert user is not None
         assert user.name == "David"
 
+    def test_execute_many(self, db: Sqlym) -> None:
+        """execute_many() で複数行をまとめて INSERT できる."""
+        affected = db.execute_many(
+            "users/insert.sql",
+            [
+                {"id": 4, "name": "David", "status": "active"},
+                {"id": 5, "name": "Eve", "status": "inactive"},
+            ],
+        )
+        assert affected == 2
+        users = db.query(User, "users/find.sql", {"status": None})
+        assert [u.name for u in users][-2:] == ["David", "Eve"]
+
+    def test_execute_many_empty(self, db: Sqlym) -> None:
+        """execute_many() にパラメータがない場合は何も実行しない."""
+        assert db.execute_many("users/insert.sql", []) == 0
+
+    def test_execute_many_sql_mismatch(self, db: Sqlym) -> None:
+        """パラメータによって SQL が変わる場合は SqlParseError."""
+        with pytest.raises(SqlParseError):
+            db.execute_many("users/find.sql", [{"status": "active"}, {"status": None}])
+
     def test_execute_update(self, db: Sqlym) -> None:
         """execute() で UPDATE できる."""
         affected = db.execute("users/update.sql", {"id": 1, "name": "Alice Updated"})
@@ -331,6 +435,74 @@ class TestSqlymAutoCommit:
         conn.commit.assert_not_called()
 
 
+class TestSqlymReuseCursor:
+    """reuse_cursor モードのテスト."""
+
+    def test_cursor_reused_until_close(self, tmp_path: Path) -> None:
+        """reuse_cursor=True の場合、カーソルは1回だけ生成され close_cursor() で閉じられる."""
+        (tmp_path / "update.sql").write_text("UPDATE users SET name = /* name */''")
+        conn = MagicMock()
+        cursor = MagicMock()
+        cursor.rowcount = 1
+        conn.cursor.return_value = cursor
+
+        db = Sqlym(conn, sql_dir=tmp_path, reuse_cursor=True)
+        db.execute("update.sql", {"name": "a"})
+        db.execute("update.sql", {"name": "b"})
+
+        conn.cursor.assert_called_once()
+        cursor.close.assert_not_called()
+        db.close_cursor()
+        cursor.close.assert_called_once()
+        conn.close.assert_not_called()
+
+    def test_connection_exit_runs_when_cursor_close_fails(self, tmp_path: Path) -> None:
+        """共有カーソルを閉じる際の例外でも connection の __exit__ は呼ばれる."""
+        (tmp_path / "update.sql").write_text("UPDATE users SET name = /* name */''")
+        conn = MagicMock()
+        cursor = MagicMock()
+        cursor.close.side_effect = RuntimeError("close failed")
+        conn.cursor.return_value = cursor
+
+        with (
+            pytest.raises(RuntimeError, match="close failed"),
+            Sqlym(conn, sql_dir=tmp_path, reuse_cursor=True) as db,
+        ):
+            db.execute("update.sql", {"name": "a"})
+
+        conn.__exit__.assert_called_once_with(None, None, None)
+
+    def test_cursor_closed_per_call_by_default(self, tmp_path: Path) -> None:
+        """デフォルトでは SQL の実行ごとにカーソルを閉じる."""
+        (tmp_path / "update.sql").write_text("UPDATE users SET name = /* name */''")
+        conn = MagicMock()
+        cursor = MagicMock()
+        cursor.rowcount = 1
+        conn.cursor.return_value = cursor
+
+        db = Sqlym(conn, sql_dir=tmp_path)
+        db.execute("update.sql", {"name": "a"})
+        db.execute("update.sql", {"name": "b"})
+
+        assert conn.cursor.call_count == 2
+        assert cursor.close.call_count == 2
+
+    def test_reused_cursor_with_sqlite(self, tmp_path: Path) -> None:
+        """SQLite で共有カーソルを使って参照と更新を交互に実行できる."""
+        (tmp_path / "find.sql").write_text("SELECT id, name FROM users WHERE id = /* id */0")
+        (tmp_path / "insert.sql").write_text(
+            "INSERT INTO users (id, name) VALUES (/* id */0, /* name */'')"
+        )
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)")
+        with Sqlym(conn, sql_dir=tmp_path, reuse_cursor=True) as db:
+            assert db.insert("insert.sql", {"id": 1, "name": "Alice"}) == 1
+            assert db.query_one(User, "find.sql", {"id": 1}) == User(id=1, name="Alice")
+            assert db.execute("insert.sql", {"id": 2, "name": "Bob"}) == 1
+            assert db.query(User, "find.sql", {"id": 2}) == [User(id=2, name="Bob")]
+        assert db._shared_cursor is None
+
+
 class TestSqlymWithContextManager:
     """コンテキストマネージャを使った統合テスト."""
 
@@ -1,7 +1,11 @@
 """Tokenizerのテスト."""
 
+import pytest
+
 from sqlym.parser.tokenizer import Token, tokenize
 
+pytestmark = pytest.mark.tokenizer
+
 
 class TestTokenizeRemovableParam:
     """$付きパラメータ（削除可能）のトークン化を検証する."""
@@ -90,6 +94,16 @@ class TestTokenizeInClause:
         assert len(tokens) == 1
         assert tokens[0].is_in_clause is True
 
+    def test_in_keyword_elsewhere_in_line(self) -> None:
+        """INNER JOIN など IN を含むだけの行は IN 句として扱わない."""
+        tokens = tokenize("INNER JOIN d ON d.id = e.dept_id AND d.code = /* code */'A' JOIN x IN")
+        assert len(tokens) == 1
+        assert tokens[0].is_in_clause is False
+
+    def test_second_comment_in_clause(self) -> None:
+        tokens = tokenize("WHERE a = /* a */1 AND id IN\t/* ids */(1)")
+        assert [t.is_in_clause for t in tokens] == [False, True]
+
 
 class TestTokenizeMultipleParams:
     """1行に複数パラメータがある場合を検証する."""
@@ -107,6 +121,12 @@ class TestTokenizeMultipleParams:
         assert tokens[0].removable is True
         assert tokens[1].removable is False
 
+    def test_same_name_shared_across_lines(self) -> None:
+        """同じパラメータ名は行が異なっても同一の文字列オブジェクトになる."""
+        first = tokenize("WHERE dept_id = /* $dept_id */1")
+        second = tokenize("AND d.id IN /* dept_id */(1) OR x = /* ?dept_id ?y */2")
+        assert all(token.name is first[0].name for token in second)
+
 
 class TestTokenizeNoParams:
     """パラメータなしの行を検証する."""
@@ -170,3 +190,8 @@ class TestTokenFrozen:
             raise AssertionError(msg)
         except AttributeError:
             pass
+
+    def test_token_has_no_instance_dict(self) -> None:
+        """__slots__ によりインスタンス辞書を持たない."""
+        t = Token(name="x", removable=False, default="1", is_in_clause=False, start=0, end=5)
+        assert not hasattr(t, "__dict__")
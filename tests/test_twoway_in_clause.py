@@ -113,6 +113,28 @@ class TestInClauseMultipleValues:
         assert f"IN ({expected_placeholders})" in result.sql
         assert result.params == ids
 
+    def test_params_not_shared_with_input_list(self) -> None:
+        """結果の params は入力リストとは別オブジェクトになる."""
+        sql = "SELECT * FROM users WHERE id IN /* $ids */(1)"
+        ids = [1, 2, 3]
+        result = TwoWaySQLParser(sql).parse({"ids": ids})
+        result.params.append(4)
+        assert ids == [1, 2, 3]
+
+    def test_same_count_with_different_placeholders(self) -> None:
+        """要素数が同じでもプレースホルダ形式ごとに展開される."""
+        sql = "SELECT * FROM users WHERE id IN /* $ids */(1)"
+        params = {"ids": [1, 2]}
+        assert "IN (?, ?)" in TwoWaySQLParser(sql).parse(params).sql
+        assert "IN (%s, %s)" in TwoWaySQLParser(sql, placeholder="%s").parse(params).sql
+
+    def test_named_lists_with_same_length(self) -> None:
+        """要素数が同じ複数のリストもパラメータ名ごとに展開される."""
+        sql = "SELECT * FROM t WHERE a IN /* $a */(1) AND b IN /* $b */(1)"
+        result = TwoWaySQLParser(sql, placeholder=":name").parse({"a": [1, 2], "b": [3, 4]})
+        assert "a IN (:a_0, :a_1) AND b IN (:b_0, :b_1)" in result.sql
+        assert result.named_params == {"a_0": 1, "a_1": 2, "b_0": 3, "b_1": 4}
+
 
 class TestInClauseSplit:
     """IN句の上限分割テスト."""
@@ -77,6 +77,24 @@ class TestNoParams:
         assert result.sql == "SELECT *\nFROM users\nWHERE 1 = 1"
         assert result.params == []
 
+    def test_static_sql_reused(self) -> None:
+        """パラメータを含まない SQL は2回目以降、初回の整形結果を再利用する."""
+        parser = TwoWaySQLParser("SELECT *\nFROM users\nWHERE\n")
+        first = parser.parse({})
+        second = parser.parse({"unused": 1})
+        assert first.sql == second.sql == "SELECT *\nFROM users"
+        assert second.params == []
+        assert second.named_params == {"unused": 1}
+        assert second.params is not first.params
+
+    def test_static_sql_shared_across_instances(self) -> None:
+        """パラメータを含まない SQL の整形結果は同じ SQL のパーサー間で共有する."""
+        sql = "SELECT *\n  FROM users\nWHERE\nORDER BY id"
+        first = TwoWaySQLParser(sql).parse({})
+        second = TwoWaySQLParser(sql).parse({})
+        assert first.sql == "SELECT *\n  FROM users\nORDER BY id"
+        assert second.sql is first.sql
+
 
 class TestIndentPreservation:
     """インデントが保持されることを検証する."""
@@ -123,3 +141,180 @@ class TestParsedSQLNamedParams:
         parser = TwoWaySQLParser(sql)
         result = parser.parse({})
         assert result.named_params == {}
+
+    def test_no_instance_dict(self) -> None:
+        """__slots__ によりインスタンス辞書を持たない."""
+        result = TwoWaySQLParser("SELECT 1").parse({})
+        assert not hasattr(result, "__dict__")
+
+
+class TestParserReuse:
+    """同じパーサーインスタンスで parse() を繰り返す場合を検証する."""
+
+    def test_parse_results_are_independent(self) -> None:
+        """前回の parse() の削除状態が次の呼び出しに影響しない."""
+        sql = "SELECT * FROM users\nWHERE\n    name = /* $name */'a'\n    AND age = /* $age */1"
+        parser = TwoWaySQLParser(sql)
+        first = parser.parse({"name": None, "age": 20})
+        second = parser.parse({"name": "Alice", "age": None})
+        assert first.sql == "SELECT * FROM users\nWHERE\n    age = ?"
+        assert first.params == [20]
+        assert second.sql == "SELECT * FROM users\nWHERE\n    name = ?"
+        assert second.params == ["Alice"]
+
+    def test_compiled_units_are_reused(self) -> None:
+        """行分割の結果は初回のみ作成され、以降は再利用される."""
+        parser = TwoWaySQLParser("SELECT * FROM users WHERE id = /* id */1")
+        parser.parse({"id": 1})
+        compiled = parser._compiled_units
+        parser.parse({"id": 2})
+        assert parser._compiled_units is compiled
+
+    def test_tree_structure_is_reused(self) -> None:
+        """親子関係は初回に求めた親の位置から設定する."""
+        sql = "SELECT *\nWHERE\n    AND (\n        a = /* $a */1\n    )\n    AND b = /* $b */1"
+        parser = TwoWaySQLParser(sql)
+        assert parser.parse({"a": None, "b": 1}).sql == "SELECT *\nWHERE\n    b = ?"
+        assert parser._parent_indices == (-1, -1, 1, 2, 1, 1)
+        result = parser.parse({"a": 1, "b": None})
+        assert result.sql == "SELECT *\nWHERE\n    (\n        a = ?\n    )"
+
+    def test_compiled_units_shared_across_instances(self) -> None:
+        """同じ SQL 文字列のパーサー間で行分割の結果を共有する."""
+        sql = "SELECT * FROM users WHERE name = /* $name */'a'"
+        first = TwoWaySQLParser(sql)
+        second = TwoWaySQLParser(sql)
+        first.parse({"name": None})
+        second.parse({"name": "Alice"})
+        assert first._compiled_units is second._compiled_units
+
+    def test_tree_structure_shared_across_instances(self) -> None:
+        """同じ SQL 文字列のパーサー間で親の位置を共有する."""
+        sql = "SELECT *\nWHERE\n    AND a = /* $a */1\n    AND b = /* $b */1"
+        first = TwoWaySQLParser(sql)
+        second = TwoWaySQLParser(sql)
+        assert first.parse({"a": None, "b": 1}).sql == "SELECT *\nWHERE\n    b = ?"
+        assert second.parse({"a": 1, "b": None}).sql == "SELECT *\nWHERE\n    a = ?"
+        assert first._parent_indices is second._parent_indices
+
+    def test_tokens_shared_across_instances(self) -> None:
+        """同じ行のトークン化結果をパーサー間で共有する."""
+        line = "SELECT * FROM users WHERE name = /* $name */'a'"
+        first = TwoWaySQLParser(line)
+        second = TwoWaySQLParser(line)
+        assert first.parse({"name": "Alice"}).params == ["Alice"]
+        assert second.parse({"name": "Bob"}).params == ["Bob"]
+        assert first._tokenize(line) is second._tokenize(line)
+
+    def test_clean_sql_result_is_cached(self) -> None:
+        """再構築後の SQL が同じなら整形結果をキャッシュから返す."""
+        from sqlym.parser.twoway import _clean_sql_text
+
+        parser = TwoWaySQLParser("SELECT * FROM users\nWHERE\n    name = /* $name */'a'")
+        first = parser.parse({"name": "Alice"})
+        hits = _clean_sql_text.cache_info().hits
+        second = parser.parse({"name": "Bob"})
+        assert _clean_sql_text.cache_info().hits == hits + 1
+        assert first.sql == second.sql == "SELECT * FROM users\nWHERE\n    name = ?"
+        assert second.params == ["Bob"]
+
+    def test_same_params_reuse_result(self) -> None:
+        """同じパラメータでの再呼び出しはメモ化した結果の複製を返す."""
+        parser = TwoWaySQLParser("SELECT * FROM users WHERE id IN /* ids */(1)")
+        first = parser.parse({"ids": [1, 2]})
+        first.params.append(3)
+        second = parser.parse({"ids": [1, 2]})
+        assert second.sql == "SELECT * FROM users WHERE id IN (?, ?)"
+        assert second.params == [1, 2]
+        assert len(parser._parse_memo) == 1
+
+    def test_memo_distinguishes_value_types(self) -> None:
+        """等しい値でも型が異なればメモ化した結果を共有しない."""
+        parser = TwoWaySQLParser("SELECT * FROM users ORDER BY /* %STR(order) */id")
+        assert parser.parse({"order": 1}).sql == "SELECT * FROM users ORDER BY 1"
+        assert parser.parse({"order": True}).sql == "SELECT * FROM users ORDER BY True"
+
+    def test_unhashable_params_not_memoized(self) -> None:
+        """メモ化できない値を含むパラメータは毎回パースする."""
+        parser = TwoWaySQLParser("SELECT * FROM users WHERE id = /* id */1")
+        assert parser.parse({"id": 1.5}).params == [1.5]
+        assert parser._parse_memo == {}
+
+    def test_long_strings_not_memoized(self) -> None:
+        """長い文字列（リストの要素を含む）はメモ化に保持しない."""
+        parser = TwoWaySQLParser("SELECT * FROM users WHERE name = /* $name */'a'")
+        long_name = "x" * 257
+        assert parser.parse({"name": long_name}).params == [long_name]
+        assert parser.parse({"name": [long_name]}).params == [[long_name]]
+        assert parser._parse_memo == {}
+        assert parser.parse({"name": "x" * 256}).params == ["x" * 256]
+        assert len(parser._parse_memo) == 1
+
+    def test_removal_modifier_detection_is_cached(self) -> None:
+        """修飾子付きパラメータの有無は初回の parse() で判定される."""
+        plain = TwoWaySQLParser("SELECT * FROM users\nWHERE\n    id = /* id */1")
+        assert plain.parse({"id": None}).sql == "SELECT * FROM users\nWHERE\n    id = ?"
+        assert plain._has_removal_tokens is False
+
+        removable = TwoWaySQLParser("SELECT * FROM users\nWHERE\n    id = /* $id */1")
+        assert removable.parse({"id": None}).sql == "SELECT * FROM users"
+        assert removable._has_removal_tokens is True
+
+    def test_block_directive_detection_is_cached(self) -> None:
+        """ブロックディレクティブの有無は初回の parse() で判定される."""
+        plain = TwoWaySQLParser("SELECT * FROM users WHERE id = /* id */1")
+        plain.parse({"id": 1})
+        assert plain._has_block_directives is False
+
+        sql = "SELECT * FROM users\n-- %IF active\nWHERE active = 1\n-- %END"
+        parser = TwoWaySQLParser(sql)
+        assert parser.parse({"active": True}).sql == "SELECT * FROM users\nWHERE active = 1"
+        assert parser._has_block_directives is True
+        assert parser.parse({"active": False}).sql == "SELECT * FROM users"
+
+    def test_line_rendering_is_reused_across_values(self) -> None:
+        """値によらず決まる行の置換結果は再利用され、値だけが差し替わる."""
+        sql = "SELECT * FROM users\nWHERE\n    id = /* id */1\n    OR id = /* id */1"
+        parser = TwoWaySQLParser(sql, placeholder=":name")
+        first = parser.parse({"id": 1})
+        second = parser.parse({"id": [1, 2]})
+        assert first.sql == "SELECT * FROM users\nWHERE\n    id = :id\n    OR id = :id"
+        assert second.sql == first.sql
+        assert second.named_params == {"id": [1, 2]}
+        assert parser._line_plans["id = /* id */1"] == ("id = :id", ("id",))
+
+    def test_value_dependent_line_is_not_planned(self) -> None:
+        """IN 句など値で置換結果が変わる行は都度処理する."""
+        parser = TwoWaySQLParser("SELECT * FROM users WHERE id IN /* ids */(1)")
+        assert parser.parse({"ids": [1, 2]}).sql == "SELECT * FROM users WHERE id IN (?, ?)"
+        assert parser.parse({"ids": [1, 2, 3]}).params == [1, 2, 3]
+        assert parser._line_plans["SELECT * FROM users WHERE id IN /* ids */(1)"] == ()
+
+    def test_fixed_template_collects_values_only(self) -> None:
+        """行削除・値による置換の違いがないテンプレートは整形結果を使い回す."""
+        sql = "SELECT * FROM users\nWHERE\n    name = /* name */'a'\n    AND age > /* age */1"
+        parser = TwoWaySQLParser(sql)
+        assert parser.parse({"name": "x", "age": [1]}).params == ["x", [1]]
+        assert parser._fixed_plan == (
+            "SELECT * FROM users\nWHERE\n    name = ?\n    AND age > ?",
+            ("name", "age"),
+        )
+        result = parser.parse({"name": "y"})
+        assert result.sql == "SELECT * FROM users\nWHERE\n    name = ?\n    AND age > ?"
+        assert result.params == ["y", None]
+
+        named = TwoWaySQLParser(sql, placeholder=":name")
+        result = named.parse({"name": "x", "age": 3})
+        assert result.sql == "SELECT * FROM users\nWHERE\n    name = :name\n    AND age > :age"
+        assert result.named_params == {"name": "x", "age": 3}
+
+    def test_fixed_plan_requires_value_independent_template(self) -> None:
+        """行削除・インライン条件分岐・IN 句を含むテンプレートは毎回処理する."""
+        for sql in (
+            "SELECT * FROM users WHERE name = /* $name */'a'",
+            "SELECT * FROM users WHERE id IN /* ids */(1)",
+            "SELECT * FROM users ORDER BY /*%if desc */ id DESC /*%else */ id /*%end*/",
+        ):
+            parser = TwoWaySQLParser(sql)
+            parser.parse({})
+            assert parser._fixed_plan is None
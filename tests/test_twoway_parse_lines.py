@@ -64,6 +64,16 @@ class TestParseLines:
         assert units[1].is_empty is True
         assert units[1].indent == -1
 
+    def test_lines_with_closed_string_literal(self) -> None:
+        sql = "SELECT 'a'\n\n    FROM users"
+        parser = TwoWaySQLParser(sql)
+        units = parser._parse_lines(parser.original_sql)
+        assert [(u.line_number, u.indent, u.content) for u in units] == [
+            (1, 0, "SELECT 'a'"),
+            (2, -1, ""),
+            (3, 4, "FROM users"),
+        ]
+
     def test_deep_indentation(self) -> None:
         sql = "WHERE\n    AND (\n        OR x = 1\n        OR y = 2\n    )"
         parser = TwoWaySQLParser(sql)
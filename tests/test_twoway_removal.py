@@ -12,7 +12,7 @@ class TestRule4Basic:
         parser = TwoWaySQLParser(sql)
         units = parser._parse_lines(parser.original_sql)
         parser._build_tree(units)
-        parser._evaluate_params(units, {"name": None})
+        assert parser._evaluate_params(units, {"name": None}) is True
         assert units[2].removed is True
 
     def test_removable_param_with_value_keeps_line(self) -> None:
@@ -21,7 +21,7 @@ class TestRule4Basic:
         parser = TwoWaySQLParser(sql)
         units = parser._parse_lines(parser.original_sql)
         parser._build_tree(units)
-        parser._evaluate_params(units, {"name": "Alice"})
+        assert parser._evaluate_params(units, {"name": "Alice"}) is False
         assert units[2].removed is False
 
     def test_non_removable_param_none_keeps_line(self) -> None:
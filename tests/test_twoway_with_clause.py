@@ -1,8 +1,38 @@
 """TwoWaySQLParser の WITH 句（CTE）テスト."""
 
+import pytest
+
 from sqlym.parser.twoway import TwoWaySQLParser
 
 
+@pytest.fixture
+def removal_parser() -> TwoWaySQLParser:
+    """CTE 内に $付き条件を2行持つパーサー（同じ SQL を使うテストで共通）."""
+    return TwoWaySQLParser(
+        """\
+WITH filtered AS (
+    SELECT * FROM users
+    WHERE
+        status = /* $status */'active'
+        AND dept_id = /* $dept_id */1
+)
+SELECT * FROM filtered"""
+    )
+
+
+@pytest.fixture
+def removable_in_parser() -> TwoWaySQLParser:
+    """CTE 内に $付き IN 句を持つパーサー（同じ SQL を使うテストで共通）."""
+    return TwoWaySQLParser(
+        """\
+WITH filtered AS (
+    SELECT * FROM users
+    WHERE dept_id IN /* $dept_ids */(1, 2, 3)
+)
+SELECT * FROM filtered"""
+    )
+
+
 class TestWithClauseBasic:
     """WITH 句の基本的なパラメータ置換."""
 
@@ -38,34 +68,16 @@ WHERE dept_id = /* dept_id */1"""
 class TestWithClauseRemoval:
     """WITH 句内での行削除."""
 
-    def test_with_clause_line_removal(self) -> None:
+    def test_with_clause_line_removal(self, removal_parser: TwoWaySQLParser) -> None:
         """WITH 句内で $param が None なら行削除."""
-        sql = """\
-WITH filtered AS (
-    SELECT * FROM users
-    WHERE
-        status = /* $status */'active'
-        AND dept_id = /* $dept_id */1
-)
-SELECT * FROM filtered"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"status": "enabled", "dept_id": None})
+        result = removal_parser.parse({"status": "enabled", "dept_id": None})
         assert "status = ?" in result.sql
         assert "dept_id" not in result.sql
         assert result.params == ["enabled"]
 
-    def test_with_clause_all_conditions_none(self) -> None:
+    def test_with_clause_all_conditions_none(self, removal_parser: TwoWaySQLParser) -> None:
         """WITH 句内の条件が全て None なら WHERE ごと削除、SELECT は残る."""
-        sql = """\
-WITH filtered AS (
-    SELECT * FROM users
-    WHERE
-        status = /* $status */'active'
-        AND dept_id = /* $dept_id */1
-)
-SELECT * FROM filtered"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"status": None, "dept_id": None})
+        result = removal_parser.parse({"status": None, "dept_id": None})
         # CTE 内の SELECT は保持され、WHERE のみ削除される
         assert "WITH" in result.sql
         assert "SELECT * FROM users" in result.sql
@@ -124,16 +136,9 @@ JOIN departments d ON u.dept_id = d.id"""
 class TestWithClauseInClause:
     """WITH 句内での IN 句展開."""
 
-    def test_with_clause_in_expansion(self) -> None:
+    def test_with_clause_in_expansion(self, removable_in_parser: TwoWaySQLParser) -> None:
         """WITH 句内で IN 句のリストパラメータが展開される."""
-        sql = """\
-WITH filtered AS (
-    SELECT * FROM users
-    WHERE dept_id IN /* $dept_ids */(1, 2, 3)
-)
-SELECT * FROM filtered"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"dept_ids": [10, 20, 30]})
+        result = removable_in_parser.parse({"dept_ids": [10, 20, 30]})
         assert "IN (?, ?, ?)" in result.sql
         assert result.params == [10, 20, 30]
 
@@ -150,16 +155,11 @@ SELECT * FROM filtered"""
         assert "IN (NULL)" in result.sql
         assert result.params == []
 
-    def test_with_clause_in_removable_empty_list(self) -> None:
+    def test_with_clause_in_removable_empty_list(
+        self, removable_in_parser: TwoWaySQLParser
+    ) -> None:
         """WITH 句内で $付き IN 句の空リストは行削除される."""
-        sql = """\
-WITH filtered AS (
-    SELECT * FROM users
-    WHERE dept_id IN /* $dept_ids */(1, 2, 3)
-)
-SELECT * FROM filtered"""
-        parser = TwoWaySQLParser(sql)
-        result = parser.parse({"dept_ids": []})
+        result = removable_in_parser.parse({"dept_ids": []})
         # IN 句の空リストは IN (NULL) に変換（行削除ではない）
         assert "WITH" in result.sql
         assert "SELECT * FROM users" in result.sql